@@ -1,56 +1,73 @@
-from typing import Dict
+from collections.abc import Mapping, MutableMapping
+from typing import Dict, Iterable, Iterator, Optional, Tuple, Union
+
+import numpy as np
+
+from embodiment.anatomy_core import AnatomyCore, PartSpec
 
 
 # ============================================================
-# DEFAULT ANATOMY
+# DEFAULT ANATOMY (declarative part table)
+#
+# Table order is the array layout.
+# priority:   relative growth priority (higher = earlier / faster)
+# maturation: stability lags growth slightly
 # ============================================================
 
-def create_default_anatomy() -> Dict[str, Dict[str, float]]:
+def _part(name: str, priority: float, parent: Optional[str] = None) -> PartSpec:
+    return PartSpec(name=name, priority=priority, maturation=0.6, parent=parent)
+
+
+PART_TABLE: Tuple[PartSpec, ...] = (
+    # Core
+    _part("head", 1.4, "neck"),
+    _part("neck", 1.1, "torso"),
+    _part("spine", 1.3, "torso"),
+    _part("torso", 1.2),
+    _part("pelvis", 1.0, "torso"),
+
+    # Sensory organs
+    _part("eyes", 0.9, "head"),
+    _part("ears", 0.9, "head"),
+    _part("nose", 0.8, "head"),
+    _part("mouth", 0.8, "head"),
+    _part("tongue", 0.7, "mouth"),
+
+    # Upper limbs
+    _part("left_arm", 0.8, "torso"),
+    _part("right_arm", 0.8, "torso"),
+    _part("left_hand", 0.6, "left_arm"),
+    _part("right_hand", 0.6, "right_arm"),
+    _part("left_fingers", 0.4, "left_hand"),
+    _part("right_fingers", 0.4, "right_hand"),
+
+    # Lower limbs
+    _part("left_leg", 0.7, "pelvis"),
+    _part("right_leg", 0.7, "pelvis"),
+    _part("left_foot", 0.6, "left_leg"),
+    _part("right_foot", 0.6, "right_leg"),
+    _part("left_toes", 0.4, "left_foot"),
+    _part("right_toes", 0.4, "right_foot"),
+
+    # Other
+    _part("skin", 0.9),
+    _part("genitalia", 0.3, "pelvis"),
+    _part("umbilical", 1.5, "torso"),
+)
+
+# Fixed part index (order is the array layout)
+PARTS: Tuple[str, ...] = tuple(spec.name for spec in PART_TABLE)
+
+# Parts averaged for the limb growth trace
+LIMB_PARTS: Tuple[str, ...] = ("left_arm", "right_arm", "left_leg", "right_leg")
+
+
+def create_default_anatomy() -> "AnatomyArray":
     """
     Biological anatomy scaffold.
     Growth and stability are in [0, 1].
     """
-    parts = [
-        # Core
-        "head",
-        "neck",
-        "spine",
-        "torso",
-        "pelvis",
-
-        # Sensory organs
-        "eyes",
-        "ears",
-        "nose",
-        "mouth",
-        "tongue",
-
-        # Upper limbs
-        "left_arm",
-        "right_arm",
-        "left_hand",
-        "right_hand",
-        "left_fingers",
-        "right_fingers",
-
-        # Lower limbs
-        "left_leg",
-        "right_leg",
-        "left_foot",
-        "right_foot",
-        "left_toes",
-        "right_toes",
-
-        # Other
-        "skin",
-        "genitalia",
-        "umbilical",
-    ]
-
-    return {
-        p: {"growth": 0.0, "stability": 0.0}
-        for p in parts
-    }
+    return AnatomyArray(PARTS)
 
 
 # ============================================================
@@ -58,38 +75,161 @@ def create_default_anatomy() -> Dict[str, Dict[str, float]]:
 # ============================================================
 
 # Relative growth priority (higher = earlier / faster)
-GROWTH_PRIORITY = {
-    "head": 1.4,
-    "spine": 1.3,
-    "torso": 1.2,
-    "neck": 1.1,
-    "pelvis": 1.0,
-
-    "eyes": 0.9,
-    "ears": 0.9,
-    "nose": 0.8,
-    "mouth": 0.8,
-    "tongue": 0.7,
-
-    "left_arm": 0.8,
-    "right_arm": 0.8,
-    "left_leg": 0.7,
-    "right_leg": 0.7,
-
-    "left_hand": 0.6,
-    "right_hand": 0.6,
-    "left_foot": 0.6,
-    "right_foot": 0.6,
-
-    "left_fingers": 0.4,
-    "right_fingers": 0.4,
-    "left_toes": 0.4,
-    "right_toes": 0.4,
-
-    "skin": 0.9,
-    "genitalia": 0.3,
-    "umbilical": 1.5,
-}
+GROWTH_PRIORITY: Dict[str, float] = {spec.name: spec.priority for spec in PART_TABLE}
+
+_SPECS: Dict[str, PartSpec] = {spec.name: spec for spec in PART_TABLE}
+
+
+# ============================================================
+# ANATOMY ARRAY (dict-like view over an AnatomyCore)
+#
+# - Storage, growth and aggregates live in the core
+# - Body and limb growth kept as running sums (a write applies its
+#   delta; grow() recomputes)
+# - anatomy["eyes"]["growth"] still works (SensoryWall, snapshots)
+# ============================================================
+
+FIELDS: Tuple[str, ...] = ("growth", "stability")
+
+
+class PartView(MutableMapping):
+    """
+    Dict-like window onto one part's row.
+    """
+
+    __slots__ = ("_anatomy", "_i")
+
+    def __init__(self, anatomy: "AnatomyArray", i: int) -> None:
+        self._anatomy = anatomy
+        self._i = i
+
+    def __getitem__(self, key: str) -> float:
+        return float(self._anatomy._field(key)[self._i])
+
+    def __setitem__(self, key: str, value: float) -> None:
+        self._anatomy.core.write(key, self._i, value)
+
+    def __delitem__(self, key: str) -> None:
+        raise TypeError("anatomy fields cannot be removed")
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(FIELDS)
+
+    def __len__(self) -> int:
+        return len(FIELDS)
+
+    def __repr__(self) -> str:
+        return repr(dict(self))
+
+
+class AnatomyArray(Mapping):
+    """
+    Anatomy as parallel arrays over a fixed part index.
+    """
+
+    __slots__ = ("core", "_views")
+
+    def __init__(
+        self,
+        parts: Iterable[str] = PARTS,
+        *,
+        priority: Optional[Dict[str, float]] = None,
+        core: Optional[AnatomyCore] = None,
+    ) -> None:
+        if core is None:
+            table = GROWTH_PRIORITY if priority is None else priority
+            parts = tuple(parts)
+            known = set(parts)
+            # Parents outside a custom part list are dropped
+            core = AnatomyCore(
+                PartSpec(
+                    name=p,
+                    priority=table.get(p, 0.5),
+                    maturation=0.6,
+                    parent=_SPECS[p].parent if p in _SPECS and _SPECS[p].parent in known else None,
+                )
+                for p in parts
+            )
+
+        core.define_group("limbs", LIMB_PARTS)
+        self.core = core
+        self._views = tuple(PartView(self, i) for i in range(len(core)))
+
+    # --------------------------------------------------------
+    # Storage (shared with the core)
+    # --------------------------------------------------------
+
+    @property
+    def parts(self) -> Tuple[str, ...]:
+        return self.core.names
+
+    @property
+    def index(self) -> Dict[str, int]:
+        return self.core.index
+
+    @property
+    def growth(self) -> np.ndarray:
+        return self.core.growth
+
+    @property
+    def stability(self) -> np.ndarray:
+        return self.core.stability
+
+    @property
+    def priority(self) -> np.ndarray:
+        return self.core.priority
+
+    # --------------------------------------------------------
+    # Growth
+    # --------------------------------------------------------
+
+    def grow(self, stability: float) -> None:
+        """
+        One tick of slow, stability-gated growth for every part.
+        Stability lags growth slightly.
+        """
+        self.core.grow(stability)
+
+    # --------------------------------------------------------
+    # Aggregates (O(1) reads)
+    # --------------------------------------------------------
+
+    @property
+    def body_growth(self) -> float:
+        """
+        Mean growth over all parts.
+        """
+        return self.core.body_growth
+
+    @property
+    def limb_growth(self) -> float:
+        """
+        Mean growth over LIMB_PARTS.
+        """
+        return self.core.group_growth("limbs")
+
+    def _field(self, key: str) -> np.ndarray:
+        if key == "growth":
+            return self.core.growth
+        if key == "stability":
+            return self.core.stability
+        raise KeyError(key)
+
+    # --------------------------------------------------------
+    # Dict-like view
+    # --------------------------------------------------------
+
+    def __getitem__(self, part: str) -> PartView:
+        return self._views[self.core.index[part]]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.core.names)
+
+    def __len__(self) -> int:
+        return len(self.core)
+
+    def __contains__(self, part: object) -> bool:
+        return part in self.core.index
 
 
 # ============================================================
@@ -98,7 +238,7 @@ GROWTH_PRIORITY = {
 
 def grow_anatomy(
     *,
-    anatomy: Dict[str, Dict[str, float]],
+    anatomy: Union[AnatomyArray, Dict[str, Dict[str, float]]],
     stability: float,
 ) -> None:
     """
@@ -106,6 +246,10 @@ def grow_anatomy(
     Called ONLY during gestation (pre-birth).
     """
 
+    if isinstance(anatomy, AnatomyArray):
+        anatomy.grow(stability)
+        return
+
     for part, data in anatomy.items():
         priority = GROWTH_PRIORITY.get(part, 0.5)
 
@@ -123,14 +267,42 @@ def grow_anatomy(
         )
 
 
+# ============================================================
+# GROWTH AGGREGATES (READ-ONLY)
+# ============================================================
+
+def body_growth(anatomy: Union[AnatomyArray, Dict[str, Dict[str, float]]]) -> float:
+    """
+    Mean growth over all parts.
+    """
+    if isinstance(anatomy, AnatomyArray):
+        return anatomy.body_growth
+    return sum(r["growth"] for r in anatomy.values()) / len(anatomy) if anatomy else 0.0
+
+
+def limb_growth(anatomy: Union[AnatomyArray, Dict[str, Dict[str, float]]]) -> float:
+    """
+    Mean growth over LIMB_PARTS.
+    """
+    if isinstance(anatomy, AnatomyArray):
+        return anatomy.limb_growth
+    limbs = [anatomy[p]["growth"] for p in LIMB_PARTS if p in anatomy]
+    return sum(limbs) / len(limbs) if limbs else 0.0
+
+
 # ============================================================
 # SNAPSHOT (READ-ONLY)
 # ============================================================
 
-def anatomy_snapshot(anatomy: Dict[str, Dict[str, float]]) -> Dict[str, Dict[str, float]]:
+def anatomy_snapshot(
+    anatomy: Union[AnatomyArray, Dict[str, Dict[str, float]]],
+) -> Dict[str, Dict[str, float]]:
     """
     UI-safe snapshot.
     """
+    if isinstance(anatomy, AnatomyArray):
+        return anatomy.core.snapshot()
+
     return {
         part: {
             "growth": round(data["growth"], 3),
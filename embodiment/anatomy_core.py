@@ -0,0 +1,200 @@
+"""
+Anatomy Core — shared storage for every anatomy API
+
+Doctrine:
+- One declarative part table: name, priority, maturation, parent
+- One memory layout: parallel arrays over a fixed part index
+- Growth is deterministic, monotonic and stability-gated
+- Does NOT learn, couple, activate or decay
+
+embodiment/anatomy.py (dict-like) and embodiment/autonomy.py
+(attribute-style) are thin views over an AnatomyCore.
+"""
+
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+# ============================================================
+# PART TABLE
+# ============================================================
+
+@dataclass(frozen=True, slots=True)
+class PartSpec:
+    """
+    One anatomical part.
+
+    priority:   relative growth speed (higher = earlier / faster)
+    maturation: how closely stability follows growth (per unit growth)
+    parent:     structural parent part, if any
+    """
+    name: str
+    priority: float = 0.5
+    maturation: float = 0.6
+    parent: Optional[str] = None
+    present: bool = True
+
+
+# Growth per tick at full womb stability and priority 1.0
+BASE_GROWTH = 0.002
+
+NO_PARENT = -1
+
+
+# ============================================================
+# CORE
+# ============================================================
+
+class AnatomyCore:
+    """
+    Parallel arrays over a fixed part index.
+    """
+
+    __slots__ = (
+        "specs",
+        "names",
+        "index",
+        "growth",
+        "stability",
+        "priority",
+        "maturation",
+        "parent",
+        "present",
+        "_groups",
+        "_group_sums",
+        "_part_groups",
+        "_growth_sum",
+    )
+
+    def __init__(self, specs: Iterable[PartSpec]) -> None:
+        self.specs: Tuple[PartSpec, ...] = tuple(specs)
+        self.names: Tuple[str, ...] = tuple(s.name for s in self.specs)
+        self.index: Dict[str, int] = {name: i for i, name in enumerate(self.names)}
+        if len(self.index) != len(self.names):
+            raise ValueError("duplicate part names")
+
+        n = len(self.specs)
+        self.growth = np.zeros(n, dtype=np.float64)
+        self.stability = np.zeros(n, dtype=np.float64)
+        self.priority = np.array([s.priority for s in self.specs], dtype=np.float64)
+        self.maturation = np.array([s.maturation for s in self.specs], dtype=np.float64)
+        self.present = np.array([s.present for s in self.specs], dtype=bool)
+        self.parent = np.array(
+            [NO_PARENT if s.parent is None else self.index[s.parent] for s in self.specs],
+            dtype=np.int64,
+        )
+
+        # Running growth sums; single writes apply their delta,
+        # grow() / refresh() recompute from the arrays
+        self._groups: Dict[str, np.ndarray] = {}
+        self._group_sums: Dict[str, float] = {}
+        self._part_groups: Dict[int, List[str]] = {}
+        self._growth_sum = 0.0
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    # --------------------------------------------------------
+    # Growth
+    # --------------------------------------------------------
+
+    def grow(self, stability: float) -> None:
+        """
+        One gestational tick for every present part:
+
+            delta      = BASE_GROWTH * stability * priority
+            growth    += delta
+            stability += delta * maturation     (both capped at 1)
+        """
+        delta = BASE_GROWTH * stability * self.priority
+        if not self.present.all():
+            delta = np.where(self.present, delta, 0.0)
+        np.minimum(1.0, self.growth + delta, out=self.growth)
+        np.minimum(1.0, self.stability + delta * self.maturation, out=self.stability)
+        self.refresh()
+
+    def mature(self, i: int, amount: float) -> None:
+        """
+        Grow a single part by `amount` (present parts only).
+        """
+        if not self.present[i]:
+            return
+        self.write("growth", i, min(1.0, self.growth[i] + amount))
+        self.write("stability", i, min(1.0, self.stability[i] + amount * self.maturation[i]))
+
+    def write(self, field: str, i: int, value: float) -> None:
+        """
+        Set one part's growth or stability; aggregates take the delta.
+        """
+        if field == "stability":
+            self.stability[i] = value
+            return
+        if field != "growth":
+            raise KeyError(field)
+
+        value = float(value)
+        delta = value - self.growth[i]
+        self.growth[i] = value
+        self._growth_sum += delta
+        for name in self._part_groups.get(i, ()):
+            self._group_sums[name] += delta
+
+    # --------------------------------------------------------
+    # Aggregates (running sums; O(1) reads)
+    # --------------------------------------------------------
+
+    def define_group(self, name: str, parts: Sequence[str]) -> None:
+        if name in self._groups:
+            for i in self._groups[name].tolist():
+                self._part_groups[i].remove(name)
+        idx = np.array([self.index[p] for p in parts if p in self.index], dtype=np.int64)
+        self._groups[name] = idx
+        for i in idx.tolist():
+            self._part_groups.setdefault(i, []).append(name)
+        self._group_sums[name] = float(self.growth[idx].sum())
+
+    @property
+    def body_growth(self) -> float:
+        n = self.growth.shape[0]
+        return self._growth_sum / n if n else 0.0
+
+    def group_growth(self, name: str) -> float:
+        size = self._groups[name].shape[0]
+        return self._group_sums[name] / size if size else 0.0
+
+    def refresh(self) -> None:
+        """
+        Recompute the sums; call after writing the arrays directly.
+        """
+        self._growth_sum = float(self.growth.sum())
+        for name, idx in self._groups.items():
+            self._group_sums[name] = float(self.growth[idx].sum())
+
+    # --------------------------------------------------------
+    # Structure
+    # --------------------------------------------------------
+
+    def children(self, name: str) -> Tuple[str, ...]:
+        i = self.index[name]
+        return tuple(self.names[j] for j in np.flatnonzero(self.parent == i).tolist())
+
+    # --------------------------------------------------------
+    # Snapshot (UI only)
+    # --------------------------------------------------------
+
+    def snapshot(self, *, present: bool = False) -> Dict[str, Dict[str, float]]:
+        growth = np.round(self.growth, 3).tolist()
+        stability = np.round(self.stability, 3).tolist()
+        if not present:
+            return {
+                name: {"growth": g, "stability": s}
+                for name, g, s in zip(self.names, growth, stability)
+            }
+        flags = self.present.tolist()
+        return {
+            name: {"present": p, "growth": g, "stability": s}
+            for name, p, g, s in zip(self.names, flags, growth, stability)
+        }
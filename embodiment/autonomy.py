@@ -19,43 +19,120 @@ It is anatomy.
 """
 
 from __future__ import annotations
-from dataclasses import dataclass
-from typing import Dict
+from typing import Dict, Optional, Tuple
+
+from embodiment.anatomy_core import AnatomyCore, PartSpec
+
+
+# ============================================================
+# PART TABLE (gestational schedule)
+#
+# Table order is the array layout and the snapshot order.
+# priority:   multiple of the base growth step (core develops first)
+# maturation: structural integrity gained per unit of growth
+# ============================================================
+
+def _region(name: str, rate: float, parent: Optional[str] = None) -> PartSpec:
+    return PartSpec(name=name, priority=rate, maturation=0.8, parent=parent)
+
+
+REGION_TABLE: Tuple[PartSpec, ...] = (
+    # Core body
+    _region("head", 1.5, "neck"),
+    _region("neck", 1.2, "torso"),
+    _region("spine", 1.4, "torso"),
+    _region("torso", 1.4),
+    _region("pelvis", 1.3, "torso"),
+
+    # Face & head organs
+    _region("eyes", 1.0, "head"),
+    _region("ears", 1.0, "head"),
+    _region("nose", 0.9, "head"),
+    _region("mouth", 1.1, "head"),
+    _region("tongue", 0.9, "mouth"),
+
+    # Upper limbs
+    _region("left_arm", 1.1, "torso"),
+    _region("right_arm", 1.1, "torso"),
+    _region("left_hand", 1.0, "left_arm"),
+    _region("right_hand", 1.0, "right_arm"),
+    _region("fingers", 0.9),
+
+    # Lower limbs
+    _region("left_leg", 1.0, "pelvis"),
+    _region("right_leg", 1.0, "pelvis"),
+    _region("left_foot", 0.9, "left_leg"),
+    _region("right_foot", 0.9, "right_leg"),
+    _region("toes", 0.8),
+
+    # Other biological
+    _region("genitalia", 0.7, "pelvis"),
+    _region("umbilical", 1.6, "torso"),
+)
+
+REGIONS: Tuple[str, ...] = tuple(spec.name for spec in REGION_TABLE)
 
 
 # ============================================================
 # BASIC REGION
 # ============================================================
 
-@dataclass
 class AnatomyRegion:
     """
-    Passive anatomical region.
+    Passive anatomical region (view onto one row of the core).
 
     growth:   developmental completion [0.0 → 1.0]
     stability: structural integrity [0.0 → 1.0]
     present:  whether the region exists at all
     """
-    present: bool = True
-    growth: float = 0.0
-    stability: float = 0.0
+
+    __slots__ = ("_core", "_i")
+
+    def __init__(self, core: AnatomyCore, i: int) -> None:
+        self._core = core
+        self._i = i
+
+    @property
+    def present(self) -> bool:
+        return bool(self._core.present[self._i])
+
+    @present.setter
+    def present(self, value: bool) -> None:
+        self._core.present[self._i] = value
+
+    @property
+    def growth(self) -> float:
+        return float(self._core.growth[self._i])
+
+    @growth.setter
+    def growth(self, value: float) -> None:
+        self._core.write("growth", self._i, value)
+
+    @property
+    def stability(self) -> float:
+        return float(self._core.stability[self._i])
+
+    @stability.setter
+    def stability(self, value: float) -> None:
+        self._core.write("stability", self._i, value)
 
     def mature(self, amount: float) -> None:
         """
         Deterministic, monotonic growth.
         """
-        if not self.present:
-            return
+        self._core.mature(self._i, amount)
 
-        self.growth = min(1.0, self.growth + amount)
-        self.stability = min(1.0, self.stability + amount * 0.8)
+    def __repr__(self) -> str:
+        return (
+            f"AnatomyRegion(present={self.present}, "
+            f"growth={self.growth}, stability={self.stability})"
+        )
 
 
 # ============================================================
 # FULL ANATOMY
 # ============================================================
 
-@dataclass
 class Anatomy:
     """
     Complete neonatal anatomical structure.
@@ -63,49 +140,29 @@ class Anatomy:
     Exists BEFORE movement.
     Exists BEFORE sensation.
     Exists BEFORE ownership.
+
+    Regions are attributes (anatomy.head, anatomy.fingers, ...);
+    storage is one AnatomyCore built from REGION_TABLE.
     """
 
-    # --------------------
-    # Core body
-    # --------------------
-    head: AnatomyRegion
-    neck: AnatomyRegion
-    spine: AnatomyRegion
-    torso: AnatomyRegion
-    pelvis: AnatomyRegion
-
-    # --------------------
-    # Face & head organs
-    # --------------------
-    eyes: AnatomyRegion
-    ears: AnatomyRegion
-    nose: AnatomyRegion
-    mouth: AnatomyRegion
-    tongue: AnatomyRegion
-
-    # --------------------
-    # Upper limbs
-    # --------------------
-    left_arm: AnatomyRegion
-    right_arm: AnatomyRegion
-    left_hand: AnatomyRegion
-    right_hand: AnatomyRegion
-    fingers: AnatomyRegion
-
-    # --------------------
-    # Lower limbs
-    # --------------------
-    left_leg: AnatomyRegion
-    right_leg: AnatomyRegion
-    left_foot: AnatomyRegion
-    right_foot: AnatomyRegion
-    toes: AnatomyRegion
-
-    # --------------------
-    # Other biological
-    # --------------------
-    genitalia: AnatomyRegion
-    umbilical: AnatomyRegion
+    __slots__ = ("core", "_regions")
+
+    def __init__(self, core: Optional[AnatomyCore] = None) -> None:
+        self.core = AnatomyCore(REGION_TABLE) if core is None else core
+        self._regions: Dict[str, AnatomyRegion] = {
+            name: AnatomyRegion(self.core, i) for i, name in enumerate(self.core.names)
+        }
+
+    def __getattr__(self, name: str) -> AnatomyRegion:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        try:
+            return self._regions[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def regions(self) -> Dict[str, AnatomyRegion]:
+        return dict(self._regions)
 
     # ========================================================
     # GESTATIONAL GROWTH
@@ -117,39 +174,7 @@ class Anatomy:
 
         stability is womb rhythmic stability [0.0 → 1.0]
         """
-
-        base = 0.002 * stability
-
-        # Core develops first
-        self.head.mature(base * 1.5)
-        self.spine.mature(base * 1.4)
-        self.torso.mature(base * 1.4)
-        self.pelvis.mature(base * 1.3)
-        self.neck.mature(base * 1.2)
-
-        # Face
-        self.eyes.mature(base * 1.0)
-        self.ears.mature(base * 1.0)
-        self.nose.mature(base * 0.9)
-        self.mouth.mature(base * 1.1)
-        self.tongue.mature(base * 0.9)
-
-        # Limbs
-        self.left_arm.mature(base * 1.1)
-        self.right_arm.mature(base * 1.1)
-        self.left_hand.mature(base * 1.0)
-        self.right_hand.mature(base * 1.0)
-        self.fingers.mature(base * 0.9)
-
-        self.left_leg.mature(base * 1.0)
-        self.right_leg.mature(base * 1.0)
-        self.left_foot.mature(base * 0.9)
-        self.right_foot.mature(base * 0.9)
-        self.toes.mature(base * 0.8)
-
-        # Other
-        self.genitalia.mature(base * 0.7)
-        self.umbilical.mature(base * 1.6)
+        self.core.grow(stability)
 
 
 # ============================================================
@@ -161,42 +186,7 @@ def create_default_anatomy() -> Anatomy:
     Create a baseline fetal anatomy.
     All regions exist but are immature.
     """
-    def r() -> AnatomyRegion:
-        return AnatomyRegion(present=True, growth=0.0, stability=0.0)
-
-    return Anatomy(
-        # Core
-        head=r(),
-        neck=r(),
-        spine=r(),
-        torso=r(),
-        pelvis=r(),
-
-        # Face
-        eyes=r(),
-        ears=r(),
-        nose=r(),
-        mouth=r(),
-        tongue=r(),
-
-        # Upper limbs
-        left_arm=r(),
-        right_arm=r(),
-        left_hand=r(),
-        right_hand=r(),
-        fingers=r(),
-
-        # Lower limbs
-        left_leg=r(),
-        right_leg=r(),
-        left_foot=r(),
-        right_foot=r(),
-        toes=r(),
-
-        # Other
-        genitalia=r(),
-        umbilical=r(),
-    )
+    return Anatomy()
 
 
 # ============================================================
@@ -207,11 +197,4 @@ def anatomy_snapshot(anatomy: Anatomy) -> Dict[str, Dict[str, float]]:
     """
     Observer-safe snapshot for dashboards.
     """
-    snap = {}
-    for name, region in anatomy.__dict__.items():
-        snap[name] = {
-            "present": region.present,
-            "growth": round(region.growth, 3),
-            "stability": round(region.stability, 3),
-        }
-    return snap
\ No newline at end of file
+    return anatomy.core.snapshot(present=True)
@@ -17,9 +17,9 @@ def summarize_embodiment(ledger: EmbodimentLedger) -> Dict[str, float]:
     - does NOT modify the ledger
     """
 
-    entries = ledger.all_latest()
+    total = ledger.latest_count()
 
-    if not entries:
+    if not total:
         return {
             "embodied_count": 0,
             "avg_confidence": 0.0,
@@ -29,31 +29,14 @@ def summarize_embodiment(ledger: EmbodimentLedger) -> Dict[str, float]:
             "ownership_count": 0,
         }
 
-    confidence_sum = 0.0
-    stability_sum = 0.0
-
-    counts = {
-        "boundary": 0,
-        "pain": 0,
-        "ownership": 0,
-        "thermal": 0,
-        "skill": 0,
-    }
-
-    for e in entries:
-        confidence_sum += e.confidence
-        stability_sum += e.stability
-        counts[e.kind] = counts.get(e.kind, 0) + 1
-
-    total = len(entries)
-
+    # Running aggregates maintained by the ledger on add()
     return {
         "embodied_count": total,
-        "avg_confidence": confidence_sum / total,
-        "avg_stability": stability_sum / total,
-        "boundary_count": counts.get("boundary", 0),
-        "pain_count": counts.get("pain", 0),
-        "ownership_count": counts.get("ownership", 0),
-        "thermal_count": counts.get("thermal", 0),
-        "skill_count": counts.get("skill", 0),
-    }
\ No newline at end of file
+        "avg_confidence": ledger.confidence_sum() / total,
+        "avg_stability": ledger.stability_sum() / total,
+        "boundary_count": ledger.kind_count("boundary"),
+        "pain_count": ledger.kind_count("pain"),
+        "ownership_count": ledger.kind_count("ownership"),
+        "thermal_count": ledger.kind_count("thermal"),
+        "skill_count": ledger.kind_count("skill"),
+    }
@@ -6,7 +6,7 @@ from dataclasses import dataclass
 from typing import Optional
 
 from embodiment.ledger.entry import LedgerEntry
-from embodiment.ledger.ledger import EmbodimentLedger
+from embodiment.ledger.ledger import EmbodimentLedger, ledger_key
 
 
 # ============================================================
@@ -60,7 +60,7 @@ class ConsolidationGate:
         Decide whether a candidate invariant may be consolidated.
         """
 
-        key = ledger._key(candidate)
+        key = ledger_key(candidate)
         current = ledger.latest(key)
 
         # ----------------------------
@@ -0,0 +1,171 @@
+# embodiment/consolidation/pipeline.py
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+import numpy as np
+
+from embodiment.ledger.entry import LedgerEntry
+from embodiment.ledger.ledger import EmbodimentLedger, LedgerKey, ledger_key
+from embodiment.local.candidates import EmbodimentCandidate
+from embodiment.local.consolidation import ConsolidationGate as CandidateGate
+
+
+# ============================================================
+# Consolidation Pipeline (batched)
+#
+# Streams EmbodimentCandidates through the candidate gate rules
+# (embodiment/local/consolidation.py) in batches:
+# - thresholds evaluated as masks over the whole batch
+# - candidates grouped by ledger key, existing entry fetched once
+#   per key through the ledger index
+# - bounded revisions applied in arrival order per key
+# - accepted entries committed with one ledger.add_many call
+#
+# Still the only writer: nothing is written that the gate rules
+# would not write one candidate at a time.
+# ============================================================
+
+@dataclass
+class PipelineReport:
+    """
+    Throughput and outcome counts (one run, or running totals).
+    """
+    submitted: int = 0
+    created: int = 0
+    revised: int = 0
+    rejected: Dict[str, int] = field(default_factory=dict)
+    seconds: float = 0.0
+
+    @property
+    def accepted(self) -> int:
+        return self.created + self.revised
+
+    @property
+    def throughput(self) -> float:
+        """
+        Candidates per second.
+        """
+        return self.submitted / self.seconds if self.seconds > 0.0 else 0.0
+
+    def merge(self, other: "PipelineReport") -> None:
+        self.submitted += other.submitted
+        self.created += other.created
+        self.revised += other.revised
+        for reason, n in other.rejected.items():
+            self.rejected[reason] = self.rejected.get(reason, 0) + n
+        self.seconds += other.seconds
+
+
+class ConsolidationPipeline:
+    """
+    Batched consolidation of embodiment candidates into a ledger.
+    """
+
+    REJECT_REASONS = (
+        "insufficient_support",
+        "insufficient_stability",
+        "insufficient_confidence",
+    )
+
+    def __init__(
+        self,
+        ledger: EmbodimentLedger,
+        *,
+        batch_size: int = 1024,
+    ) -> None:
+        self.ledger = ledger
+        self.batch_size = max(1, int(batch_size))
+        self.rules = CandidateGate
+        self.totals = PipelineReport()
+
+    # ----------------------------
+    # Public API
+    # ----------------------------
+
+    def run(self, candidates: Iterable[EmbodimentCandidate]) -> PipelineReport:
+        """
+        Consume a candidate stream batch by batch.
+        """
+        report = PipelineReport()
+        it = iter(candidates)
+        while True:
+            batch = list(islice(it, self.batch_size))
+            if not batch:
+                return report
+            report.merge(self.process_batch(batch))
+
+    def process_batch(self, batch: Sequence[EmbodimentCandidate]) -> PipelineReport:
+        t0 = time.perf_counter()
+        report = PipelineReport(submitted=len(batch))
+        if not batch:
+            return report
+
+        rules = self.rules
+        n = len(batch)
+        support = np.fromiter((c.support for c in batch), dtype=np.int64, count=n)
+        stability = np.fromiter((c.stability for c in batch), dtype=np.float64, count=n)
+        confidence = np.fromiter((c.confidence_hint for c in batch), dtype=np.float64, count=n)
+
+        # First failing threshold wins, in gate order (0 = passes)
+        code = np.select(
+            [
+                support < rules.MIN_SUPPORT,
+                stability < rules.MIN_STABILITY,
+                confidence < rules.MIN_CONFIDENCE,
+            ],
+            [1, 2, 3],
+            default=0,
+        )
+        counts = np.bincount(code, minlength=4)
+        for i, reason in enumerate(self.REJECT_REASONS, start=1):
+            if counts[i]:
+                report.rejected[reason] = int(counts[i])
+
+        # Group survivors by ledger key, arrival order kept
+        groups: Dict[LedgerKey, List[int]] = {}
+        for i in np.flatnonzero(code == 0).tolist():
+            groups.setdefault(ledger_key(batch[i]), []).append(i)
+
+        # (arrival index, entry): history keeps arrival order
+        writes: List[Tuple[int, LedgerEntry]] = []
+        for key, idx in groups.items():
+            current = self.ledger.latest(key)
+            for i in idx:
+                if current is None:
+                    current = LedgerEntry(
+                        kind=key[0],
+                        regions=key[1],
+                        conditions=key[2],
+                        support=int(support[i]),
+                        stability=float(stability[i]),
+                        confidence=float(confidence[i]),
+                        version=1,
+                    )
+                    report.created += 1
+                else:
+                    current = current.revise(
+                        added_support=int(support[i]),
+                        stability_delta=rules.bounded_delta(
+                            float(stability[i]) - current.stability,
+                            rules.MAX_STABILITY_STEP,
+                        ),
+                        confidence_delta=rules.bounded_delta(
+                            float(confidence[i]) - current.confidence,
+                            rules.MAX_CONFIDENCE_STEP,
+                        ),
+                    )
+                    report.revised += 1
+                writes.append((i, current))
+
+        if writes:
+            writes.sort(key=lambda w: w[0])
+            self.ledger.add_many(entry for _, entry in writes)
+
+        report.seconds = time.perf_counter() - t0
+        self.totals.merge(report)
+        return report
@@ -1,4 +1,5 @@
-from .ledger import EmbodimentLedger
+from .ledger import EmbodimentLedger, ledger_key
 from .entry import LedgerEntry
 from .invariants import EmbodimentKind
-from .summary import EmbodimentSummary
\ No newline at end of file
+from .summary import EmbodimentSummary
+from .sqlite_ledger import SQLiteEmbodimentLedger
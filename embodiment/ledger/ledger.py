@@ -1,23 +1,95 @@
 from __future__ import annotations
-from typing import Iterable, List, Dict, Tuple
+from collections import Counter
+from typing import Iterable, List, Dict, Optional, Tuple, FrozenSet
 
 from .entry import LedgerEntry
 
 
+# (kind, regions, conditions)
+LedgerKey = Tuple[str, FrozenSet[str], Tuple[str, ...]]
+
+
+def ledger_key(item) -> LedgerKey:
+    """
+    Identity of an invariant (LedgerEntry or EmbodimentCandidate):
+    kind, region set, and conditions in their stored order.
+    """
+    return (item.kind, frozenset(item.regions), tuple(item.conditions))
+
+
 class EmbodimentLedger:
     """
     Append-only ledger of embodied invariants.
+
+    History is never rewritten. Indexes maintained on add():
+    - latest version per (kind, regions, conditions) key
+    - version chain per key (append order)
+    - keys by kind, keys by region
+    - running aggregates over the latest versions (count, confidence
+      and stability sums, per-kind counts and region sets); a
+      revision subtracts the version it replaces
     """
 
     def __init__(self) -> None:
         self._entries: List[LedgerEntry] = []
 
+        self._latest: Dict[LedgerKey, LedgerEntry] = {}
+        self._versions: Dict[LedgerKey, List[LedgerEntry]] = {}
+        # Ordered key sets (dict keys, first-seen order)
+        self._by_kind: Dict[str, Dict[LedgerKey, None]] = {}
+        self._by_region: Dict[str, Dict[LedgerKey, None]] = {}
+
+        self._latest_view: Optional[Tuple[LedgerEntry, ...]] = None
+
+        # Aggregates over _latest
+        self._confidence_sum = 0.0
+        self._stability_sum = 0.0
+        self._kind_counts: Counter = Counter()
+        self._kind_region_counts: Dict[str, Counter] = {}
+        self._kind_regions: Dict[str, FrozenSet[str]] = {}
+
     def entries(self) -> Iterable[LedgerEntry]:
         return tuple(self._entries)
 
     def add(self, entry: LedgerEntry) -> None:
         self._entries.append(entry)
 
+        key = ledger_key(entry)
+        chain = self._versions.get(key)
+        if chain is None:
+            self._versions[key] = [entry]
+            self._by_kind.setdefault(entry.kind, {})[key] = None
+            for r in entry.regions:
+                self._by_region.setdefault(r, {})[key] = None
+        else:
+            chain.append(entry)
+
+        current = self._latest.get(key)
+        if current is None or entry.version > current.version:
+            self._latest[key] = entry
+            self._latest_view = None
+            self._account(current, entry)
+
+    def _account(self, old: Optional[LedgerEntry], new: LedgerEntry) -> None:
+        if old is not None:
+            self._confidence_sum -= old.confidence
+            self._stability_sum -= old.stability
+        self._confidence_sum += new.confidence
+        self._stability_sum += new.stability
+
+        if old is None:
+            # New key; a revision keeps kind and regions
+            self._kind_counts[new.kind] += 1
+            regions = self._kind_region_counts.setdefault(new.kind, Counter())
+            fresh = not regions.keys() >= new.regions
+            regions.update(new.regions)
+            if fresh:
+                self._kind_regions.pop(new.kind, None)
+
+    def add_many(self, entries: Iterable[LedgerEntry]) -> None:
+        for entry in entries:
+            self.add(entry)
+
     def count(self) -> int:
         return len(self._entries)
 
@@ -25,18 +97,61 @@ class EmbodimentLedger:
     # REQUIRED FOR CONSOLIDATION & SUMMARY
     # --------------------------------------------
 
-    def _key(self, entry: LedgerEntry) -> Tuple:
-        return (entry.kind, entry.regions, entry.conditions)
-
     def all_latest(self) -> Iterable[LedgerEntry]:
         """
         Return only the latest version of each invariant.
         """
-        latest: Dict[Tuple, LedgerEntry] = {}
+        if self._latest_view is None:
+            self._latest_view = tuple(self._latest.values())
+        return self._latest_view
+
+    # --------------------------------------------
+    # INDEXED QUERIES
+    # --------------------------------------------
 
-        for e in self._entries:
-            key = self._key(e)
-            if key not in latest or e.version > latest[key].version:
-                latest[key] = e
+    def latest(self, key: LedgerKey) -> Optional[LedgerEntry]:
+        return self._latest.get(key)
 
-        return tuple(latest.values())
\ No newline at end of file
+    def versions(self, key: LedgerKey) -> Tuple[LedgerEntry, ...]:
+        """
+        Every version of one invariant, in append order.
+        """
+        return tuple(self._versions.get(key, ()))
+
+    def by_kind(self, kind: str) -> Tuple[LedgerEntry, ...]:
+        """
+        Latest version of each invariant of `kind`.
+        """
+        return tuple(self._latest[k] for k in self._by_kind.get(kind, ()))
+
+    def by_region(self, region: str) -> Tuple[LedgerEntry, ...]:
+        """
+        Latest version of each invariant touching `region`.
+        """
+        return tuple(self._latest[k] for k in self._by_region.get(region, ()))
+
+    # --------------------------------------------
+    # AGGREGATES (O(1) reads)
+    # --------------------------------------------
+
+    def latest_count(self) -> int:
+        return len(self._latest)
+
+    def confidence_sum(self) -> float:
+        return self._confidence_sum
+
+    def stability_sum(self) -> float:
+        return self._stability_sum
+
+    def kind_count(self, kind: str) -> int:
+        return self._kind_counts.get(kind, 0)
+
+    def kind_regions(self, kind: str) -> FrozenSet[str]:
+        """
+        Union of regions over the latest invariants of `kind`.
+        """
+        cached = self._kind_regions.get(kind)
+        if cached is None:
+            cached = frozenset(self._kind_region_counts.get(kind, ()))
+            self._kind_regions[kind] = cached
+        return cached
@@ -0,0 +1,365 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, Tuple, FrozenSet, Union
+
+from .entry import LedgerEntry
+from .ledger import LedgerKey, ledger_key
+
+
+# ============================================================
+# SQLite Embodiment Ledger (persistent backend)
+#
+# Same interface as EmbodimentLedger, backed by one SQLite file:
+# - WAL journal: readers never block the writer
+# - add() commits immediately by default (batch_size=1);
+#   add_many() and larger batch sizes write one transaction per
+#   batch (pending entries are also written before any read)
+# - latest version per key kept in its own table (upsert on write)
+# - summary tables (entry and latest counts, confidence / stability
+#   sums, per-kind counts and regions) maintained by triggers, in
+#   the same transaction as the append
+# - entries() streams from a cursor; history is never loaded whole
+#
+# Append-only. Rows are never updated or deleted in `entries`.
+# ============================================================
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    seq         INTEGER PRIMARY KEY,
+    kind        TEXT    NOT NULL,
+    regions     TEXT    NOT NULL,
+    conditions  TEXT    NOT NULL,
+    support     INTEGER NOT NULL,
+    stability   REAL    NOT NULL,
+    confidence  REAL    NOT NULL,
+    version     INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_key
+    ON entries (kind, regions, conditions, version);
+
+CREATE TABLE IF NOT EXISTS latest (
+    kind        TEXT    NOT NULL,
+    regions     TEXT    NOT NULL,
+    conditions  TEXT    NOT NULL,
+    first_seq   INTEGER NOT NULL,
+    seq         INTEGER NOT NULL,
+    version     INTEGER NOT NULL,
+    PRIMARY KEY (kind, regions, conditions)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS latest_kind ON latest (kind, first_seq);
+
+CREATE TABLE IF NOT EXISTS key_regions (
+    region      TEXT    NOT NULL,
+    kind        TEXT    NOT NULL,
+    regions     TEXT    NOT NULL,
+    conditions  TEXT    NOT NULL,
+    PRIMARY KEY (region, kind, regions, conditions)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS key_regions_kind ON key_regions (kind, region);
+
+CREATE TABLE IF NOT EXISTS summary (
+    id              INTEGER PRIMARY KEY CHECK (id = 0),
+    entry_count     INTEGER NOT NULL,
+    latest_count    INTEGER NOT NULL,
+    confidence_sum  REAL    NOT NULL,
+    stability_sum   REAL    NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS kind_summary (
+    kind        TEXT    PRIMARY KEY,
+    count       INTEGER NOT NULL
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS kind_regions (
+    kind        TEXT    NOT NULL,
+    region      TEXT    NOT NULL,
+    PRIMARY KEY (kind, region)
+) WITHOUT ROWID;
+
+CREATE TRIGGER IF NOT EXISTS entry_added AFTER INSERT ON entries
+BEGIN
+    UPDATE summary SET entry_count = entry_count + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS latest_added AFTER INSERT ON latest
+BEGIN
+    UPDATE summary SET
+        latest_count = latest_count + 1,
+        confidence_sum = confidence_sum
+            + (SELECT confidence FROM entries WHERE seq = NEW.seq),
+        stability_sum = stability_sum
+            + (SELECT stability FROM entries WHERE seq = NEW.seq);
+    INSERT INTO kind_summary (kind, count) VALUES (NEW.kind, 1)
+    ON CONFLICT (kind) DO UPDATE SET count = count + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS latest_revised AFTER UPDATE OF seq ON latest
+BEGIN
+    UPDATE summary SET
+        confidence_sum = confidence_sum
+            + (SELECT confidence FROM entries WHERE seq = NEW.seq)
+            - (SELECT confidence FROM entries WHERE seq = OLD.seq),
+        stability_sum = stability_sum
+            + (SELECT stability FROM entries WHERE seq = NEW.seq)
+            - (SELECT stability FROM entries WHERE seq = OLD.seq);
+END;
+
+CREATE TRIGGER IF NOT EXISTS key_region_added AFTER INSERT ON key_regions
+BEGIN
+    INSERT OR IGNORE INTO kind_regions VALUES (NEW.kind, NEW.region);
+END;
+"""
+
+# Files written before the summary tables existed are backfilled once
+_BACKFILL = """
+INSERT INTO summary
+SELECT 0, (SELECT COUNT(*) FROM entries), COUNT(*),
+       TOTAL(e.confidence), TOTAL(e.stability)
+FROM latest l JOIN entries e ON e.seq = l.seq;
+INSERT OR IGNORE INTO kind_summary
+SELECT kind, COUNT(*) FROM latest GROUP BY kind;
+INSERT OR IGNORE INTO kind_regions
+SELECT DISTINCT kind, region FROM key_regions;
+"""
+
+_COLUMNS = "e.kind, e.regions, e.conditions, e.support, e.stability, e.confidence, e.version"
+
+_LATEST = f"""
+SELECT {_COLUMNS}
+FROM latest l JOIN entries e ON e.seq = l.seq
+"""
+
+# Strictly newer versions replace; the first of equal versions stays
+_UPSERT_LATEST = """
+INSERT INTO latest (kind, regions, conditions, first_seq, seq, version)
+VALUES (?, ?, ?, ?, ?, ?)
+ON CONFLICT (kind, regions, conditions) DO UPDATE
+SET seq = excluded.seq, version = excluded.version
+WHERE excluded.version > latest.version
+"""
+
+Row = Tuple[str, str, str, int, float, float, int]
+
+
+def _encode_key(key: LedgerKey) -> Tuple[str, str, str]:
+    kind, regions, conditions = key
+    return kind, json.dumps(sorted(regions)), json.dumps(list(conditions))
+
+
+def _decode(row: Row) -> LedgerEntry:
+    kind, regions, conditions, support, stability, confidence, version = row
+    return LedgerEntry(
+        kind=kind,
+        regions=frozenset(json.loads(regions)),
+        conditions=tuple(json.loads(conditions)),
+        support=support,
+        stability=stability,
+        confidence=confidence,
+        version=version,
+    )
+
+
+class SQLiteEmbodimentLedger:
+    """
+    Persistent append-only ledger of embodied invariants.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        *,
+        batch_size: int = 1,
+        fetch_size: int = 512,
+    ) -> None:
+        self.path = str(path)
+        self.batch_size = max(1, int(batch_size))
+        self.fetch_size = max(1, int(fetch_size))
+
+        self._conn = sqlite3.connect(self.path)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        if self._scalar("SELECT COUNT(*) FROM summary") == 0:
+            self._conn.executescript("BEGIN;" + _BACKFILL + "COMMIT;")
+
+        row = self._conn.execute("SELECT COALESCE(MAX(seq), 0) FROM entries").fetchone()
+        self._next_seq = int(row[0]) + 1
+        self._pending: List[LedgerEntry] = []
+
+    # --------------------------------------------
+    # Lifecycle
+    # --------------------------------------------
+
+    def flush(self) -> None:
+        """
+        Write pending entries in one transaction.
+        """
+        if not self._pending:
+            return
+
+        rows, latest, key_regions = [], [], []
+        for entry in self._pending:
+            seq = self._next_seq
+            self._next_seq += 1
+            kind, regions, conditions = _encode_key(ledger_key(entry))
+            rows.append((
+                seq, kind, regions, conditions,
+                entry.support, entry.stability, entry.confidence, entry.version,
+            ))
+            latest.append((kind, regions, conditions, seq, seq, entry.version))
+            key_regions.extend((r, kind, regions, conditions) for r in entry.regions)
+
+        with self._conn:
+            self._conn.executemany(
+                "INSERT INTO entries VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows
+            )
+            self._conn.executemany(_UPSERT_LATEST, latest)
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO key_regions VALUES (?, ?, ?, ?)", key_regions
+            )
+        self._pending.clear()
+
+    def close(self) -> None:
+        self.flush()
+        self._conn.close()
+
+    def __enter__(self) -> "SQLiteEmbodimentLedger":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        # Entries already accepted are written even if the block raised
+        self.close()
+
+    # --------------------------------------------
+    # EmbodimentLedger interface
+    # --------------------------------------------
+
+    def entries(self) -> Iterator[LedgerEntry]:
+        """
+        Full history in append order, streamed from a cursor.
+        """
+        self.flush()
+        cur = self._conn.execute(f"SELECT {_COLUMNS} FROM entries e ORDER BY e.seq")
+        return self._stream(cur)
+
+    def add(self, entry: LedgerEntry) -> None:
+        """
+        Append one entry. Committed before returning unless
+        batch_size > 1, in which case it waits for the batch to fill
+        (or for flush(), a read, close() or the end of a with-block).
+        """
+        self._pending.append(entry)
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+
+    def add_many(self, entries: Iterable[LedgerEntry]) -> None:
+        """
+        Append and commit in one transaction (with anything pending).
+        """
+        self._pending.extend(entries)
+        self.flush()
+
+    def count(self) -> int:
+        self.flush()
+        return self._scalar("SELECT entry_count FROM summary")
+
+    def all_latest(self) -> Tuple[LedgerEntry, ...]:
+        """
+        Return only the latest version of each invariant.
+        """
+        self.flush()
+        return tuple(self._stream(self._conn.execute(_LATEST + " ORDER BY l.first_seq")))
+
+    # --------------------------------------------
+    # Indexed queries
+    # --------------------------------------------
+
+    def latest(self, key: LedgerKey) -> Optional[LedgerEntry]:
+        # Pending entries are consulted without forcing a write
+        best: Optional[LedgerEntry] = None
+        row = self._conn.execute(
+            _LATEST + " WHERE l.kind = ? AND l.regions = ? AND l.conditions = ?",
+            _encode_key(key),
+        ).fetchone()
+        if row is not None:
+            best = _decode(row)
+        for entry in self._pending:
+            if ledger_key(entry) == key and (best is None or entry.version > best.version):
+                best = entry
+        return best
+
+    def versions(self, key: LedgerKey) -> Tuple[LedgerEntry, ...]:
+        self.flush()
+        cur = self._conn.execute(
+            f"SELECT {_COLUMNS} FROM entries e"
+            " WHERE e.kind = ? AND e.regions = ? AND e.conditions = ?"
+            " ORDER BY e.seq",
+            _encode_key(key),
+        )
+        return tuple(self._stream(cur))
+
+    def by_kind(self, kind: str) -> Tuple[LedgerEntry, ...]:
+        self.flush()
+        return tuple(self._stream(self._conn.execute(
+            _LATEST + " WHERE l.kind = ? ORDER BY l.first_seq", (kind,)
+        )))
+
+    def by_region(self, region: str) -> Tuple[LedgerEntry, ...]:
+        self.flush()
+        cur = self._conn.execute(
+            f"""
+            SELECT {_COLUMNS}
+            FROM key_regions r
+            JOIN latest l USING (kind, regions, conditions)
+            JOIN entries e ON e.seq = l.seq
+            WHERE r.region = ?
+            ORDER BY l.first_seq
+            """,
+            (region,),
+        )
+        return tuple(self._stream(cur))
+
+    # --------------------------------------------
+    # Aggregates (summary tables, O(1) reads)
+    # --------------------------------------------
+
+    def latest_count(self) -> int:
+        self.flush()
+        return self._scalar("SELECT latest_count FROM summary")
+
+    def confidence_sum(self) -> float:
+        self.flush()
+        return float(self._scalar("SELECT confidence_sum FROM summary"))
+
+    def stability_sum(self) -> float:
+        self.flush()
+        return float(self._scalar("SELECT stability_sum FROM summary"))
+
+    def kind_count(self, kind: str) -> int:
+        self.flush()
+        return self._scalar(
+            "SELECT COALESCE((SELECT count FROM kind_summary WHERE kind = ?), 0)", (kind,)
+        )
+
+    def kind_regions(self, kind: str) -> FrozenSet[str]:
+        self.flush()
+        cur = self._conn.execute("SELECT region FROM kind_regions WHERE kind = ?", (kind,))
+        return frozenset(r for (r,) in cur)
+
+    # --------------------------------------------
+    # Internal
+    # --------------------------------------------
+
+    def _scalar(self, sql: str, args: Tuple = ()):
+        return self._conn.execute(sql, args).fetchone()[0]
+
+    def _stream(self, cur: sqlite3.Cursor) -> Iterator[LedgerEntry]:
+        while True:
+            rows = cur.fetchmany(self.fetch_size)
+            if not rows:
+                return
+            for row in rows:
+                yield _decode(row)
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict, List, FrozenSet
+from typing import Dict, List, FrozenSet, Sequence, Tuple
+
+import numpy as np
 
 
 # ============================================================
@@ -142,4 +144,159 @@ class CandidateBuilder:
                     )
                 )
 
-        return candidates
\ No newline at end of file
+        return candidates
+
+
+# ------------------------------------------------------------
+# Incremental Candidate Builder
+# ------------------------------------------------------------
+
+@dataclass
+class _CandidateTrack:
+    """
+    Live candidate bookkeeping (internal).
+    """
+    since: int                       # tick the band was entered
+    stability: float
+    confidence_hint: float
+
+
+class IncrementalCandidateBuilder(CandidateBuilder):
+    """
+    Same thresholds as CandidateBuilder, evaluated incrementally.
+
+    Remembers the last signals and threshold bands per region.
+    Only regions whose signals changed are re-banded; candidates
+    are created on band entry and retired on band exit. Support is
+    the number of ticks a candidate has held its band.
+
+    Python-level work scales with changed regions; the change
+    scan itself is one vector comparison.
+    """
+
+    KINDS = ("pain", "boundary", "ownership")
+
+    CONDITIONS: Dict[str, FrozenSet[str]] = {
+        "pain": frozenset({"contact", "overload"}),
+        "boundary": frozenset({"pressure", "blocked_motion"}),
+        "ownership": frozenset({"responsive", "controllable"}),
+    }
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._names: List[str] = []
+        self._last = np.empty((0, 3), dtype=np.float64)       # load, pain, stability
+        self._bands = np.zeros((0, len(self.KINDS)), dtype=bool)
+        self._live: Dict[Tuple[str, str], _CandidateTrack] = {}
+        self._tick = 0
+
+    # --------------------------------------------------------
+    # Update
+    # --------------------------------------------------------
+
+    def update(
+        self,
+        *,
+        names: Sequence[str],
+        load: np.ndarray,
+        pain: np.ndarray,
+        stability: np.ndarray,
+    ) -> Tuple[int, int]:
+        """
+        Advance one tick. Arrays are per region, aligned with `names`;
+        regions may be appended between ticks, never reordered.
+
+        Returns (created, retired) candidate counts.
+        """
+        self._tick += 1
+        n = len(names)
+
+        if n > len(self._names):
+            grow = n - len(self._names)
+            self._names.extend(names[len(self._names):])
+            self._last = np.concatenate((self._last, np.full((grow, 3), np.nan)))
+            self._bands = np.concatenate(
+                (self._bands, np.zeros((grow, len(self.KINDS)), dtype=bool))
+            )
+
+        cur = np.stack((load, pain, stability), axis=1)
+        changed = np.flatnonzero((cur != self._last[:n]).any(axis=1))
+        if changed.size == 0:
+            return 0, 0
+
+        l, p, s = cur[changed, 0], cur[changed, 1], cur[changed, 2]
+        bands = np.stack(
+            (
+                p >= self.PAIN_THRESHOLD,
+                (l >= self.LOAD_THRESHOLD) & (s < self.STABILITY_THRESHOLD),
+                (s >= 0.8) & (l < 0.4) & (p < 0.3),
+            ),
+            axis=1,
+        )
+        old = self._bands[changed]
+
+        self._last[changed] = cur[changed]
+        self._bands[changed] = bands
+
+        created = retired = 0
+        rows, kinds = np.nonzero(bands | old)
+        for r, k in zip(rows.tolist(), kinds.tolist()):
+            key = (self.KINDS[k], self._names[changed[r]])
+            if not bands[r, k]:
+                del self._live[key]
+                retired += 1
+                continue
+
+            stab, hint = self._values(k, float(p[r]), float(s[r]))
+            track = self._live.get(key)
+            if track is None:
+                self._live[key] = _CandidateTrack(self._tick, stab, hint)
+                created += 1
+            else:
+                track.stability = stab
+                track.confidence_hint = hint
+
+        return created, retired
+
+    def update_from_graph(self, graph) -> Tuple[int, int]:
+        """
+        Update from a scuttling CouplingGraph (snapshot convention:
+        pain = 1 - stability).
+        """
+        stability = graph.stability
+        return self.update(
+            names=graph.names,
+            load=graph.load,
+            pain=1.0 - stability,
+            stability=stability,
+        )
+
+    def _values(self, k: int, pain: float, stability: float) -> Tuple[float, float]:
+        if k == 0:
+            return max(0.0, 1.0 - pain), min(0.6, pain)
+        if k == 1:
+            return stability, 0.5
+        return stability, 0.4
+
+    # --------------------------------------------------------
+    # Read
+    # --------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self._live)
+
+    def candidates(self) -> List[EmbodimentCandidate]:
+        """
+        Current stable candidate set.
+        """
+        return [
+            EmbodimentCandidate(
+                kind=kind,
+                regions=frozenset({region}),
+                conditions=self.CONDITIONS[kind],
+                support=self._tick - t.since + 1,
+                stability=t.stability,
+                confidence_hint=t.confidence_hint,
+            )
+            for (kind, region), t in self._live.items()
+        ]
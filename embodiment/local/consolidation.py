@@ -80,7 +80,7 @@ class ConsolidationGate:
         if candidate.stability < self.MIN_STABILITY:
             return self._reject("insufficient_stability")
 
-        if candidate.confidence < self.MIN_CONFIDENCE:
+        if candidate.confidence_hint < self.MIN_CONFIDENCE:
             return self._reject("insufficient_confidence")
 
         # --------------------------------------------
@@ -93,7 +93,7 @@ class ConsolidationGate:
                 conditions=tuple(candidate.conditions),
                 support=candidate.support,
                 stability=candidate.stability,
-                confidence=candidate.confidence,
+                confidence=candidate.confidence_hint,
                 version=1,
             )
 
@@ -111,12 +111,12 @@ class ConsolidationGate:
 
         revised = existing.revise(
             added_support=candidate.support,
-            stability_delta=self._bounded_delta(
+            stability_delta=self.bounded_delta(
                 candidate.stability - existing.stability,
                 self.MAX_STABILITY_STEP,
             ),
-            confidence_delta=self._bounded_delta(
-                candidate.confidence - existing.confidence,
+            confidence_delta=self.bounded_delta(
+                candidate.confidence_hint - existing.confidence,
                 self.MAX_CONFIDENCE_STEP,
             ),
         )
@@ -155,7 +155,10 @@ class ConsolidationGate:
     # --------------------------------------------------------
 
     @staticmethod
-    def _bounded_delta(delta: float, max_step: float) -> float:
+    def bounded_delta(delta: float, max_step: float) -> float:
+        """
+        Revision step: never negative, at most `max_step`.
+        """
         if delta <= 0.0:
             return 0.0
         return min(delta, max_step)
@@ -1,7 +1,11 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Set, Iterable
+from typing import Dict, List, Set, Iterable, Union
+
+import numpy as np
+
+from .hierarchy import RegionHierarchy
 
 
 # ============================================================
@@ -71,30 +75,79 @@ class CouplingGraph:
 
     Example:
         finger -> hand -> wrist -> shoulder
+
+    Structure is a compiled RegionHierarchy; load / pain / stability
+    are arrays over its region index. Upward propagation of many
+    signals is one scatter-add along the precompiled ancestor paths;
+    downward stabilization is one update over a descendant range.
     """
 
     def __init__(self) -> None:
-        self._regions: Dict[str, CoupledRegion] = {}
+        self.hierarchy = RegionHierarchy()
+        self._load = np.zeros(16, dtype=np.float64)
+        self._pain = np.zeros(16, dtype=np.float64)
+        self._stability = np.ones(16, dtype=np.float64)
+
+    @property
+    def load(self) -> np.ndarray:
+        return self._load[:len(self.hierarchy)]
+
+    @property
+    def pain(self) -> np.ndarray:
+        return self._pain[:len(self.hierarchy)]
+
+    @property
+    def stability(self) -> np.ndarray:
+        return self._stability[:len(self.hierarchy)]
 
     # --------------------------------------------------------
     # Region registration
     # --------------------------------------------------------
 
+    def _grow(self, need: int) -> None:
+        cap = self._load.shape[0]
+        if need <= cap:
+            return
+        while cap < need:
+            cap *= 2
+        for attr, fill in (("_load", 0.0), ("_pain", 0.0), ("_stability", 1.0)):
+            old = getattr(self, attr)
+            new = np.full(cap, fill, dtype=old.dtype)
+            new[:old.shape[0]] = old
+            setattr(self, attr, new)
+
+    def _register(self, name: str) -> int:
+        i = self.hierarchy.add(name)
+        self._grow(i + 1)
+        return i
+
     def add_region(
         self,
         *,
         name: str,
         parent: str | None = None,
     ) -> None:
-        if name not in self._regions:
-            self._regions[name] = CoupledRegion(name=name)
+        self._register(name)
 
         if parent is not None:
-            if parent not in self._regions:
-                self._regions[parent] = CoupledRegion(name=parent)
+            self._register(parent)
+            self.hierarchy.set_parent(name, parent)
 
-            self._regions[name].parent = parent
-            self._regions[parent].children.add(name)
+    def region(self, name: str) -> CoupledRegion:
+        """
+        Copy of one region's state (edits do not write back).
+        """
+        h = self.hierarchy
+        i = h.index[name]
+        p = h.parent_of(i)
+        return CoupledRegion(
+            name=name,
+            parent=None if p is None else h.names[p],
+            children={h.names[c] for c in np.flatnonzero(h.parent == i).tolist()},
+            load=float(self._load[i]),
+            pain=float(self._pain[i]),
+            stability=float(self._stability[i]),
+        )
 
     # --------------------------------------------------------
     # Signal propagation (UPWARD)
@@ -109,16 +162,97 @@ class CouplingGraph:
         - hand overload reaches wrist
         - shoulder instability reaches spine (later)
         """
+        h = self.hierarchy
+        i = h.index.get(signal.source_region)
+        if i is None:
+            return
+        # One path: every region appears once, no accumulation needed
+        path = np.concatenate(([i], h.ancestors(i)))
+        self._apply(signal.kind, path, signal.magnitude)
 
-        region_name = signal.source_region
+    def propagate_up_many(self, signals: Iterable[CouplingSignal]) -> None:
+        """
+        Propagate many signals at once: every signal reaches its
+        source region and all of its ancestors.
+
+        Signals are applied in order, one run of consecutive
+        same-kind signals at a time; within a run each kind is
+        accumulated per region and applied once. For non-negative
+        magnitudes a run's clamps commute, so the result matches
+        applying the signals one by one; if any magnitude is
+        negative the signals are applied one by one instead.
+        """
+        signals = list(signals)
+        if any(sig.magnitude < 0.0 for sig in signals):
+            for sig in signals:
+                self.propagate_up(sig)
+            return
+
+        index = self.hierarchy.index
+        src: List[int] = []
+        kinds: List[str] = []
+        mags: List[float] = []
+        for sig in signals:
+            i = index.get(sig.source_region)
+            if i is None:
+                continue
+            src.append(i)
+            kinds.append(sig.kind)
+            mags.append(sig.magnitude)
+        if not src:
+            return
 
-        while region_name is not None:
-            region = self._regions.get(region_name)
-            if region is None:
-                break
+        row, region = self.hierarchy.paths(np.array(src, dtype=np.int64))
+        by_row = np.argsort(row, kind="stable")
+        row, region = row[by_row], region[by_row]
+        mag = np.array(mags, dtype=np.float64)[row]
 
-            self._apply_signal(region, signal)
-            region_name = region.parent
+        # Runs of consecutive same-kind signals, as row slices
+        starts = [0] + [k for k in range(1, len(kinds)) if kinds[k] != kinds[k - 1]]
+        bounds = np.searchsorted(row, starts + [len(kinds)])
+
+        acc = np.zeros(len(self.hierarchy))
+        for run, (a, b) in enumerate(zip(bounds[:-1].tolist(), bounds[1:].tolist())):
+            self._apply_run(kinds[starts[run]], region[a:b], mag[a:b], acc)
+
+    def _apply_run(
+        self,
+        kind: str,
+        region: np.ndarray,
+        mag: np.ndarray,
+        acc: np.ndarray,
+    ) -> None:
+        """
+        One run of same-kind signals, already expanded to paths.
+        `acc` is zeroed scratch, returned zeroed.
+        """
+        if kind not in ("load", "pain", "stability"):
+            return
+        touched = np.unique(region)
+        np.add.at(acc, region, mag)
+        total = acc[touched]
+        acc[touched] = 0.0
+        self._apply(kind, touched, total)
+
+    def _apply(
+        self,
+        kind: str,
+        touched: np.ndarray,
+        total: Union[float, np.ndarray],
+    ) -> None:
+        """
+        Apply one kind to distinct regions (`total` per region or scalar).
+        """
+        if kind == "load":
+            load = self.load
+            load[touched] = np.minimum(1.0, load[touched] + total * 0.6)
+        elif kind == "pain":
+            pain, stab = self.pain, self.stability
+            pain[touched] = np.minimum(1.0, pain[touched] + total)
+            stab[touched] = np.maximum(0.0, stab[touched] - total * 0.3)
+        else:
+            stab = self.stability
+            stab[touched] = np.minimum(1.0, stab[touched] + total)
 
     # --------------------------------------------------------
     # Stabilization propagation (DOWNWARD)
@@ -136,38 +270,21 @@ class CouplingGraph:
         Example:
         - wrist stabilizes hand
         - hand stabilizes fingers
-        """
 
-        region = self._regions.get(region_name)
-        if region is None:
+        Halved (dampened) per level: a descendant k levels below its
+        child receives stability_delta * 0.5 ** k.
+        """
+        h = self.hierarchy
+        i = h.index.get(region_name)
+        if i is None:
             return
 
-        for child in region.children:
-            child_region = self._regions[child]
-            child_region.stability = min(
-                1.0,
-                child_region.stability + stability_delta,
-            )
-            self.propagate_down(
-                region_name=child,
-                stability_delta=stability_delta * 0.5,  # dampening
-            )
-
-    # --------------------------------------------------------
-    # Internal application logic
-    # --------------------------------------------------------
-
-    @staticmethod
-    def _apply_signal(region: CoupledRegion, signal: CouplingSignal) -> None:
-        if signal.kind == "load":
-            region.load = min(1.0, region.load + signal.magnitude * 0.6)
-
-        elif signal.kind == "pain":
-            region.pain = min(1.0, region.pain + signal.magnitude)
-            region.stability = max(0.0, region.stability - signal.magnitude * 0.3)
-
-        elif signal.kind == "stability":
-            region.stability = min(1.0, region.stability + signal.magnitude)
+        below = h.descendants(i)
+        if below.size == 0:
+            return
+        levels = h.depth[below] - h.depth[i] - 1
+        stab = self.stability
+        stab[below] = np.minimum(1.0, stab[below] + stability_delta * 0.5 ** levels)
 
     # --------------------------------------------------------
     # Snapshot (for candidates / consolidation)
@@ -181,12 +298,12 @@ class CouplingGraph:
         - candidates.py
         - consolidation gate (later)
         """
-
         return {
-            name: {
-                "load": r.load,
-                "pain": r.pain,
-                "stability": r.stability,
-            }
-            for name, r in self._regions.items()
-        }
\ No newline at end of file
+            name: {"load": l, "pain": p, "stability": s}
+            for name, l, p, s in zip(
+                self.hierarchy.names,
+                self.load.tolist(),
+                self.pain.tolist(),
+                self.stability.tolist(),
+            )
+        }
@@ -0,0 +1,299 @@
+from __future__ import annotations
+
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+
+# ============================================================
+# REGION HIERARCHY (compiled ancestor tables)
+#
+# A body-region forest stored as flat arrays over a stable index:
+# - parent index (-1 for roots) and depth
+# - Euler-tour interval [tin, tout) per region: a region's
+#   descendants are exactly order[tin + 1 : tout]
+# - ancestor paths as CSR (nearest parent first)
+#
+# Once compiled, the tables are patched in place for the common
+# growth steps: a new region is appended as a root, and a leaf
+# coupled under a parent is moved to the end of that parent's
+# tour interval (its ancestor row is the parent plus the parent's
+# row). Both are vectorized O(n) array patches, with no DFS.
+# Re-parenting a region that has children marks the tables
+# dirty; they are rebuilt in full the first time a query needs
+# them.
+#
+# Structure only. No signals, no semantics.
+# ============================================================
+
+ROOT = -1
+
+
+class RegionHierarchy:
+    """
+    Parent/child structure of body regions with O(1) ancestor and
+    descendant checks.
+    """
+
+    __slots__ = (
+        "names",
+        "index",
+        "_parent",
+        "_children",
+        "_dirty",
+        "_depth",
+        "_tin",
+        "_tout",
+        "_order",
+        "_anc_indptr",
+        "_anc_indices",
+    )
+
+    def __init__(self) -> None:
+        self.names: List[str] = []
+        self.index: Dict[str, int] = {}
+        self._parent = np.full(16, ROOT, dtype=np.int64)
+        self._children: List[List[int]] = []
+
+        self._dirty = True
+        self._depth = np.zeros(0, dtype=np.int64)
+        self._tin = np.zeros(0, dtype=np.int64)
+        self._tout = np.zeros(0, dtype=np.int64)
+        self._order = np.zeros(0, dtype=np.int64)
+        self._anc_indptr = np.zeros(1, dtype=np.int64)
+        self._anc_indices = np.zeros(0, dtype=np.int64)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.index
+
+    # --------------------------------------------------------
+    # Structure
+    # --------------------------------------------------------
+
+    def add(self, name: str) -> int:
+        """
+        Register a region (as a root). Returns its index; re-adding
+        a name returns the existing index.
+        """
+        i = self.index.get(name)
+        if i is not None:
+            return i
+
+        i = len(self.names)
+        if i == self._parent.shape[0]:
+            grown = np.full(2 * i, ROOT, dtype=np.int64)
+            grown[:i] = self._parent
+            self._parent = grown
+        self.names.append(name)
+        self.index[name] = i
+        self._children.append([])
+
+        if not self._dirty:
+            # New root: last in index order, so last in the tour
+            self._depth = np.append(self._depth, 0)
+            self._tin = np.append(self._tin, i)
+            self._tout = np.append(self._tout, i + 1)
+            self._order = np.append(self._order, i)
+            self._anc_indptr = np.append(self._anc_indptr, self._anc_indptr[-1])
+        return i
+
+    def set_parent(self, child: str, parent: str) -> None:
+        """
+        Couple child -> parent (registering either if new). A region
+        has one parent; re-coupling moves its whole subtree.
+        """
+        c = self.add(child)
+        p = self.add(parent)
+
+        old = int(self._parent[c])
+        if old == p:
+            return
+
+        # Refuse cycles: parent must not sit below child
+        walk = p
+        while walk != ROOT:
+            if walk == c:
+                raise ValueError(f"coupling {child!r} -> {parent!r} would form a cycle")
+            walk = int(self._parent[walk])
+
+        if old != ROOT:
+            self._children[old].remove(c)
+        self._parent[c] = p
+        self._children[p].append(c)
+
+        if self._dirty:
+            return
+        if self._children[c]:
+            self._dirty = True
+        else:
+            self._attach_leaf(c, p)
+
+    def _attach_leaf(self, c: int, p: int) -> None:
+        """
+        Patch compiled tables after moving leaf c under p (c is
+        already p's last child, so it ends p's tour interval).
+        """
+        tin, tout = self._tin, self._tout
+
+        # Take c out of the tour
+        at = int(tin[c])
+        self._order = np.delete(self._order, at)
+        tin[tin > at] -= 1
+        tout[tout > at] -= 1
+
+        # Re-insert at the end of p's interval; p and its ancestors
+        # grow to cover it, later intervals shift right
+        indptr = self._anc_indptr
+        chain = np.concatenate(([p], self._anc_indices[indptr[p]:indptr[p + 1]]))
+        q = int(tout[p])
+        self._order = np.insert(self._order, q, c)
+        tin[tin >= q] += 1
+        grow = tout > q
+        grow[chain] = True
+        tout += grow
+        tin[c] = q
+        tout[c] = q + 1
+        self._depth[c] = self._depth[p] + 1
+
+        # Ancestor row of c: parent first, then the parent's row
+        start, end = int(indptr[c]), int(indptr[c + 1])
+        self._anc_indices = np.concatenate(
+            (self._anc_indices[:start], chain, self._anc_indices[end:])
+        )
+        indptr[c + 1:] += chain.shape[0] - (end - start)
+
+    # --------------------------------------------------------
+    # Compiled tables
+    # --------------------------------------------------------
+
+    def compile(self) -> None:
+        """
+        Rebuild depth, Euler tour and ancestor tables (O(n + total
+        depth)). No-op unless the structure changed.
+        """
+        if not self._dirty:
+            return
+
+        n = len(self.names)
+        parent = self._parent[:n]
+        depth = np.zeros(n, dtype=np.int64)
+        tin = np.zeros(n, dtype=np.int64)
+        tout = np.zeros(n, dtype=np.int64)
+        order = np.zeros(n, dtype=np.int64)
+
+        # Iterative preorder DFS from every root, index order
+        pos = 0
+        stack: List[Tuple[int, bool]] = [
+            (r, False) for r in reversed(np.flatnonzero(parent == ROOT).tolist())
+        ]
+        while stack:
+            i, done = stack.pop()
+            if done:
+                tout[i] = pos
+                continue
+            tin[i] = pos
+            order[pos] = i
+            pos += 1
+            p = int(parent[i])
+            depth[i] = 0 if p == ROOT else depth[p] + 1
+            stack.append((i, True))
+            stack.extend((c, False) for c in reversed(self._children[i]))
+
+        # Ancestor paths (nearest first); parents precede children in `order`
+        indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(depth, out=indptr[1:])
+        indices = np.empty(int(indptr[-1]), dtype=np.int64)
+        for i in order.tolist():
+            p = int(parent[i])
+            if p == ROOT:
+                continue
+            start = indptr[i]
+            indices[start] = p
+            indices[start + 1:indptr[i + 1]] = indices[indptr[p]:indptr[p + 1]]
+
+        self._depth = depth
+        self._tin = tin
+        self._tout = tout
+        self._order = order
+        self._anc_indptr = indptr
+        self._anc_indices = indices
+        self._dirty = False
+
+    @property
+    def parent(self) -> np.ndarray:
+        return self._parent[:len(self.names)]
+
+    @property
+    def depth(self) -> np.ndarray:
+        self.compile()
+        return self._depth
+
+    @property
+    def order(self) -> np.ndarray:
+        """
+        Regions in Euler-tour (preorder) order.
+        """
+        self.compile()
+        return self._order
+
+    def intervals(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        (tin, tout): region i's subtree is order[tin[i]:tout[i]].
+        """
+        self.compile()
+        return self._tin, self._tout
+
+    def ancestor_table(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        (indptr, indices): ancestors of i are
+        indices[indptr[i]:indptr[i + 1]], nearest first.
+        """
+        self.compile()
+        return self._anc_indptr, self._anc_indices
+
+    # --------------------------------------------------------
+    # Queries
+    # --------------------------------------------------------
+
+    def parent_of(self, i: int) -> Optional[int]:
+        p = int(self._parent[i])
+        return None if p == ROOT else p
+
+    def ancestors(self, i: int) -> np.ndarray:
+        indptr, indices = self.ancestor_table()
+        return indices[indptr[i]:indptr[i + 1]]
+
+    def descendants(self, i: int) -> np.ndarray:
+        """
+        Strict descendants of i, preorder.
+        """
+        self.compile()
+        return self._order[self._tin[i] + 1:self._tout[i]]
+
+    def is_ancestor(self, a: int, b: int) -> bool:
+        """
+        True if a is a strict ancestor of b.
+        """
+        self.compile()
+        return bool(self._tin[a] < self._tin[b] < self._tout[a])
+
+    def paths(self, sources: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Flatten each source's path to its root (source included):
+        returns (row, region), where row indexes into `sources`.
+        """
+        indptr, indices = self.ancestor_table()
+        sources = np.asarray(sources, dtype=np.int64)
+
+        starts = indptr[sources]
+        counts = indptr[sources + 1] - starts
+        total = int(counts.sum())
+        row = np.repeat(np.arange(sources.shape[0]), counts)
+        pos = np.repeat(starts - np.cumsum(counts) + counts, counts) + np.arange(total)
+
+        all_rows = np.concatenate((np.arange(sources.shape[0]), row))
+        regions = np.concatenate((sources, indices[pos]))
+        return all_rows, regions
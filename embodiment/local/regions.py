@@ -19,6 +19,8 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import Dict, Set, Iterable
 
+from .hierarchy import RegionHierarchy
+
 
 # ============================================================
 # REGION DEFINITIONS
@@ -62,10 +64,17 @@ class RegionGraph:
     - Child → Parent propagation only
     - No cycles
     - No semantic meaning
+
+    The structure is also compiled into a RegionHierarchy (flat
+    parent / depth / Euler-tour / ancestor tables), so lineage and
+    ancestor / descendant checks never walk dicts.
     """
 
     parents: Dict[str, str] = field(default_factory=dict)
     children: Dict[str, Set[str]] = field(default_factory=dict)
+    hierarchy: RegionHierarchy = field(
+        default_factory=RegionHierarchy, repr=False, compare=False
+    )
 
     # ----------------------------
     # Registration
@@ -73,8 +82,13 @@ class RegionGraph:
 
     def add_region(self, region: BodyRegion) -> None:
         self.children.setdefault(region.name, set())
+        self.hierarchy.add(region.name)
 
     def couple(self, child: str, parent: str) -> None:
+        self.hierarchy.set_parent(child, parent)
+        old = self.parents.get(child)
+        if old is not None and old != parent:
+            self.children[old].discard(child)
         self.parents[child] = parent
         self.children.setdefault(parent, set()).add(child)
         self.children.setdefault(child, set())
@@ -93,11 +107,31 @@ class RegionGraph:
         """
         Walk upward toward spine.
         """
-        current = region
-        while current in self.parents:
-            parent = self.parents[current]
-            yield parent
-            current = parent
+        i = self.hierarchy.index.get(region)
+        if i is None:
+            return
+        names = self.hierarchy.names
+        for a in self.hierarchy.ancestors(i).tolist():
+            yield names[a]
+
+    def is_ancestor(self, ancestor: str, region: str) -> bool:
+        """
+        True if `ancestor` lies strictly above `region` (O(1)).
+        """
+        h = self.hierarchy
+        if ancestor not in h.index or region not in h.index:
+            return False
+        return h.is_ancestor(h.index[ancestor], h.index[region])
+
+    def descendants(self, region: str) -> Iterable[str]:
+        """
+        Every region below `region`, depth-first.
+        """
+        i = self.hierarchy.index.get(region)
+        if i is None:
+            return ()
+        names = self.hierarchy.names
+        return tuple(names[d] for d in self.hierarchy.descendants(i).tolist())
 
 
 # ============================================================
@@ -1,14 +1,13 @@
 from __future__ import annotations
 
 from bootstrap import system_snapshot
-from embodiment.anatomy import grow_anatomy
+from embodiment.anatomy import body_growth, grow_anatomy, limb_growth
 
 # ----------------------------
 # Reflex layer (CORRECT)
 # ----------------------------
 from scuttling.reflex import ReflexEngine
 from scuttling.coupling.reflex_buffer import ReflexBuffer
-from scuttling.coupling.reflex_coupling import ReflexCouplingEngine
 from scuttling.reflex_adapter import extract_reflex_triggers
 
 
@@ -76,18 +75,8 @@ def step_tick(state: dict) -> None:
         trace["ambient_load"].append(womb_state.ambient_load)
         trace["stability"].append(womb_state.rhythmic_stability)
         trace["brain_coherence"].append(state["last_coherence"])
-        trace["body_growth"].append(
-            sum(r["growth"] for r in state["anatomy"].values())
-            / len(state["anatomy"])
-        )
-        trace["limb_growth"].append(
-            (
-                state["anatomy"]["left_arm"]["growth"]
-                + state["anatomy"]["right_arm"]["growth"]
-                + state["anatomy"]["left_leg"]["growth"]
-                + state["anatomy"]["right_leg"]["growth"]
-            ) / 4
-        )
+        trace["body_growth"].append(body_growth(state["anatomy"]))
+        trace["limb_growth"].append(limb_growth(state["anatomy"]))
         trace["umbilical_load"].append(umb_state.load_transfer)
         trace["rhythmic_coupling"].append(umb_state.rhythmic_coupling)
 
@@ -126,7 +115,6 @@ def step_tick(state: dict) -> None:
     # -----------------------------
     reflex_engine = ReflexEngine()
     reflex_buffer: ReflexBuffer = state["reflex_buffer"]
-    reflex_coupler = ReflexCouplingEngine()
 
     triggers = extract_reflex_triggers(state["world"])
 
@@ -138,9 +126,8 @@ def step_tick(state: dict) -> None:
         )
         reflex_buffer.push(result)
 
-    outcome = reflex_coupler.couple(
-        results=reflex_buffer.flush()
-    )
+    # Buffer couples as it collects; flush is O(1)
+    outcome = reflex_buffer.flush()
 
     if outcome.triggered:
         state["structural_load"] = max(
@@ -1,31 +1,121 @@
 from __future__ import annotations
 
-from typing import Iterable
+from itertools import groupby
+from typing import Any, Callable, Dict, Iterable, List, Protocol, Sequence, Tuple
+
+import numpy as np
 
 from frames.frame import Frame
 from frames.fragment import Fragment
 
-from embodiment.boundaries import BoundaryMap
-from embodiment.ownership import OwnershipResolver
-from embodiment.ledger import EmbodimentLedger
-from embodiment.thermal_pain import ThermalPainProcessor
-
 
 # ============================================================
 # Embodiment Observer
 #
 # Passive observer of CLOSED frames only.
 # Does NOT modify frames or world.
+#
+# A frame is observed as one batch:
+# - fragments are filtered in a single pass, fragment order kept
+# - contact points are mapped to regions once per unique point
+# - ownership is resolved once per unique region (frame table)
+# - each run of consecutive same-kind fragments is converted and
+#   written in bulk, so ledger writes keep fragment order
+# - numeric thermal / force values are converted as one array;
+#   anything else is converted per row, unchanged
+#
+# Cost scales with unique regions, not with fragments.
 # ============================================================
 
+
+# Collaborators are duck-typed: anything with these methods works
+
+class ContactMap(Protocol):
+    def detect_contact(self, x: Any, y: Any) -> Iterable[str]: ...
+
+
+class OwnershipSource(Protocol):
+    def resolve(self, region: str) -> Any: ...
+
+
+class ThermalSource(Protocol):
+    def thermal_to_signal(self, region: str, delta: Any) -> Any: ...
+
+    def pain_from_contact(self, region: str, force: Any) -> Any: ...
+
+
+class EmbodimentRecorder(Protocol):
+    def record_contact(self, region: str) -> None: ...
+
+    def record_thermal(self, region: str, delta: Any) -> None: ...
+
+    def record_pain(self, region: str) -> None: ...
+
+
+_NUMERIC = (int, float, np.integer, np.floating)
+
+
+def _bulk(target: Any, batch: str, single: str) -> Callable[..., None]:
+    """
+    Call target.<batch>(*columns) if it exists, else target.<single>
+    once per row.
+    """
+    fn = getattr(target, batch, None)
+    if fn is not None:
+        return fn
+
+    one = getattr(target, single)
+
+    def each(*columns: Sequence[Any]) -> None:
+        for row in zip(*columns):
+            one(*row)
+
+    return each
+
+
+def _convert(
+    target: Any,
+    batch: str,
+    single: str,
+    regions: List[str],
+    values: List[Any],
+) -> List[Any]:
+    """
+    Convert (region, value) rows, in order.
+
+    Numeric values go through target.<batch>(regions, float64 array)
+    when it exists; every other row goes through target.<single>.
+    """
+    out: List[Any] = [None] * len(values)
+    rest = range(len(values))
+
+    fn = getattr(target, batch, None)
+    if fn is not None:
+        numeric = np.array(
+            [isinstance(v, _NUMERIC) and not isinstance(v, bool) for v in values],
+            dtype=bool,
+        )
+        idx = np.flatnonzero(numeric).tolist()
+        if idx:
+            column = np.array([values[i] for i in idx], dtype=np.float64)
+            for i, result in zip(idx, fn([regions[i] for i in idx], column)):
+                out[i] = result
+            rest = np.flatnonzero(~numeric).tolist()
+
+    one = getattr(target, single)
+    for i in rest:
+        out[i] = one(regions[i], values[i])
+    return out
+
+
 class EmbodimentObserver:
     def __init__(
         self,
         *,
-        boundaries: BoundaryMap,
-        ownership: OwnershipResolver,
-        ledger: EmbodimentLedger,
-        thermal: ThermalPainProcessor,
+        boundaries: ContactMap,
+        ownership: OwnershipSource,
+        ledger: EmbodimentRecorder,
+        thermal: ThermalSource,
     ) -> None:
         self.boundaries = boundaries
         self.ownership = ownership
@@ -40,60 +130,107 @@ class EmbodimentObserver:
         if not frame.closed:
             return  # embodiment only sees settled information
 
-        for fragment in frame.fragments:
-            self._observe_fragment(fragment)
+        rows = self._rows(frame.fragments)
+        touched = self._contact_table([key for kind, key, _ in rows if kind == "contact"])
+        owned = self._ownership_table(
+            region
+            for kind, key, _ in rows
+            for region in (touched[key] if kind == "contact" else (key,))
+        )
+
+        for kind, run in groupby(rows, key=lambda row: row[0]):
+            run = list(run)
+            if kind == "contact":
+                self._record_contacts(
+                    [r for _, point, _ in run for r in touched[point] if owned[r]]
+                )
+                continue
+            kept = [(region, value) for _, region, value in run if owned[region]]
+            if kept:
+                regions, values = map(list, zip(*kept))
+                if kind == "thermal":
+                    self._record_thermal(regions, values)
+                else:
+                    self._record_force(regions, values)
 
     # --------------------------------------------------------
-    # Fragment handling
+    # Filtering (one pass, fragment order)
     # --------------------------------------------------------
 
-    def _observe_fragment(self, fragment: Fragment) -> None:
-        if fragment.kind == "contact":
-            self._handle_contact(fragment)
-
-        elif fragment.kind == "thermal":
-            self._handle_thermal(fragment)
-
-        elif fragment.kind == "force":
-            self._handle_force(fragment)
+    @staticmethod
+    def _rows(fragments: Iterable[Fragment]) -> List[Tuple[str, Any, Any]]:
+        """
+        (kind, key, value) per usable fragment: key is the contact
+        point for contacts, the region otherwise.
+        """
+        rows: List[Tuple[str, Any, Any]] = []
+        value_keys = {"thermal": "delta", "force": "force"}
+
+        for fragment in fragments:
+            payload = fragment.payload
+            if fragment.kind == "contact":
+                x = payload.get("x")
+                y = payload.get("y")
+                if x is not None and y is not None:
+                    rows.append(("contact", (x, y), None))
+                continue
+
+            value_key = value_keys.get(fragment.kind)
+            if value_key is None:
+                continue
+            region = payload.get("region")
+            value = payload.get(value_key)
+            if region is not None and value is not None:
+                rows.append((fragment.kind, region, value))
+
+        return rows
 
     # --------------------------------------------------------
-    # Handlers
+    # Region / ownership tables
     # --------------------------------------------------------
 
-    def _handle_contact(self, fragment: Fragment) -> None:
-        x = fragment.payload.get("x")
-        y = fragment.payload.get("y")
-
-        if x is None or y is None:
-            return
-
-        regions = self.boundaries.detect_contact(x, y)
-        for region in regions:
-            ownership = self.ownership.resolve(region)
-            if ownership.owned:
-                self.ledger.record_contact(region)
-
-    def _handle_thermal(self, fragment: Fragment) -> None:
-        region = fragment.payload.get("region")
-        delta = fragment.payload.get("delta")
-
-        if region is None or delta is None:
-            return
-
-        ownership = self.ownership.resolve(region)
-        if ownership.owned:
-            signal = self.thermal.thermal_to_signal(region, delta)
-            self.ledger.record_thermal(signal.region, signal.temperature_delta)
-
-    def _handle_force(self, fragment: Fragment) -> None:
-        region = fragment.payload.get("region")
-        force = fragment.payload.get("force")
+    def _contact_table(
+        self,
+        points: List[Tuple[Any, Any]],
+    ) -> Dict[Tuple[Any, Any], Tuple[str, ...]]:
+        """
+        point -> regions touched (detect_contact once per unique point).
+        """
+        return {
+            point: tuple(self.boundaries.detect_contact(*point))
+            for point in dict.fromkeys(points)
+        }
+
+    def _ownership_table(self, regions: Iterable[str]) -> Dict[str, bool]:
+        """
+        region -> owned, resolved once per unique region this frame.
+        """
+        return {
+            region: bool(self.ownership.resolve(region).owned)
+            for region in dict.fromkeys(regions)
+        }
 
-        if region is None or force is None:
-            return
+    # --------------------------------------------------------
+    # Bulk recording (one run of owned rows)
+    # --------------------------------------------------------
 
-        ownership = self.ownership.resolve(region)
-        if ownership.owned:
-            pain = self.thermal.pain_from_contact(region, force)
-            self.ledger.record_pain(pain.region)
+    def _record_contacts(self, regions: List[str]) -> None:
+        if regions:
+            _bulk(self.ledger, "record_contacts", "record_contact")(regions)
+
+    def _record_thermal(self, regions: List[str], deltas: List[Any]) -> None:
+        signals = _convert(
+            self.thermal, "thermal_to_signals", "thermal_to_signal", regions, deltas
+        )
+        _bulk(self.ledger, "record_thermals", "record_thermal")(
+            [sig.region for sig in signals],
+            [sig.temperature_delta for sig in signals],
+        )
+
+    def _record_force(self, regions: List[str], forces: List[Any]) -> None:
+        pains = _convert(
+            self.thermal, "pains_from_contact", "pain_from_contact", regions, forces
+        )
+        _bulk(self.ledger, "record_pains", "record_pain")(
+            [pain.region for pain in pains],
+        )
@@ -1,10 +1,10 @@
 # sandys_law_a7do/scuttling/body_map.py
 
-from dataclasses import dataclass, field
-from typing import Dict, Set
+from typing import Dict, Iterable, List, Set
+
+import numpy as np
 
 
-@dataclass
 class BodyMap:
     """
     Pre-aware proprioceptive body structure.
@@ -12,31 +12,82 @@ class BodyMap:
     This map forms through correlated motor impulses.
     It does NOT decide movement.
     It only stabilizes structural relationships.
+
+    Storage is array-backed: regions are indices, confidence is a
+    vector, coupling strength is a dense symmetric matrix (0 where
+    two regions were never co-active).
     """
 
-    # Known body regions
-    regions: Set[str] = field(default_factory=set)
+    INITIAL_CONFIDENCE = 0.1
+    INITIAL_STRENGTH = 0.1
+    DECAY_PER_LOAD = 0.05
+
+    def __init__(self, *, capacity: int = 16) -> None:
+        self.names: List[str] = []
+        self.index: Dict[str, int] = {}
+        self.n = 0
+
+        cap = max(1, int(capacity))
+        self._confidence = np.zeros(cap, dtype=np.float64)
+        self._strength = np.zeros((cap, cap), dtype=np.float64)
+        self._linked = np.zeros((cap, cap), dtype=bool)
 
-    # Adjacency / co-activation graph
-    couplings: Dict[str, Set[str]] = field(default_factory=dict)
 
-    # Confidence that a region is "real"
-    region_confidence: Dict[str, float] = field(default_factory=dict)
+    # --------------------------------------------------
+    # ARRAY VIEWS
+    # --------------------------------------------------
+
+    @property
+    def confidence_vector(self) -> np.ndarray:
+        return self._confidence[:self.n]
 
-    # Strength of coupling between regions
-    coupling_strength: Dict[str, Dict[str, float]] = field(default_factory=dict)
+    @property
+    def strength_matrix(self) -> np.ndarray:
+        return self._strength[:self.n, :self.n]
+
+    @property
+    def linked_matrix(self) -> np.ndarray:
+        return self._linked[:self.n, :self.n]
 
 
     # --------------------------------------------------
     # REGION FORMATION
     # --------------------------------------------------
 
-    def add_region(self, region: str) -> None:
-        if region not in self.regions:
-            self.regions.add(region)
-            self.region_confidence[region] = 0.1
-            self.couplings.setdefault(region, set())
-            self.coupling_strength.setdefault(region, {})
+    def _grow(self, need: int) -> None:
+        cap = self._confidence.shape[0]
+        if need <= cap:
+            return
+        while cap < need:
+            cap *= 2
+        n = self.n
+
+        conf = np.zeros(cap, dtype=np.float64)
+        conf[:n] = self._confidence[:n]
+        strength = np.zeros((cap, cap), dtype=np.float64)
+        strength[:n, :n] = self._strength[:n, :n]
+        linked = np.zeros((cap, cap), dtype=bool)
+        linked[:n, :n] = self._linked[:n, :n]
+
+        self._confidence, self._strength, self._linked = conf, strength, linked
+
+    def add_region(self, region: str) -> int:
+        i = self.index.get(region)
+        if i is None:
+            i = self.n
+            self._grow(i + 1)
+            self.names.append(region)
+            self.index[region] = i
+            self._confidence[i] = self.INITIAL_CONFIDENCE
+            self.n = i + 1
+        return i
+
+    def indices(self, regions: Iterable[str]) -> np.ndarray:
+        """
+        Unique indices for `regions`, adding unknown ones.
+        """
+        idx = {self.add_region(r) for r in regions}
+        return np.fromiter(sorted(idx), dtype=np.int64, count=len(idx))
 
 
     # --------------------------------------------------
@@ -54,33 +105,78 @@ class BodyMap:
 
         Regions that activate together strengthen their coupling.
         """
-        for r in active_regions:
-            self.add_region(r)
-            self.region_confidence[r] += growth_rate * (1.0 - self.region_confidence[r])
-            self.region_confidence[r] = min(1.0, self.region_confidence[r])
-
-        for a in active_regions:
-            for b in active_regions:
-                if a == b:
-                    continue
-                self.couple(a, b, growth_rate)
+        idx = self.indices(active_regions)
+        if idx.size == 0:
+            return
+
+        c = self._confidence[idx]
+        c += growth_rate * (1.0 - c)
+        self._confidence[idx] = np.minimum(1.0, c)
+
+        if idx.size < 2:
+            return
+
+        # Every ordered pair (a, b), a != b: each unordered pair is
+        # strengthened twice per observation
+        block = np.ix_(idx, idx)
+        off = ~np.eye(idx.size, dtype=bool)
+        s = np.where(self._linked[block], self._strength[block], self.INITIAL_STRENGTH)
+        for _ in range(2):
+            s = np.minimum(1.0, s + growth_rate * (1.0 - s))
+        self._strength[block] = np.where(off, s, self._strength[block])
+        self._linked[block] |= off
+
+    def observe_many(
+        self,
+        activation_sets: Iterable[Iterable[str]],
+        *,
+        growth_rate: float,
+    ) -> None:
+        """
+        Batch ingestion of many activation sets.
 
+        Uses the closed form of repeated observe_activation: a value
+        reinforced k times becomes 1 - (1 - v) * (1 - rate) ** k.
+        Equal to observing the sets one by one up to rounding.
+        """
+        rows = [self.indices(s) for s in activation_sets]
+        if not rows:
+            return
+
+        incidence = np.zeros((len(rows), self.n), dtype=np.float64)
+        for r, idx in enumerate(rows):
+            incidence[r, idx] = 1.0
+
+        keep = 1.0 - growth_rate
+        n = self.n
+
+        counts = incidence.sum(axis=0)
+        c = self.confidence_vector
+        hit = counts > 0
+        c[hit] = np.minimum(1.0, 1.0 - (1.0 - c[hit]) * keep ** counts[hit])
+
+        co = incidence.T @ incidence
+        np.fill_diagonal(co, 0.0)
+        pair = co > 0
+        if not pair.any():
+            return
+
+        s = self.strength_matrix
+        linked = self.linked_matrix
+        prev = np.where(linked, s, self.INITIAL_STRENGTH)
+        grown = np.minimum(1.0, 1.0 - (1.0 - prev) * keep ** (2.0 * co))
+        s[pair] = grown[pair]
+        linked |= pair
 
     def couple(self, a: str, b: str, growth_rate: float) -> None:
         """
         Strengthen bidirectional coupling.
         """
-        self.couplings.setdefault(a, set()).add(b)
-        self.couplings.setdefault(b, set()).add(a)
-
-        self.coupling_strength.setdefault(a, {})
-        self.coupling_strength.setdefault(b, {})
-
-        prev = self.coupling_strength[a].get(b, 0.1)
-        new = prev + growth_rate * (1.0 - prev)
-
-        self.coupling_strength[a][b] = min(1.0, new)
-        self.coupling_strength[b][a] = self.coupling_strength[a][b]
+        ia, ib = self.add_region(a), self.add_region(b)
+        prev = self._strength[ia, ib] if self._linked[ia, ib] else self.INITIAL_STRENGTH
+        new = min(1.0, prev + growth_rate * (1.0 - prev))
+        self._strength[ia, ib] = self._strength[ib, ia] = new
+        self._linked[ia, ib] = self._linked[ib, ia] = True
 
 
     # --------------------------------------------------
@@ -91,20 +187,47 @@ class BodyMap:
         """
         High load destabilizes weak body associations.
         """
-        for r in list(self.region_confidence):
-            self.region_confidence[r] *= (1.0 - structural_load * 0.05)
-
-        for a, links in self.coupling_strength.items():
-            for b in list(links):
-                links[b] *= (1.0 - structural_load * 0.05)
+        f = 1.0 - structural_load * self.DECAY_PER_LOAD
+        self.confidence_vector[:] *= f
+        self.strength_matrix[:] *= f
 
 
     # --------------------------------------------------
     # READ-ONLY INTROSPECTION
     # --------------------------------------------------
 
+    @property
+    def regions(self) -> Set[str]:
+        return set(self.names)
+
+    @property
+    def region_confidence(self) -> Dict[str, float]:
+        return dict(zip(self.names, self.confidence_vector.tolist()))
+
+    @property
+    def couplings(self) -> Dict[str, Set[str]]:
+        return {name: self.neighbors(name) for name in self.names}
+
+    @property
+    def coupling_strength(self) -> Dict[str, Dict[str, float]]:
+        out: Dict[str, Dict[str, float]] = {}
+        for i, name in enumerate(self.names):
+            js = np.flatnonzero(self._linked[i, :self.n])
+            out[name] = {self.names[j]: float(self._strength[i, j]) for j in js.tolist()}
+        return out
+
     def neighbors(self, region: str) -> Set[str]:
-        return self.couplings.get(region, set())
+        i = self.index.get(region)
+        if i is None:
+            return set()
+        return {self.names[j] for j in np.flatnonzero(self._linked[i, :self.n]).tolist()}
 
     def confidence(self, region: str) -> float:
-        return self.region_confidence.get(region, 0.0)
\ No newline at end of file
+        i = self.index.get(region)
+        return 0.0 if i is None else float(self._confidence[i])
+
+    def strength(self, a: str, b: str) -> float:
+        ia, ib = self.index.get(a), self.index.get(b)
+        if ia is None or ib is None:
+            return 0.0
+        return float(self._strength[ia, ib])
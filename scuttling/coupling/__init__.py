@@ -0,0 +1,17 @@
+from .graph import CouplingGraph
+from .propagate import (
+    CouplingPropagator,
+    PropagatedLoad,
+    PropagationResult,
+    propagate_once,
+    propagate_once_batch,
+)
+
+__all__ = [
+    "CouplingGraph",
+    "CouplingPropagator",
+    "PropagatedLoad",
+    "PropagationResult",
+    "propagate_once",
+    "propagate_once_batch",
+]
@@ -1,28 +1,450 @@
 from __future__ import annotations
-from dataclasses import dataclass, field
-from typing import Dict, Set
+
+import warnings
+from types import MappingProxyType
+from typing import Dict, Iterable, List, Mapping, Optional, Set, Tuple, Union
+
+import numpy as np
+
 from .region import CoupledRegion
 
 
-@dataclass
+# ============================================================
+# COUPLING GRAPH (struct-of-arrays + CSR)
+#
+# - One array per region signal (load, pain, thermal, contact,
+#   stability); regions are addressed by index, names are labels
+# - Undirected weighted adjacency, compiled to CSR on demand
+# - Recovery / stability / snapshot are whole-array operations
+#
+# No cognition. No memory. Just coupled body regions.
+# ============================================================
+
+_SIGNALS = ("_load", "_pain", "_thermal", "_contact", "_stability")
+
+
+class GraphRegion:
+    """
+    Live view of one region's row in a CouplingGraph.
+
+    Reads and writes go straight to the graph arrays, so code written
+    against the old `graph.regions[name]` objects keeps working.
+    `.state` returns the view itself (load / pain / thermal /
+    contact / stability), matching CoupledRegion.state.
+    """
+
+    __slots__ = ("_graph", "_i")
+
+    def __init__(self, graph: "CouplingGraph", i: int) -> None:
+        self._graph = graph
+        self._i = i
+
+    @property
+    def name(self) -> str:
+        return self._graph.names[self._i]
+
+    @property
+    def state(self) -> "GraphRegion":
+        return self
+
+    @property
+    def load(self) -> float:
+        return float(self._graph._load[self._i])
+
+    @load.setter
+    def load(self, value: float) -> None:
+        self._graph.update_signals(self.name, load=value)
+
+    @property
+    def pain(self) -> float:
+        return float(self._graph._pain[self._i])
+
+    @pain.setter
+    def pain(self, value: float) -> None:
+        self._graph.update_signals(self.name, pain=value)
+
+    @property
+    def thermal(self) -> float:
+        return float(self._graph._thermal[self._i])
+
+    @thermal.setter
+    def thermal(self, value: float) -> None:
+        self._graph.update_signals(self.name, thermal=value)
+
+    @property
+    def contact(self) -> bool:
+        return bool(self._graph._contact[self._i])
+
+    @contact.setter
+    def contact(self, value: bool) -> None:
+        self._graph.update_signals(self.name, contact=value)
+
+    @property
+    def stability(self) -> float:
+        return float(self._graph._stability[self._i])
+
+    @stability.setter
+    def stability(self, value: float) -> None:
+        self._graph._stability[self._i] = float(value)
+
+    @property
+    def neighbours(self) -> Set[str]:
+        return set(self._graph.neighbors(self.name))
+
+    @property
+    def coupling_strength(self) -> Dict[str, float]:
+        g = self._graph
+        return {other: g.strength(self.name, other) for other in g.neighbors(self.name)}
+
+    def update_signals(
+        self,
+        *,
+        load: Optional[float] = None,
+        pain: Optional[float] = None,
+        thermal: Optional[float] = None,
+        contact: Optional[bool] = None,
+    ) -> None:
+        self._graph.update_signals(
+            self.name, load=load, pain=pain, thermal=thermal, contact=contact
+        )
+
+    def recover(self, rate: float = 0.01) -> None:
+        self._graph.recover(rate, np.array([self._i]))
+
+    def couple_to(
+        self, other: Union["GraphRegion", CoupledRegion, str], strength: float = 1.0
+    ) -> None:
+        other_name = other if isinstance(other, str) else other.name
+        self._graph.connect(self.name, other_name, strength)
+
+    def propagated_load(self) -> float:
+        out = self.load + self.pain
+        if self.contact:
+            out += self.thermal
+        return out
+
+    def snapshot(self) -> Dict[str, object]:
+        return {
+            "name": self.name,
+            "active": True,
+            "load": self.load,
+            "pain": self.pain,
+            "thermal": self.thermal,
+            "contact": self.contact,
+            "stability": self.stability,
+            "neighbours": self._graph.neighbors(self.name),
+            "coupling_strength": self.coupling_strength,
+        }
+
+    def __repr__(self) -> str:
+        return f"GraphRegion({self.name!r}, load={self.load}, stability={self.stability})"
+
+
 class CouplingGraph:
-    regions: Dict[str, CoupledRegion] = field(default_factory=dict)
-    edges: Dict[str, Set[str]] = field(default_factory=dict)
+    """
+    Body regions and the couplings between them.
+
+    Indices are stable (regions are never removed). Signal arrays
+    are exposed as length-`n` views; `regions` maps names to live
+    per-region views over the same arrays.
+
+    `CouplingGraph(regions=..., edges=...)` is deprecated: the
+    CoupledRegion objects are copied once, as in add_region.
+    """
+
+    def __init__(
+        self,
+        regions: Optional[Mapping[str, CoupledRegion]] = None,
+        edges: Optional[Mapping[str, Iterable[str]]] = None,
+        *,
+        capacity: int = 16,
+    ) -> None:
+        self.n = 0
+        self.names: List[str] = []
+        self.index: Dict[str, int] = {}
+
+        cap = max(1, int(capacity))
+        self._load = np.zeros(cap, dtype=np.float64)
+        self._pain = np.zeros(cap, dtype=np.float64)
+        self._thermal = np.zeros(cap, dtype=np.float64)
+        self._contact = np.zeros(cap, dtype=bool)
+        self._stability = np.ones(cap, dtype=np.float64)
+
+        # (min(i, j), max(i, j)) -> strength; compiled to CSR lazily
+        self._edges: Dict[Tuple[int, int], float] = {}
+        self._csr: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]] = None
+        self._views: Dict[str, GraphRegion] = {}
+
+        if regions or edges:
+            warnings.warn(
+                "CouplingGraph(regions=..., edges=...) copies the regions' "
+                "signals; later changes to the objects are not tracked. Use "
+                "add_regions / connect and graph.regions[name] instead.",
+                DeprecationWarning,
+                stacklevel=2,
+            )
+            regions = regions or {}
+            self.add_regions(regions)
+            for region in regions.values():
+                self._copy_region(region)
+            for a, others in (edges or {}).items():
+                for b in others:
+                    ia, ib = self.add_regions((a, b))
+                    if ia != ib and (min(ia, ib), max(ia, ib)) not in self._edges:
+                        self.connect(a, b)
+
+    # --------------------------------------------------------
+    # Array views
+    # --------------------------------------------------------
+
+    @property
+    def load(self) -> np.ndarray:
+        return self._load[:self.n]
+
+    @property
+    def pain(self) -> np.ndarray:
+        return self._pain[:self.n]
+
+    @property
+    def thermal(self) -> np.ndarray:
+        return self._thermal[:self.n]
+
+    @property
+    def contact(self) -> np.ndarray:
+        return self._contact[:self.n]
+
+    @property
+    def stability(self) -> np.ndarray:
+        return self._stability[:self.n]
+
+    @property
+    def regions(self) -> Mapping[str, GraphRegion]:
+        """
+        Read-only name -> GraphRegion mapping (live views).
+        """
+        return MappingProxyType(self._views)
+
+    def __len__(self) -> int:
+        return self.n
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.index
+
+    # --------------------------------------------------------
+    # Regions
+    # --------------------------------------------------------
+
+    def _grow(self, need: int) -> None:
+        cap = self._load.shape[0]
+        if need <= cap:
+            return
+        while cap < need:
+            cap *= 2
+        for attr in _SIGNALS:
+            old = getattr(self, attr)
+            new = np.ones(cap, dtype=old.dtype) if attr == "_stability" else np.zeros(cap, dtype=old.dtype)
+            new[:self.n] = old[:self.n]
+            setattr(self, attr, new)
+
+    def add_region(self, region: Union[CoupledRegion, str]) -> int:
+        """
+        Add a region by name. Returns its index. Re-adding a name
+        returns the existing index.
+
+        Passing a CoupledRegion is deprecated: its signals and any
+        couplings to regions already in the graph are copied once,
+        and later changes to that object are NOT seen by the graph.
+        Use `graph.regions[name]` to read or write a region instead.
+        """
+        name = region if isinstance(region, str) else region.name
+        i = self.index.get(name)
+        if i is None:
+            i = self.add_regions([name])[0]
+
+        if isinstance(region, CoupledRegion):
+            warnings.warn(
+                "CouplingGraph.add_region(CoupledRegion) copies the region's "
+                "signals; later changes to the object are not tracked. Pass "
+                "the name and use graph.regions[name] instead.",
+                DeprecationWarning,
+                stacklevel=2,
+            )
+            self._copy_region(region)
+        return i
+
+    def _copy_region(self, region: CoupledRegion) -> None:
+        self.update_signals(
+            region.name,
+            load=region.load,
+            pain=region.pain,
+            thermal=region.thermal,
+            contact=region.contact,
+        )
+        for other, strength in region.coupling_strength.items():
+            if other in self.index:
+                self.connect(region.name, other, strength)
+
+    def add_regions(self, names: Iterable[str]) -> List[int]:
+        out: List[int] = []
+        for name in names:
+            i = self.index.get(name)
+            if i is None:
+                i = self.n
+                self._grow(i + 1)
+                self.names.append(name)
+                self.index[name] = i
+                self._views[name] = GraphRegion(self, i)
+                self.n = i + 1
+                self._csr = None
+            out.append(i)
+        return out
+
+    def update_signals(
+        self,
+        name: str,
+        *,
+        load: Optional[float] = None,
+        pain: Optional[float] = None,
+        thermal: Optional[float] = None,
+        contact: Optional[bool] = None,
+    ) -> None:
+        i = self.index[name]
+        if load is not None:
+            self._load[i] = max(0.0, float(load))
+        if pain is not None:
+            self._pain[i] = max(0.0, float(pain))
+        if thermal is not None:
+            self._thermal[i] = max(0.0, float(thermal))
+        if contact is not None:
+            self._contact[i] = bool(contact)
+        self.recompute_stability(np.array([i]))
+
+    # --------------------------------------------------------
+    # Couplings
+    # --------------------------------------------------------
+
+    def connect(self, a: str, b: str, strength: float = 1.0) -> None:
+        ia, ib = self.add_regions((a, b))
+        self.connect_indices(np.array([ia]), np.array([ib]), strength)
+
+    def connect_indices(
+        self,
+        a: np.ndarray,
+        b: np.ndarray,
+        strength: Union[float, np.ndarray] = 1.0,
+    ) -> None:
+        """
+        Bulk undirected couplings between region indices.
+        Reconnecting a pair overwrites its strength.
+        """
+        a = np.asarray(a, dtype=np.int64)
+        b = np.asarray(b, dtype=np.int64)
+        s = np.maximum(0.0, np.broadcast_to(np.asarray(strength, dtype=np.float64), a.shape))
+        lo, hi = np.minimum(a, b), np.maximum(a, b)
+        for i, j, w in zip(lo.tolist(), hi.tolist(), s.tolist()):
+            if i != j:
+                self._edges[(i, j)] = w
+        self._csr = None
+
+    def csr(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        (indptr, indices, strengths): neighbours of region i are
+        indices[indptr[i]:indptr[i + 1]], sorted.
+        """
+        if self._csr is not None:
+            return self._csr
+
+        m = len(self._edges)
+        pairs = np.fromiter(
+            (v for e in self._edges for v in e), dtype=np.int64, count=2 * m
+        ).reshape(m, 2)
+        w = np.fromiter(self._edges.values(), dtype=np.float64, count=m)
+
+        # Both directions, sorted by (row, col)
+        rows = np.concatenate((pairs[:, 0], pairs[:, 1]))
+        cols = np.concatenate((pairs[:, 1], pairs[:, 0]))
+        ws = np.concatenate((w, w))
+        order = np.lexsort((cols, rows))
+
+        indptr = np.zeros(self.n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows, minlength=self.n), out=indptr[1:])
+        self._csr = (indptr, cols[order], ws[order])
+        return self._csr
+
+    def neighbor_indices(self, i: int) -> np.ndarray:
+        indptr, indices, _ = self.csr()
+        return indices[indptr[i]:indptr[i + 1]]
+
+    def neighbors(self, name: str) -> List[str]:
+        return [self.names[j] for j in self.neighbor_indices(self.index[name]).tolist()]
+
+    def strength(self, a: str, b: str) -> float:
+        ia, ib = self.index[a], self.index[b]
+        return self._edges.get((min(ia, ib), max(ia, ib)), 0.0)
+
+    @property
+    def edges(self) -> Dict[str, Set[str]]:
+        """
+        Name-level adjacency (debugging / compatibility).
+        """
+        return {name: set(self.neighbors(name)) for name in self.names}
+
+    # --------------------------------------------------------
+    # Dynamics (vectorized)
+    # --------------------------------------------------------
+
+    def recompute_stability(self, idx: Optional[np.ndarray] = None) -> None:
+        """
+        stability = clamp01(1 - (load + pain + thermal))
+        """
+        if idx is None:
+            s = self.stability
+            np.add(self.load, self.pain, out=s)
+            s += self.thermal
+        else:
+            s = self._load[idx] + self._pain[idx] + self._thermal[idx]
+        np.subtract(1.0, s, out=s)
+        np.clip(s, 0.0, 1.0, out=s)
+        if idx is not None:
+            self._stability[idx] = s
+
+    def recover(self, rate: float = 0.01, idx: Optional[np.ndarray] = None) -> None:
+        """
+        Every region (or those in `idx`) relaxes by `rate`;
+        contact is released.
+        """
+        r = max(0.0, float(rate))
+        if idx is None:
+            for arr in (self.load, self.pain, self.thermal):
+                arr -= r
+                np.maximum(arr, 0.0, out=arr)
+            self.contact[:] = False
+        else:
+            for arr in (self._load, self._pain, self._thermal):
+                arr[idx] = np.maximum(arr[idx] - r, 0.0)
+            self._contact[idx] = False
+        self.recompute_stability(idx)
 
-    def add_region(self, region: CoupledRegion) -> None:
-        self.regions[region.name] = region
-        self.edges.setdefault(region.name, set())
+    def propagated_load(self) -> np.ndarray:
+        """
+        Per-region outgoing load: load + pain (+ thermal under contact).
+        """
+        out = self.load + self.pain
+        out += np.where(self.contact, self.thermal, 0.0)
+        return out
 
-    def connect(self, a: str, b: str) -> None:
-        self.edges.setdefault(a, set()).add(b)
-        self.edges.setdefault(b, set()).add(a)
+    # --------------------------------------------------------
+    # Snapshot (UI / candidates)
+    # --------------------------------------------------------
 
     def snapshot(self) -> dict:
+        load = self.load.tolist()
+        stability = self.stability.tolist()
         return {
             name: {
-                "load": r.state.load,
-                "pain": 1.0 - r.state.stability,
-                "stability": r.state.stability,
+                "load": l,
+                "pain": 1.0 - s,
+                "stability": s,
             }
-            for name, r in self.regions.items()
-        }
\ No newline at end of file
+            for name, l, s in zip(self.names, load, stability)
+        }
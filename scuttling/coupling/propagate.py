@@ -1,9 +1,22 @@
 from __future__ import annotations
 
-from typing import Set
+from dataclasses import dataclass
+from typing import Iterable, Optional
+
+import numpy as np
 
 from .graph import CouplingGraph
-from .region import CoupledRegion
+
+
+@dataclass(frozen=True)
+class PropagationResult:
+    """
+    Structural summary of one propagation sweep.
+    """
+    sources: int        # unresolved regions the sweep started from
+    reached: int        # regions that received propagated load
+    hops: int           # BFS levels expanded
+    delivered: float    # total load handed to neighbours
 
 
 class CouplingPropagator:
@@ -16,64 +29,229 @@ class CouplingPropagator:
     - propagation stops once resolution occurs
 
     No cognition, memory, or intent is involved.
+
+    One sweep is an iterative multi-source BFS over the graph's CSR
+    adjacency: every unresolved region starts in the first frontier,
+    each region is visited at most once, so a sweep is O(V + E)
+    however many sources there are.
     """
 
-    def __init__(self, graph: CouplingGraph):
+    # A region resolves locally while its propagated load stays at
+    # or below this (same line as LocalState.overloaded()).
+    RESOLUTION_LIMIT = 0.85
+
+    def __init__(
+        self,
+        graph: CouplingGraph,
+        *,
+        attenuation: float = 0.5,
+        max_hops: Optional[int] = None,
+        epsilon: float = 1e-3,
+    ):
+        if not 0.0 <= attenuation <= 1.0:
+            raise ValueError("attenuation must be in [0, 1]")
         self.graph = graph
+        self.attenuation = float(attenuation)
+        self.max_hops = max_hops
+        self.epsilon = float(epsilon)
+
+    # -------------------------------------------------
+    # Resolution
+    # -------------------------------------------------
+
+    def unresolved_mask(self) -> np.ndarray:
+        return self.graph.propagated_load() > self.RESOLUTION_LIMIT
+
+    def can_resolve_locally(self, name: str) -> bool:
+        i = self.graph.index[name]
+        return bool(self.graph.propagated_load()[i] <= self.RESOLUTION_LIMIT)
 
     # -------------------------------------------------
     # Core propagation
     # -------------------------------------------------
 
-    def propagate_from(self, source: CoupledRegion) -> None:
+    def propagate_from(self, name: str) -> PropagationResult:
         """
-        Propagate unresolved load outward until resolved or exhausted.
+        Propagate one region's unresolved load outward until resolved
+        or exhausted.
+        """
+        return self._sweep(np.array([self.graph.index[name]], dtype=np.int64))
+
+    def propagate_all(self) -> PropagationResult:
+        """
+        Run propagation for all unresolved regions in one sweep.
+
+        This allows full-body reflex resolution without ordering assumptions.
+        """
+        return self._sweep(None)
 
+    def _sweep(self, sources: Optional[np.ndarray]) -> PropagationResult:
+        """
         Rules:
-        - propagate only if region cannot resolve locally
-        - propagate to immediate neighbors
-        - never revisit regions in same cycle
+        - only unresolved regions emit
+        - a region emits its excess over RESOLUTION_LIMIT (at most
+          its own load); each hop passes it on scaled by coupling
+          strength * attenuation, split so a sender never hands out
+          more than it carries
+        - whatever a region sends is taken off its own load, so a
+          sweep moves load around and never creates it
+        - a receiver that can absorb the load stops the wave there
+        - regions are never revisited in the same sweep
         """
+        g = self.graph
+        n = g.n
+        indptr, indices, strength = g.csr()
 
-        if source.can_resolve_locally():
-            return
+        pl = g.propagated_load()
+        unresolved = pl > self.RESOLUTION_LIMIT
+        if sources is None:
+            frontier = np.flatnonzero(unresolved)
+        else:
+            frontier = sources[unresolved[sources]]
 
-        visited: Set[str] = set()
-        self._propagate_recursive(source, visited)
+        n_sources = int(frontier.size)
+        carried = np.zeros(n, dtype=np.float64)
+        load = g.load
+        carried[frontier] = np.minimum(pl[frontier] - self.RESOLUTION_LIMIT, load[frontier])
 
-    def _propagate_recursive(
-        self,
-        region: CoupledRegion,
-        visited: Set[str],
-    ) -> None:
-        if region.name in visited:
-            return
+        visited = np.zeros(n, dtype=bool)
+        visited[frontier] = True
+        owner = np.empty(n, dtype=np.int64)     # dedupe scratch
+        out_share = np.zeros(n, dtype=np.float64)
+        sent = np.zeros(n, dtype=np.float64)
 
-        visited.add(region.name)
+        reached = 0
+        hops = 0
+        delivered = 0.0
 
-        # Attempt local resolution again before escalation
-        if region.attempt_resolution():
-            return
+        while frontier.size and (self.max_hops is None or hops < self.max_hops):
+            # Expand the frontier's CSR rows without a Python loop
+            starts = indptr[frontier]
+            counts = indptr[frontier + 1] - starts
+            total = int(counts.sum())
+            if total == 0:
+                break
+            sender = np.repeat(frontier, counts)
+            pos = np.repeat(starts - np.cumsum(counts) + counts, counts) + np.arange(total)
 
-        # Propagate unresolved signal to neighbors
-        for neighbor in self.graph.neighbors(region.name):
-            neighbor.receive_propagated_signal(
-                load=region.unresolved_load,
-                pain=region.pain_signal,
-            )
+            recv = indices[pos]
+            keep = ~visited[recv]
+            recv = recv[keep]
+            if recv.size == 0:
+                break
+            snd = sender[keep]
+            share = strength[pos[keep]] * self.attenuation
 
-            if not neighbor.can_resolve_locally():
-                self._propagate_recursive(neighbor, visited)
+            # Never send more than is carried
+            out_share[frontier] = 0.0
+            np.add.at(out_share, snd, share)
+            amount = carried[snd] * share / np.maximum(out_share[snd], 1.0)
 
-    # -------------------------------------------------
-    # Sweep utilities
-    # -------------------------------------------------
+            sent[frontier] = 0.0
+            np.add.at(sent, snd, amount)
+            load[frontier] = np.maximum(load[frontier] - sent[frontier], 0.0)
+            g.recompute_stability(frontier)
 
-    def propagate_all(self) -> None:
-        """
-        Run propagation for all unresolved regions.
+            slot = np.arange(recv.shape[0])
+            owner[recv] = slot
+            fresh = recv[owner[recv] == slot]
+            visited[fresh] = True
+            hops += 1
+            reached += int(fresh.size)
 
-        This allows full-body reflex resolution without ordering assumptions.
-        """
-        for region in self.graph.unresolved_regions():
-            self.propagate_from(region)
\ No newline at end of file
+            carried[fresh] = 0.0
+            np.add.at(carried, recv, amount)
+            np.add.at(load, recv, amount)
+            delivered += float(amount.sum())
+
+            # Receivers that cannot absorb the load pass it on
+            plf = load[fresh] + g.pain[fresh] + np.where(g.contact[fresh], g.thermal[fresh], 0.0)
+            go = (plf > self.RESOLUTION_LIMIT) & (carried[fresh] > self.epsilon)
+            g.recompute_stability(fresh)
+            frontier = fresh[go]
+
+        return PropagationResult(
+            sources=n_sources,
+            reached=reached,
+            hops=hops,
+            delivered=delivered,
+        )
+
+
+# ----------------------------------------------------------
+# One-hop load evaluation (motor execution)
+# ----------------------------------------------------------
+
+@dataclass(frozen=True)
+class PropagatedLoad:
+    """
+    Regional load after one propagation hop (graph untouched).
+    """
+    total_load: float            # peak regional load
+    region_load: np.ndarray      # per region, graph index order
+
+
+def _spread_profile(
+    graph: CouplingGraph,
+    source_regions: Iterable[str],
+    attenuation: float,
+) -> Optional[np.ndarray]:
+    """
+    Per-region share of one unit of load injected evenly into the
+    sources and spread one hop: s + attenuation * W s.
+    None if no source region is in the graph.
+    """
+    idx = [graph.index[r] for r in source_regions if r in graph.index]
+    if not idx:
+        return None
+
+    s = np.zeros(graph.n, dtype=np.float64)
+    np.add.at(s, np.asarray(idx, dtype=np.int64), 1.0 / len(idx))
+
+    indptr, indices, strength = graph.csr()
+    rows = np.repeat(np.arange(graph.n), np.diff(indptr))
+    hop = np.zeros(graph.n, dtype=np.float64)
+    np.add.at(hop, indices, s[rows] * strength)
+    return s + attenuation * hop
+
+
+def propagate_once(
+    *,
+    graph: CouplingGraph,
+    source_regions: Iterable[str],
+    load: float,
+    attenuation: float = 0.5,
+) -> PropagatedLoad:
+    """
+    Evaluate `load` entering at `source_regions` and spreading one
+    hop over the couplings, on top of the graph's current load.
+    """
+    profile = _spread_profile(graph, source_regions, attenuation)
+    base = graph.propagated_load()
+    if profile is None:
+        return PropagatedLoad(total_load=float(load), region_load=base)
+
+    region_load = base + load * profile
+    return PropagatedLoad(total_load=float(region_load.max()), region_load=region_load)
+
+
+def propagate_once_batch(
+    *,
+    graph: CouplingGraph,
+    source_regions: Iterable[str],
+    loads: np.ndarray,
+    attenuation: float = 0.5,
+) -> np.ndarray:
+    """
+    propagate_once(...).total_load for many loads at once.
+
+    One hop is linear in the injected load, so the spread profile is
+    computed once and every load is a scaled copy: (P, n) in one pass.
+    """
+    loads = np.asarray(loads, dtype=np.float64)
+    profile = _spread_profile(graph, source_regions, attenuation)
+    if profile is None or graph.n == 0:
+        return loads.copy()
+
+    base = graph.propagated_load()
+    return (base + loads[..., None] * profile).max(axis=-1)
@@ -1,24 +1,93 @@
 from __future__ import annotations
-from typing import List
+from typing import Optional
 
-from scuttling.reflex_types import ReflexResult
-from scuttling.coupling.reflex_coupling import ReflexCouplingEngine
+from scuttling.reflex_types import (
+    ReflexResult,
+    ReflexAction,
+    CoupledReflexOutcome,
+)
+from scuttling.coupling.reflex_coupling import ReflexCouplingEngine, NO_COUPLED_REFLEX
 
 
 class ReflexBuffer:
     """
-    Collects reflex results within a single tick before coupling.
+    Collects reflex results within a single tick and couples them.
+
+    Streaming: every push folds the result into running sums, the
+    running dominant action and the conflict flags. flush() only
+    clamps and packages them — O(1), no lists, no sorting.
+    Same outcome as ReflexCouplingEngine.couple over the pushed results.
     """
 
+    __slots__ = (
+        "_count",
+        "_load",
+        "_stability",
+        "_dominant",
+        "_region",
+        "_name",
+        "_region_split",
+        "_name_split",
+    )
+
     def __init__(self) -> None:
-        self._buffer: List[ReflexResult] = []
-        self._coupler = ReflexCouplingEngine()
+        self._reset()
+
+    def _reset(self) -> None:
+        self._count = 0
+        self._load = 0.0
+        self._stability = 0.0
+        self._dominant: Optional[ReflexAction] = None
+        self._region: Optional[str] = None
+        self._name: Optional[str] = None
+        self._region_split = False
+        self._name_split = False
+
+    def __len__(self) -> int:
+        return self._count
 
     def push(self, result: ReflexResult) -> None:
-        if result.triggered:
-            self._buffer.append(result)
+        if not result.triggered:
+            return
+
+        self._count += 1
+        self._load += result.load_delta
+        self._stability += result.stability_delta
+
+        a = result.action
+        if a is None:
+            return
+
+        # Strictly greater: first of equal intensities stays dominant
+        if self._dominant is None:
+            self._dominant = a
+            self._region = a.target_region
+            self._name = a.name
+            return
+        if a.intensity > self._dominant.intensity:
+            self._dominant = a
+        if a.target_region != self._region:
+            self._region_split = True
+        if a.name != self._name:
+            self._name_split = True
+
+    def flush(self) -> CoupledReflexOutcome:
+        """
+        Coupled outcome of everything pushed since the last flush.
+        Resets the buffer.
+        """
+        if self._count == 0:
+            return NO_COUPLED_REFLEX
+
+        outcome = CoupledReflexOutcome(
+            triggered=True,
+            dominant_action=self._dominant,
+            net_load_delta=max(ReflexCouplingEngine.MAX_LOAD_REDUCTION, self._load),
+            net_stability_delta=min(ReflexCouplingEngine.MAX_STABILITY_GAIN, self._stability),
+            unresolved_conflict=self._region_split and self._name_split,
+        )
+        self._reset()
+        return outcome
 
-    def resolve(self):
-        outcome = self._coupler.couple(results=self._buffer)
-        self._buffer.clear()
-        return outcome
\ No newline at end of file
+    # Older name
+    resolve = flush
@@ -1,16 +1,30 @@
 from __future__ import annotations
-from typing import List, Optional
+from typing import Iterable
 
 from scuttling.reflex_types import (
     ReflexResult,
-    ReflexAction,
     CoupledReflexOutcome,
 )
 
 
+# Returned whenever nothing triggered. Frozen, so safe to share.
+NO_COUPLED_REFLEX = CoupledReflexOutcome(
+    triggered=False,
+    dominant_action=None,
+    net_load_delta=0.0,
+    net_stability_delta=0.0,
+    unresolved_conflict=False,
+)
+
+
 class ReflexCouplingEngine:
     """
     Combines multiple ReflexResults into a single structural outcome.
+
+    Coupling rules (applied by ReflexBuffer, one pass):
+    - load / stability deltas sum, then clamp
+    - dominant action = highest intensity (first wins ties)
+    - conflict = actions span >1 region AND >1 action name
     """
 
     MAX_LOAD_REDUCTION = -0.6
@@ -19,54 +33,11 @@ class ReflexCouplingEngine:
     def couple(
         self,
         *,
-        results: List[ReflexResult],
+        results: Iterable[ReflexResult],
     ) -> CoupledReflexOutcome:
+        from scuttling.coupling.reflex_buffer import ReflexBuffer
 
-        if not results:
-            return CoupledReflexOutcome(
-                triggered=False,
-                dominant_action=None,
-                net_load_delta=0.0,
-                net_stability_delta=0.0,
-                unresolved_conflict=False,
-            )
-
-        triggered = [r for r in results if r.triggered]
-        if not triggered:
-            return CoupledReflexOutcome(
-                triggered=False,
-                dominant_action=None,
-                net_load_delta=0.0,
-                net_stability_delta=0.0,
-                unresolved_conflict=False,
-            )
-
-        load_delta = max(
-            self.MAX_LOAD_REDUCTION,
-            sum(r.load_delta for r in triggered),
-        )
-
-        stability_delta = min(
-            self.MAX_STABILITY_GAIN,
-            sum(r.stability_delta for r in triggered),
-        )
-
-        actions = [r.action for r in triggered if r.action]
-        dominant_action: Optional[ReflexAction] = None
-        unresolved_conflict = False
-
-        if actions:
-            actions = sorted(actions, key=lambda a: a.intensity, reverse=True)
-            dominant_action = actions[0]
-
-            regions = {a.target_region for a in actions}
-            names = {a.name for a in actions}
-            unresolved_conflict = len(regions) > 1 and len(names) > 1
-
-        return CoupledReflexOutcome(
-            triggered=True,
-            dominant_action=dominant_action,
-            net_load_delta=load_delta,
-            net_stability_delta=stability_delta,
-            unresolved_conflict=unresolved_conflict,
-        )
\ No newline at end of file
+        buffer = ReflexBuffer()
+        for r in results:
+            buffer.push(r)
+        return buffer.flush()
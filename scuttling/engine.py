@@ -1,6 +1,5 @@
-from embodiment.local.candidates import CandidateBuilder
+from embodiment.local.candidates import IncrementalCandidateBuilder
 from .coupling.graph import CouplingGraph
-from .coupling.region import CoupledRegion
 
 
 class ScuttlingEngine:
@@ -13,29 +12,19 @@ class ScuttlingEngine:
 
     def __init__(self) -> None:
         self.graph = CouplingGraph()
-        self.builder = CandidateBuilder()
-        self._support = 0
-        self._candidates = []
+        self.builder = IncrementalCandidateBuilder()
         self._seed()
 
     def _seed(self):
-        core = CoupledRegion(name="core")
-        limb = CoupledRegion(name="limb")
-        self.graph.add_region(core)
-        self.graph.add_region(limb)
+        self.graph.add_region("core")
+        self.graph.add_region("limb")
         self.graph.connect("core", "limb")
 
     def step(self) -> None:
-        self._support += 1
+        self.graph.recover(rate=0.01)
 
-        for region in self.graph.regions.values():
-            region.recover(rate=0.01)
-
-        snapshot = self.graph.snapshot()
-        self._candidates = self.builder.build_from_coupling(
-            snapshot=snapshot,
-            support=self._support,
-        )
+        # Only regions whose signals changed are re-evaluated
+        self.builder.update_from_graph(self.graph)
 
     def candidates_snapshot(self):
         return [
@@ -45,5 +34,5 @@ class ScuttlingEngine:
                 "support": c.support,
                 "stability": round(c.stability, 3),
             }
-            for c in self._candidates
+            for c in self.builder.candidates()
         ]
\ No newline at end of file
@@ -3,6 +3,8 @@
 from dataclasses import dataclass
 from typing import Literal
 
+import numpy as np
+
 
 ReductionType = Literal["none", "simplify", "halt"]
 
@@ -31,3 +33,32 @@ def decide_load_reduction(
         return LoadReductionDecision("simplify", "instability_or_load")
 
     return LoadReductionDecision("none", "stable")
+
+
+# Batch form: reduction codes index these tuples
+REDUCTIONS = ("none", "simplify", "halt")
+REDUCTION_REASONS = ("stable", "instability_or_load", "overload")
+
+NONE, SIMPLIFY, HALT = 0, 1, 2
+
+
+def decide_load_reduction_batch(
+    *,
+    load: np.ndarray,
+    stability: np.ndarray,
+) -> np.ndarray:
+    """
+    decide_load_reduction element-wise. Returns int8 codes into
+    REDUCTIONS / REDUCTION_REASONS.
+    """
+    load = np.asarray(load)
+    stability = np.asarray(stability)
+    if load.shape != stability.shape:
+        raise ValueError(
+            f"load and stability shapes differ: {load.shape} != {stability.shape}"
+        )
+
+    codes = np.full(load.shape, NONE, dtype=np.int8)
+    codes[(load > 0.6) | (stability < 0.4)] = SIMPLIFY
+    codes[load > 0.85] = HALT
+    return codes
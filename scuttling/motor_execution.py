@@ -1,12 +1,24 @@
 # sandys_law_a7do/scuttling/motor_execution.py
 
 from dataclasses import dataclass
-from typing import Dict
+from typing import Sequence, Union
 
-from sandys_law_a7do.scuttling.motor_patterns import MotorPattern
-from sandys_law_a7do.scuttling.body_map import BodyMap
-from sandys_law_a7do.scuttling.coupling import CouplingGraph, propagate_once
-from sandys_law_a7do.scuttling.load_reduction import decide_load_reduction
+import numpy as np
+
+from scuttling.motor_patterns import MotorPattern, MotorPatternSet
+from scuttling.body_map import BodyMap
+from scuttling.coupling import (
+    CouplingGraph,
+    propagate_once,
+    propagate_once_batch,
+)
+from scuttling.load_reduction import (
+    HALT,
+    NONE,
+    SIMPLIFY,
+    decide_load_reduction,
+    decide_load_reduction_batch,
+)
 
 
 @dataclass
@@ -71,4 +83,72 @@ def execute_motor_pattern(
         resulting_stability=stability,
         reduction_applied=reduction.reduction != "none",
         reason=reduction.reason,
-    )
\ No newline at end of file
+    )
+
+
+# ---------------------------------
+# Batch execution
+# ---------------------------------
+
+@dataclass(frozen=True)
+class MotorExecutionBatch:
+    """
+    Structural outcomes of many patterns against one body state.
+
+    `reduction` holds codes into load_reduction.REDUCTIONS.
+    """
+    resulting_load: np.ndarray
+    resulting_stability: np.ndarray
+    reduction: np.ndarray
+    reduction_applied: np.ndarray
+
+
+def execute_patterns_batch(
+    patterns: Union[Sequence[MotorPattern], MotorPatternSet],
+    body_map: BodyMap,
+    coupling: CouplingGraph,
+    initial_load: float,
+) -> MotorExecutionBatch:
+    """
+    execute_motor_pattern for every pattern at once.
+
+    The body state is shared, so load propagation runs once over
+    the vector of initial loads, and the reduction rules become masks.
+    """
+    if isinstance(patterns, MotorPatternSet):
+        load_cost = patterns.load_cost
+        stability = patterns.stability.copy()
+    else:
+        load_cost = np.fromiter((p.load_cost for p in patterns), dtype=np.float64)
+        stability = np.fromiter((p.stability for p in patterns), dtype=np.float64)
+
+    # 1. Propagate all loads through the body in one pass
+    resulting_load = propagate_once_batch(
+        graph=coupling,
+        source_regions=body_map.regions,
+        loads=initial_load + load_cost,
+    )
+
+    # 2. Decide reductions
+    reduction = decide_load_reduction_batch(
+        load=resulting_load,
+        stability=stability,
+    )
+
+    # 3. Update stability structurally
+    stability = np.where(
+        reduction == HALT,
+        stability * 0.85,
+        np.where(
+            reduction == SIMPLIFY,
+            stability * 0.95,
+            np.minimum(1.0, stability + 0.02),
+        ),
+    )
+
+    return MotorExecutionBatch(
+        resulting_load=resulting_load,
+        resulting_stability=stability,
+        reduction=reduction,
+        reduction_applied=reduction != NONE,
+    )
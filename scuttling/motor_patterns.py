@@ -1,8 +1,9 @@
 # sandys_law_a7do/scuttling/motor_patterns.py
 
-from dataclasses import dataclass, field
-from typing import List
-import random
+from dataclasses import dataclass
+from typing import Iterable, List, Optional, Tuple, Union
+
+import numpy as np
 
 
 @dataclass
@@ -40,30 +41,129 @@ class MotorPattern:
         self.stability = max(0.0, self.stability)
 
 
-@dataclass
+Seed = Union[None, int, np.random.SeedSequence]
+
+
 class MotorPatternSet:
     """
     Collection of impulsive motor patterns.
 
     This set DOES NOT choose.
     It is exposed to impulses during growth epochs.
+
+    Pattern properties are stored as arrays (stability, load_cost,
+    exposures). Impulses come from this set's own Generator, so a
+    given seed always replays the same development.
     """
-    patterns: List[MotorPattern] = field(default_factory=list)
 
+    def __init__(
+        self,
+        patterns: Iterable[MotorPattern] = (),
+        *,
+        seed: Seed = None,
+        rng: Optional[np.random.Generator] = None,
+    ) -> None:
+        self.rng = rng if rng is not None else np.random.default_rng(seed)
+
+        self.names: List[str] = []
+        self.sequences: List[List[str]] = []
+        self.stability = np.zeros(0, dtype=np.float64)
+        self.load_cost = np.zeros(0, dtype=np.float64)
+        self.exposures = np.zeros(0, dtype=np.int64)
+
+        self.extend(patterns)
+
+    @classmethod
+    def for_agents(
+        cls,
+        patterns: Iterable[MotorPattern],
+        n_agents: int,
+        *,
+        seed: Seed = None,
+    ) -> List["MotorPatternSet"]:
+        """
+        One set per agent, each with an independent, reproducible
+        stream spawned from `seed`.
+        """
+        patterns = list(patterns)
+        root = seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+        return [cls(patterns, seed=child) for child in root.spawn(n_agents)]
+
+    # --------------------------------------------------
+    # Patterns
+    # --------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def extend(self, patterns: Iterable[MotorPattern]) -> None:
+        patterns = list(patterns)
+        if not patterns:
+            return
+        self.names.extend(p.name for p in patterns)
+        self.sequences.extend(list(p.sequence) for p in patterns)
+        self.stability = np.concatenate((self.stability, [p.stability for p in patterns]))
+        self.load_cost = np.concatenate((self.load_cost, [p.load_cost for p in patterns]))
+        self.exposures = np.concatenate(
+            (self.exposures, np.array([p.exposures for p in patterns], dtype=np.int64))
+        )
+
+    def add(self, pattern: MotorPattern) -> None:
+        self.extend([pattern])
+
+    def pattern(self, i: int) -> MotorPattern:
+        """
+        Copy of pattern i (edits do not write back).
+        """
+        return MotorPattern(
+            name=self.names[i],
+            sequence=list(self.sequences[i]),
+            load_cost=float(self.load_cost[i]),
+            stability=float(self.stability[i]),
+            exposures=int(self.exposures[i]),
+        )
+
+    @property
+    def patterns(self) -> Tuple[MotorPattern, ...]:
+        """
+        Read-only snapshot of every pattern; use add() / extend()
+        to grow the set.
+        """
+        return tuple(self.pattern(i) for i in range(len(self)))
+
+    # --------------------------------------------------
+    # Growth
+    # --------------------------------------------------
+
+    def impulse_mask(self, impulse_rate: float) -> np.ndarray:
+        """
+        Which patterns fire this epoch (one draw per pattern).
+        """
+        return self.rng.random(len(self)) < impulse_rate
 
     def impulse_fire(self, impulse_rate: float) -> List[MotorPattern]:
         """
         Randomly fire motor patterns during growth.
         Returns patterns that were activated this epoch.
         """
-        fired: List[MotorPattern] = []
+        return [self.pattern(i) for i in np.flatnonzero(self.impulse_mask(impulse_rate)).tolist()]
 
-        for p in self.patterns:
-            if random.random() < impulse_rate:
-                fired.append(p)
+    def _apply_epoch(
+        self,
+        fired: np.ndarray,
+        growth_rate: float,
+        structural_load: float,
+    ) -> None:
+        s = self.stability
 
-        return fired
+        # Fired patterns reinforce
+        self.exposures += fired
+        grown = np.minimum(1.0, s + growth_rate * (1.0 - s))
+        np.copyto(s, grown, where=fired)
 
+        # Load applies decay to all
+        s -= structural_load * self.load_cost * 0.1
+        np.maximum(s, 0.0, out=s)
 
     def growth_epoch_update(
         self,
@@ -71,27 +171,42 @@ class MotorPatternSet:
         growth_rate: float,
         structural_load: float,
         impulse_rate: float,
-    ) -> None:
+    ) -> np.ndarray:
         """
         One developmental growth epoch.
 
         - Impulses fire blindly
         - Fired patterns reinforce
         - Load applies decay
-        """
-
-        fired = self.impulse_fire(impulse_rate)
 
-        for p in self.patterns:
-            if p in fired:
-                p.reinforce(growth_rate)
-            p.decay(structural_load)
+        Returns the fired mask.
+        """
+        fired = self.impulse_mask(impulse_rate)
+        self._apply_epoch(fired, growth_rate, structural_load)
+        return fired
 
+    def run_epochs(
+        self,
+        epochs: int,
+        *,
+        growth_rate: float,
+        structural_load: float,
+        impulse_rate: float,
+    ) -> np.ndarray:
+        """
+        Many growth epochs in one call; impulses for all epochs are
+        drawn at once. Same stream as calling growth_epoch_update
+        `epochs` times. Returns per-pattern fire counts.
+        """
+        fired = self.rng.random((epochs, len(self))) < impulse_rate
+        for row in fired:
+            self._apply_epoch(row, growth_rate, structural_load)
+        return fired.sum(axis=0)
 
     def most_stable(self) -> MotorPattern | None:
         """
         Introspection helper (READ-ONLY).
         """
-        if not self.patterns:
+        if not len(self):
             return None
-        return max(self.patterns, key=lambda p: p.stability)
\ No newline at end of file
+        return self.pattern(int(np.argmax(self.stability)))
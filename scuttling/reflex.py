@@ -6,6 +6,13 @@ Exports reflex components without causing circular imports.
 
 from scuttling.coupling.reflex_buffer import ReflexBuffer
 from scuttling.coupling.reflex_coupling import ReflexCouplingEngine
+from scuttling.reflexes import (
+    ReflexBatch,
+    ReflexEngine,
+    ReflexRule,
+    ReflexTrigger,
+    NO_REFLEX,
+)
 from scuttling.reflex_types import (
     ReflexResult,
     ReflexAction,
@@ -15,6 +22,11 @@ from scuttling.reflex_types import (
 __all__ = [
     "ReflexBuffer",
     "ReflexCouplingEngine",
+    "ReflexEngine",
+    "ReflexTrigger",
+    "ReflexRule",
+    "ReflexBatch",
+    "NO_REFLEX",
     "ReflexResult",
     "ReflexAction",
     "CoupledReflexOutcome",
@@ -1,8 +1,22 @@
-from typing import List
-from scuttling.reflex import ReflexTrigger
+from typing import List, Tuple
+
+import numpy as np
+
+from scuttling.reflex import ReflexEngine, ReflexTrigger
+from world.population import AgentPopulation
 from world.world_state import WorldState
 
 
+# Signal columns produced for every body, in this order
+SIGNAL_KINDS: Tuple[str, ...] = ("thermal", "pressure", "overload")
+SIGNAL_REGIONS: Tuple[str, ...] = ("skin", "skin", "core")
+PRESSURE_MAGNITUDE = 0.7
+
+_SIGNAL_CODES = np.array(
+    [ReflexEngine.KIND_CODES[k] for k in SIGNAL_KINDS], dtype=np.int64
+)
+
+
 def extract_reflex_triggers(world: WorldState) -> List[ReflexTrigger]:
     """
     Translate raw physical body state into reflex triggers.
@@ -28,7 +42,7 @@ def extract_reflex_triggers(world: WorldState) -> List[ReflexTrigger]:
             ReflexTrigger(
                 kind="pressure",
                 region="skin",
-                magnitude=0.7,
+                magnitude=PRESSURE_MAGNITUDE,
             )
         )
 
@@ -42,4 +56,25 @@ def extract_reflex_triggers(world: WorldState) -> List[ReflexTrigger]:
             )
         )
 
-    return triggers
\ No newline at end of file
+    return triggers
+
+
+def population_reflex_signals(
+    population: AgentPopulation,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Array form of extract_reflex_triggers for a whole population.
+
+    Returns (kinds, magnitudes), both shaped (n, 3), columns in
+    SIGNAL_KINDS order. Absent signals have magnitude 0 and never
+    trigger. Feed straight into ReflexEngine.evaluate_batch.
+    """
+    n = population.n
+    mag = np.empty((n, len(SIGNAL_KINDS)), dtype=np.float64)
+    np.minimum(population.thermal, 1.0, out=mag[:, 0])
+    mag[:, 1] = population.contact * PRESSURE_MAGNITUDE
+    np.minimum(population.pain, 1.0, out=mag[:, 2])
+    np.maximum(mag, 0.0, out=mag)
+
+    kinds = np.broadcast_to(_SIGNAL_CODES, mag.shape)
+    return kinds, mag
@@ -1,7 +1,14 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Tuple
+
+import numpy as np
+
+from scuttling.reflex_types import (
+    ReflexAction as _ReflexAction,
+    ReflexResult as _ReflexResult,
+)
 
 
 # ============================================================
@@ -43,33 +50,58 @@ class ReflexTrigger:
 
 
 # ------------------------------------------------------------
-# Reflex Action
+# Reflex Action / Result
+#
+# Shared with the coupling layer (scuttling/reflex_types.py) so
+# results flow straight into ReflexBuffer / ReflexCouplingEngine.
+# ------------------------------------------------------------
+
+# Re-exported for callers that import them from here.
+ReflexAction = _ReflexAction
+ReflexResult = _ReflexResult
+
+
+# Returned for every non-trigger. Frozen, so safe to share.
+NO_REFLEX = ReflexResult(
+    triggered=False,
+    action=None,
+    load_delta=0.0,
+    stability_delta=0.0,
+)
+
+
+# ------------------------------------------------------------
+# Reflex Table
 # ------------------------------------------------------------
 
 @dataclass(frozen=True)
-class ReflexAction:
+class ReflexRule:
     """
-    Immediate motor consequence of a reflex.
+    One row of the reflex table: kind -> (threshold, action, deltas).
     """
-    name: str                     # e.g. "withdraw", "release", "stiffen"
-    target_region: str
-    intensity: float              # [0..1]
+    threshold: float
+    action: str
     reason: str
+    load_delta: float
+    stability_delta: float
+    fixed_intensity: Optional[float] = None   # None -> min(1, magnitude)
 
 
-# ------------------------------------------------------------
-# Reflex Result
-# ------------------------------------------------------------
-
 @dataclass(frozen=True)
-class ReflexResult:
+class ReflexBatch:
     """
-    Output of reflex evaluation.
+    Element-wise reflex evaluation over arrays of signals.
+
+    `action` indexes ReflexEngine.ACTIONS (-1 = none).
+    `dominant` indexes the strongest triggered signal along the
+    last axis (-1 = nothing triggered).
     """
-    triggered: bool
-    action: Optional[ReflexAction]
-    load_delta: float             # negative reduces load
-    stability_delta: float        # usually positive
+    triggered: np.ndarray
+    action: np.ndarray
+    intensity: np.ndarray
+    load_delta: np.ndarray
+    stability_delta: np.ndarray
+    dominant: np.ndarray
 
 
 # ------------------------------------------------------------
@@ -79,6 +111,9 @@ class ReflexResult:
 class ReflexEngine:
     """
     Evaluates raw local signals and produces immediate reflex actions.
+
+    Table-driven: the kind -> rule table is compiled once per class,
+    both as a dict (scalar path) and as arrays (batch path).
     """
 
     # ----------------------------
@@ -88,6 +123,48 @@ class ReflexEngine:
     PRESSURE_THRESHOLD = 0.7
     OVERLOAD_THRESHOLD = 0.8
 
+    # ----------------------------
+    # Compiled table
+    # ----------------------------
+    RULES: Dict[str, ReflexRule] = {
+        "thermal": ReflexRule(
+            threshold=THERMAL_THRESHOLD,
+            action="withdraw",
+            reason="thermal_protection",
+            load_delta=-0.2,
+            stability_delta=+0.1,
+        ),
+        "pressure": ReflexRule(
+            threshold=PRESSURE_THRESHOLD,
+            action="release",
+            reason="pressure_relief",
+            load_delta=-0.15,
+            stability_delta=+0.05,
+        ),
+        "overload": ReflexRule(
+            threshold=OVERLOAD_THRESHOLD,
+            action="halt",
+            reason="system_overload",
+            load_delta=-0.3,
+            stability_delta=+0.15,
+            fixed_intensity=1.0,
+        ),
+    }
+
+    KINDS: Tuple[str, ...] = tuple(RULES)
+    KIND_CODES: Dict[str, int] = {k: i for i, k in enumerate(KINDS)}
+    ACTIONS: Tuple[str, ...] = tuple(r.action for r in RULES.values())
+
+    # Array form; one trailing sentinel row for unknown kinds (code -1)
+    _THRESHOLD = np.array([r.threshold for r in RULES.values()] + [np.inf])
+    _LOAD = np.array([r.load_delta for r in RULES.values()] + [0.0])
+    _STABILITY = np.array([r.stability_delta for r in RULES.values()] + [0.0])
+    _ACTION = np.array(list(range(len(RULES))) + [-1], dtype=np.int64)
+    _FIXED = np.array(
+        [np.nan if r.fixed_intensity is None else r.fixed_intensity for r in RULES.values()]
+        + [np.nan]
+    )
+
     # ----------------------------
     # Main evaluation
     # ----------------------------
@@ -106,100 +183,88 @@ class ReflexEngine:
         - fast
         - side-effect free
         """
+        rule = self.RULES.get(trigger.kind)
 
-        if trigger.kind == "thermal":
-            return self._thermal_reflex(trigger, current_load, current_stability)
-
-        if trigger.kind == "pressure":
-            return self._pressure_reflex(trigger, current_load, current_stability)
+        # Unknown or sub-threshold triggers do nothing
+        if rule is None or trigger.magnitude < rule.threshold:
+            return NO_REFLEX
 
-        if trigger.kind == "overload":
-            return self._overload_reflex(trigger, current_load, current_stability)
-
-        # Unknown triggers do nothing
-        return ReflexResult(
-            triggered=False,
-            action=None,
-            load_delta=0.0,
-            stability_delta=0.0,
-        )
-
-    # --------------------------------------------------------
-    # Specific reflexes
-    # --------------------------------------------------------
-
-    def _thermal_reflex(
-        self,
-        trigger: ReflexTrigger,
-        load: float,
-        stability: float,
-    ) -> ReflexResult:
-        if trigger.magnitude < self.THERMAL_THRESHOLD:
-            return self._no_reflex()
+        intensity = rule.fixed_intensity
+        if intensity is None:
+            intensity = min(1.0, trigger.magnitude)
 
         return ReflexResult(
             triggered=True,
             action=ReflexAction(
-                name="withdraw",
+                name=rule.action,
                 target_region=trigger.region,
-                intensity=min(1.0, trigger.magnitude),
-                reason="thermal_protection",
+                intensity=intensity,
+                reason=rule.reason,
             ),
-            load_delta=-0.2,
-            stability_delta=+0.1,
+            load_delta=rule.load_delta,
+            stability_delta=rule.stability_delta,
         )
 
-    def _pressure_reflex(
+    # ----------------------------
+    # Batch evaluation
+    # ----------------------------
+    def evaluate_batch(
         self,
-        trigger: ReflexTrigger,
-        load: float,
-        stability: float,
-    ) -> ReflexResult:
-        if trigger.magnitude < self.PRESSURE_THRESHOLD:
-            return self._no_reflex()
+        kinds: np.ndarray,
+        magnitudes: np.ndarray,
+    ) -> ReflexBatch:
+        """
+        Evaluate many signals at once.
 
-        return ReflexResult(
-            triggered=True,
-            action=ReflexAction(
-                name="release",
-                target_region=trigger.region,
-                intensity=min(1.0, trigger.magnitude),
-                reason="pressure_relief",
-            ),
-            load_delta=-0.15,
-            stability_delta=+0.05,
-        )
+        kinds: int codes (KIND_CODES, -1 = unknown) or kind strings
+        magnitudes: same shape, normalized [0..1]
 
-    def _overload_reflex(
-        self,
-        trigger: ReflexTrigger,
-        load: float,
-        stability: float,
-    ) -> ReflexResult:
-        if trigger.magnitude < self.OVERLOAD_THRESHOLD:
-            return self._no_reflex()
+        Same rules as `evaluate`, element-wise. Allocation is per
+        batch, not per signal.
+        """
+        codes = self.kind_codes(kinds)
+        mag = np.asarray(magnitudes, dtype=np.float64)
 
-        return ReflexResult(
-            triggered=True,
-            action=ReflexAction(
-                name="halt",
-                target_region=trigger.region,
-                intensity=1.0,
-                reason="system_overload",
-            ),
-            load_delta=-0.3,
-            stability_delta=+0.15,
+        # -1 (unknown) selects the sentinel row
+        triggered = mag >= self._THRESHOLD[codes]
+
+        fixed = self._FIXED[codes]
+        intensity = np.where(np.isnan(fixed), np.minimum(1.0, mag), fixed)
+        intensity = np.where(triggered, intensity, 0.0)
+
+        action = np.where(triggered, self._ACTION[codes], -1)
+        load_delta = np.where(triggered, self._LOAD[codes], 0.0)
+        stability_delta = np.where(triggered, self._STABILITY[codes], 0.0)
+
+        if mag.ndim == 0:
+            dominant = np.asarray(0 if triggered else -1)
+        else:
+            ranked = np.where(triggered, intensity, -1.0)
+            dominant = np.argmax(ranked, axis=-1)
+            dominant = np.where(triggered.any(axis=-1), dominant, -1)
+
+        return ReflexBatch(
+            triggered=triggered,
+            action=action,
+            intensity=intensity,
+            load_delta=load_delta,
+            stability_delta=stability_delta,
+            dominant=dominant,
         )
 
+    @classmethod
+    def kind_codes(cls, kinds: np.ndarray) -> np.ndarray:
+        arr = np.asarray(kinds)
+        if arr.dtype.kind in "iu":
+            return arr.astype(np.int64, copy=False)
+        uniq, inverse = np.unique(arr, return_inverse=True)
+        lut = np.array([cls.KIND_CODES.get(str(k), -1) for k in uniq], dtype=np.int64)
+        return lut[inverse].reshape(arr.shape)
+
     # --------------------------------------------------------
     # Utility
     # --------------------------------------------------------
 
     @staticmethod
     def _no_reflex() -> ReflexResult:
-        return ReflexResult(
-            triggered=False,
-            action=None,
-            load_delta=0.0,
-            stability_delta=0.0,
-        )
\ No newline at end of file
+        return NO_REFLEX
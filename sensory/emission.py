@@ -4,6 +4,7 @@ from __future__ import annotations
 from typing import Dict
 
 from world.world_state import WorldState
+from world.sensors import SensorSuite
 from genesis.birth_state import BirthState
 
 
@@ -11,10 +12,15 @@ def emit_raw_sensory(
     *,
     world: WorldState,
     birth: BirthState | None,
+    receptive_field: int = 0,
 ) -> Dict[str, float]:
     """
     Convert BODY + WORLD PHYSICS into RAW sensory flux.
 
+    receptive_field > 0 samples vision / sound from a k x k patch of
+    the world's light / noise fields around the agent instead of the
+    constant placeholder levels.
+
     Doctrine:
     - No semantics
     - No perception
@@ -42,11 +48,20 @@ def emit_raw_sensory(
     # POST-BIRTH RAW FLUX
     # -------------------------------------------------
 
-    # Vision = ambient light noise (no shapes)
-    vision = 0.05
+    if receptive_field > 0:
+        flux = SensorSuite(world, receptive_field).receptive_flux()
+
+        # Vision = mean light over the patch (no shapes)
+        vision = flux["vision"]
+
+        # Sound = mean vibration over the patch
+        sound = flux["sound"]
+    else:
+        # Vision = ambient light noise (no shapes)
+        vision = 0.05
 
-    # Sound = environmental vibration (constant hum)
-    sound = 0.08
+        # Sound = environmental vibration (constant hum)
+        sound = 0.08
 
     # Touch = contact pressure only
     touch = 0.2 if agent.contact else 0.02
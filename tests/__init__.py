@@ -1 +0,0 @@
-init
\ No newline at end of file
@@ -0,0 +1,23 @@
+# tests/test_anatomy.py
+
+import pytest
+
+from embodiment.anatomy import body_growth, create_default_anatomy, grow_anatomy, limb_growth
+
+
+def test_grow_matches_dict_anatomy():
+    array = create_default_anatomy()
+    plain = {part: {"growth": 0.0, "stability": 0.0} for part in array}
+    for _ in range(3):
+        grow_anatomy(anatomy=array, stability=0.5)
+        grow_anatomy(anatomy=plain, stability=0.5)
+    assert array["head"]["growth"] == pytest.approx(plain["head"]["growth"])
+    assert body_growth(array) == pytest.approx(body_growth(plain))
+
+
+def test_writes_update_limb_growth():
+    anatomy = create_default_anatomy()
+    anatomy["left_arm"]["growth"] = 0.4
+    assert limb_growth(anatomy) == pytest.approx(0.1)
+    with pytest.raises(KeyError):
+        anatomy["head"]["weight"] = 1.0
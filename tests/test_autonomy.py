@@ -0,0 +1,22 @@
+# tests/test_autonomy.py
+
+import pytest
+
+from embodiment.autonomy import create_default_anatomy
+
+
+def test_grow_skips_absent_regions():
+    anatomy = create_default_anatomy()
+    anatomy.toes.present = False
+    anatomy.grow(stability=1.0)
+    assert anatomy.toes.growth == 0.0
+    assert anatomy.head.growth > 0.0
+
+
+def test_setters_keep_core_aggregates_current():
+    anatomy = create_default_anatomy()
+    anatomy.head.growth = 0.5
+    anatomy.head.stability = 0.25
+    core = anatomy.core
+    assert core.body_growth == pytest.approx(core.growth.mean())
+    assert core.stability[core.index["head"]] == 0.25
@@ -0,0 +1,34 @@
+# tests/test_batched_moves.py
+
+from world.actuators import ActionIntent, ActuatorSuite
+from world.physics import WorldPhysics
+from world.world_state import make_default_world
+
+
+def test_apply_moves_matches_single_moves():
+    moves = [(1, 0), (1, 0), (0, 1), (-1, 0), (0, 0)]
+    single = make_default_world(width=7, height=7, spawn=(3, 3))
+    suite = ActuatorSuite(single)
+    for dx, dy in moves:
+        suite.apply(ActionIntent("move", {"dx": dx, "dy": dy}))
+    batched = make_default_world(width=7, height=7, spawn=(3, 3))
+    WorldPhysics(batched).apply_moves(moves)
+    assert (batched.agent.x, batched.agent.y) == (single.agent.x, single.agent.y)
+    assert batched.agent.effort == single.agent.effort
+
+
+def test_apply_moves_stops_when_exhausted():
+    world = make_default_world(width=5, height=5, spawn=(0, 0))
+    result = WorldPhysics(world).apply_moves([(-1, 0)] * 20)
+    assert result.exhausted
+    assert world.agent.effort == 0.0
+
+
+def test_flush_drains_queue():
+    world = make_default_world()
+    suite = ActuatorSuite(world)
+    suite.enqueue(ActionIntent("move", {"dx": 1, "dy": 0}))
+    suite.enqueue(ActionIntent("jump", {}))
+    result = suite.flush()
+    assert suite.pending() == 0
+    assert result.submitted == 2
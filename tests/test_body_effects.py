@@ -0,0 +1,18 @@
+# tests/test_body_effects.py
+
+from world.body_effects import BodyEffects
+from world.world_state import AgentBody, make_default_world
+
+
+def test_apply_many_matches_apply():
+    world = make_default_world(width=6, height=6, spawn=(0, 0))
+    world.world_map.temperature[2, 3] = 1.4
+    pop = world.spawn_population()
+    pop.add(3, 2)
+    body = AgentBody(x=3, y=2)
+    world.agent = body
+    effects = BodyEffects()
+    for _ in range(5):
+        effects.apply_many(world)
+        effects.apply(world)
+    assert (pop.thermal[0], pop.pain[0], pop.effort[0]) == (body.thermal, body.pain, body.effort)
@@ -0,0 +1,24 @@
+# tests/test_body_map.py
+
+import pytest
+
+from scuttling.body_map import BodyMap
+
+
+def test_observe_activation_grows_confidence_and_coupling():
+    body = BodyMap(capacity=1)
+    body.observe_activation({"hand", "arm"}, growth_rate=0.1)
+    assert body.confidence("hand") == pytest.approx(0.19)
+    assert body.strength("hand", "arm") == pytest.approx(0.271)
+    assert body.neighbors("arm") == {"hand"}
+
+
+def test_observe_many_matches_sequential():
+    sets = [{"hand", "arm"}, {"arm", "spine"}, {"hand"}]
+    one = BodyMap()
+    for s in sets:
+        one.observe_activation(s, growth_rate=0.05)
+    many = BodyMap()
+    many.observe_many(sets, growth_rate=0.05)
+    assert many.region_confidence == pytest.approx(one.region_confidence)
+    assert many.strength("arm", "spine") == pytest.approx(one.strength("arm", "spine"))
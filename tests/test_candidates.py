@@ -0,0 +1,25 @@
+# tests/test_candidates.py
+
+import numpy as np
+
+from embodiment.local.candidates import IncrementalCandidateBuilder
+
+
+def _update(builder, pain):
+    return builder.update(
+        names=["a"], load=np.array([0.9]), pain=np.array([pain]), stability=np.array([0.3])
+    )
+
+
+def test_band_entry_and_exit():
+    builder = IncrementalCandidateBuilder()
+    assert _update(builder, 0.7) == (2, 0)
+    assert _update(builder, 0.1) == (0, 1)
+    assert [c.kind for c in builder.candidates()] == ["boundary"]
+
+
+def test_support_counts_ticks_in_band():
+    builder = IncrementalCandidateBuilder()
+    for _ in range(3):
+        _update(builder, 0.7)
+    assert {c.support for c in builder.candidates()} == {3}
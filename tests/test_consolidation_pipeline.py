@@ -0,0 +1,30 @@
+# tests/test_consolidation_pipeline.py
+
+from embodiment.consolidation.pipeline import ConsolidationPipeline
+from embodiment.ledger.ledger import EmbodimentLedger, ledger_key
+from embodiment.local.candidates import EmbodimentCandidate
+from embodiment.local.consolidation import ConsolidationGate
+
+
+def _candidate(support=3, confidence=0.7):
+    return EmbodimentCandidate(
+        kind="pain",
+        regions=frozenset({"hand"}),
+        conditions=frozenset({"contact", "overload"}),
+        support=support,
+        stability=0.8,
+        confidence_hint=confidence,
+    )
+
+
+def test_pipeline_matches_gate_one_at_a_time():
+    candidates = [_candidate(), _candidate(support=1), _candidate(confidence=0.9)]
+    gate, expected = ConsolidationGate(), EmbodimentLedger()
+    for c in candidates:
+        decision = gate.evaluate(candidate=c, existing=expected.latest(ledger_key(c)))
+        if decision.accepted:
+            expected.add(decision.revised_entry)
+    ledger = EmbodimentLedger()
+    report = ConsolidationPipeline(ledger, batch_size=2).run(candidates)
+    assert ledger.entries() == expected.entries()
+    assert (report.created, report.revised, report.rejected) == (1, 1, {"insufficient_support": 1})
@@ -0,0 +1,34 @@
+# tests/test_coupling_graph.py
+
+import pytest
+
+from scuttling.coupling.graph import CouplingGraph
+from scuttling.coupling.region import CoupledRegion
+
+
+def test_csr_lists_sorted_neighbours():
+    g = CouplingGraph()
+    g.add_regions(["a", "b", "c"])
+    g.connect("c", "a", 0.5)
+    g.connect("a", "b")
+    indptr, indices, strength = g.csr()
+    assert indices[indptr[0]:indptr[1]].tolist() == [1, 2]
+    assert g.strength("a", "c") == 0.5
+
+
+def test_region_view_writes_through():
+    g = CouplingGraph()
+    g.add_regions(["a", "b"])
+    g.regions["a"].load = 0.4
+    g.regions["a"].couple_to(g.regions["b"], 0.8)
+    assert g.stability[0] == pytest.approx(0.6)
+    g.regions["a"].recover(0.1)
+    assert g.regions["a"].snapshot()["load"] == pytest.approx(0.3)
+    assert g.strength("a", "b") == 0.8
+
+
+def test_region_constructor_is_deprecated():
+    with pytest.warns(DeprecationWarning):
+        g = CouplingGraph(regions={"a": CoupledRegion("a", load=0.3)}, edges={"a": {"b"}})
+    assert g.regions["a"].load == 0.3
+    assert g.neighbors("b") == ["a"]
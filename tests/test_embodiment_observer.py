@@ -0,0 +1,71 @@
+# tests/test_embodiment_observer.py
+
+from types import SimpleNamespace
+
+from frames.frame import Frame
+from frames.fragment import Fragment
+from integration.embodiment_observer import EmbodimentObserver
+
+
+class _Collaborators:
+    def __init__(self):
+        self.log = []
+
+    def detect_contact(self, x, y):
+        return ["hand"]
+
+    def resolve(self, region):
+        return SimpleNamespace(owned=region != "tool")
+
+    def thermal_to_signal(self, region, delta):
+        return SimpleNamespace(region=region, temperature_delta=delta)
+
+    def pain_from_contact(self, region, force):
+        return SimpleNamespace(region=region)
+
+    def record_contact(self, region):
+        self.log.append(("contact", region))
+
+    def record_thermal(self, region, delta):
+        self.log.append(("thermal", region, delta))
+
+    def record_pain(self, region):
+        self.log.append(("pain", region))
+
+
+class _BatchThermal(_Collaborators):
+    def thermal_to_signals(self, regions, deltas):
+        self.log.append(deltas.dtype)
+        return [self.thermal_to_signal(r, d) for r, d in zip(regions, deltas)]
+
+
+def _observe(c, *fragments, closed=True):
+    frame = Frame(domain="test", label="frame", fragments=list(fragments))
+    frame.closed = closed
+    EmbodimentObserver(boundaries=c, ownership=c, ledger=c, thermal=c).observe_frame(frame)
+    return c.log
+
+
+def _thermal(region, delta):
+    return Fragment(kind="thermal", payload={"region": region, "delta": delta})
+
+
+def test_writes_keep_fragment_order():
+    log = _observe(
+        _Collaborators(),
+        _thermal("arm", 0.5),
+        Fragment(kind="contact", payload={"x": 1, "y": 2}),
+        Fragment(kind="force", payload={"region": "tool", "force": 1.0}),
+        _thermal("arm", "hot"),
+    )
+    assert log == [("thermal", "arm", 0.5), ("contact", "hand"), ("thermal", "arm", "hot")]
+
+
+def test_numeric_values_convert_as_one_array():
+    log = _observe(_BatchThermal(), _thermal("arm", 1), _thermal("arm", 2.5))
+    assert log == ["float64", ("thermal", "arm", 1.0), ("thermal", "arm", 2.5)]
+
+
+def test_open_frames_are_ignored():
+    contact = Fragment(kind="contact", payload={"x": 0, "y": 0})
+    assert _observe(_Collaborators(), contact, closed=False) == []
@@ -0,0 +1,64 @@
+# tests/test_event_log.py
+
+import numpy as np
+import pytest
+
+from world.event_log import WorldEventLog, format_id, parse_id
+from world.world_state import WorldEventType
+
+
+def test_ring_keeps_newest_events():
+    log = WorldEventLog(capacity=4)
+    for i in range(1, 11):
+        log.append(i, WorldEventType.ACTION, "move", {"dx": i})
+    assert log.select().tolist() == [7, 8, 9, 10]
+    assert log.dropped == 6
+
+
+def test_payload_round_trip():
+    log = WorldEventLog(capacity=8)
+    payload = {"x": 3, "t": 0.5, "ok": True, "who": "a", "pos": (1, 2)}
+    log.append(1, WorldEventType.OUTCOME, "contact", payload)
+    assert log.event(1).payload == payload
+    assert parse_id(format_id(42)) == 42
+
+
+def test_append_columns_rejects_overflow_schema():
+    log = WorldEventLog(capacity=8, payload_slots=1)
+    with pytest.raises(ValueError):
+        log.append_columns(
+            ids=np.array([1]),
+            type_codes=np.array([0]),
+            name_codes=np.array([log.intern_name("e")]),
+            parent_ids=np.array([-1]),
+            schema_codes=np.array([log.intern_schema((("a", "f", 1), ("b", "f", 1)))]),
+            values=np.zeros((1, 2)),
+        )
+
+
+def _causal_log(n: int, capacity: int) -> WorldEventLog:
+    log = WorldEventLog(capacity=capacity)
+    for i in range(1, n + 1):
+        if i % 3 == 1:
+            log.append(i, WorldEventType.ACTION, "act", {})
+        else:
+            log.append(i, WorldEventType.OUTCOME, "out", {}, parent_id=i - 1)
+    return log
+
+
+def test_chain_index():
+    log = _causal_log(9, capacity=32)
+    assert log.chain(3) == [1, 2, 3]
+    assert log.descendants(7) == [8, 9]
+
+
+def test_eviction_trims_links():
+    log = _causal_log(12, capacity=4)
+    assert log.parent(9) == -1
+    assert log.chain(12) == [10, 11, 12]
+
+
+def test_linked_outcome_ratio():
+    log = _causal_log(9, capacity=32)
+    log.append(10, WorldEventType.OUTCOME, "out", {})
+    assert log.linked_outcome_ratio() == 6 / 7
@@ -0,0 +1,28 @@
+# tests/test_field_dynamics.py
+
+import pytest
+
+from world.field_dynamics import FieldDynamics, FieldDynamicsConfig
+from world.world_state import make_default_world
+
+
+def test_diffusion_conserves_heat_without_decay():
+    world = make_default_world()
+    cfg = FieldDynamicsConfig(temperature_decay=0.0, noise_decay=0.0, epsilon=0.0)
+    dyn = FieldDynamics(world, cfg)
+    before = world.world_map.temperature.sum()
+    dyn.inject("temperature", 5, 5, 10.0)
+    dyn.step()
+    assert world.world_map.temperature.sum() == pytest.approx(before + 10.0)
+
+
+def test_inject_rejects_static_field():
+    dyn = FieldDynamics(make_default_world())
+    with pytest.raises(KeyError):
+        dyn.inject("light", 1, 1, 5.0)
+
+
+def test_wall_added_to_set_is_seen():
+    world = make_default_world()
+    world.walls.add(((1, 1), (2, 1)))
+    assert world.has_wall_between((2, 1), (1, 1))
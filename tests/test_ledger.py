@@ -0,0 +1,48 @@
+# tests/test_ledger.py
+
+import pytest
+
+from embodiment.ledger.entry import LedgerEntry
+from embodiment.ledger.ledger import EmbodimentLedger
+
+
+def _entry(kind="pain", regions=("hand",), confidence=0.5):
+    return LedgerEntry(
+        kind=kind,
+        regions=frozenset(regions),
+        conditions=("contact", "overload"),
+        support=3,
+        stability=0.7,
+        confidence=confidence,
+    )
+
+
+def test_latest_follows_revisions():
+    ledger = EmbodimentLedger()
+    first = _entry()
+    second = first.revise(added_support=1, stability_delta=0.0, confidence_delta=0.1)
+    ledger.add(first)
+    ledger.add(second)
+    key = ("pain", frozenset({"hand"}), ("contact", "overload"))
+    assert ledger.latest(key) is second
+    assert ledger.versions(key) == (first, second)
+    assert ledger.all_latest() == (second,)
+
+
+def test_kind_and_region_indexes():
+    ledger = EmbodimentLedger()
+    ledger.add(_entry())
+    ledger.add(_entry("boundary", ("hand", "arm")))
+    assert [e.kind for e in ledger.by_region("hand")] == ["pain", "boundary"]
+    assert [e.kind for e in ledger.by_kind("boundary")] == ["boundary"]
+
+
+def test_aggregates_replace_revised_versions():
+    ledger = EmbodimentLedger()
+    first = _entry(confidence=0.5)
+    ledger.add(first)
+    ledger.add(first.revise(added_support=1, stability_delta=0.0, confidence_delta=0.2))
+    ledger.add(_entry("pain", ("leg",), confidence=0.1))
+    assert ledger.latest_count() == 2
+    assert ledger.confidence_sum() == pytest.approx(0.8)
+    assert ledger.kind_regions("pain") == {"hand", "leg"}
@@ -0,0 +1,39 @@
+# tests/test_local_coupling.py
+
+import pytest
+
+from embodiment.local.coupling import CouplingGraph, CouplingSignal
+
+
+def _chain():
+    g = CouplingGraph()
+    g.add_region(name="finger", parent="hand")
+    g.add_region(name="hand", parent="wrist")
+    return g
+
+
+def test_propagate_up_reaches_every_ancestor():
+    g = _chain()
+    g.propagate_up(CouplingSignal(kind="pain", magnitude=0.5, source_region="finger"))
+    assert g.pain.tolist() == [0.5, 0.5, 0.5]
+    assert g.stability.tolist() == pytest.approx([0.85, 0.85, 0.85])
+
+
+def test_propagate_up_many_matches_one_by_one():
+    signals = [
+        CouplingSignal(kind="load", magnitude=0.9, source_region="finger"),
+        CouplingSignal(kind="load", magnitude=-0.4, source_region="hand"),
+        CouplingSignal(kind="pain", magnitude=0.2, source_region="hand"),
+    ]
+    one, many = _chain(), _chain()
+    for sig in signals:
+        one.propagate_up(sig)
+    many.propagate_up_many(signals)
+    assert many.snapshot() == one.snapshot()
+
+
+def test_propagate_down_halves_per_level():
+    g = _chain()
+    g.stability[:] = 0.2
+    g.propagate_down(region_name="wrist", stability_delta=0.4)
+    assert g.stability.tolist() == pytest.approx([0.4, 0.6, 0.2])
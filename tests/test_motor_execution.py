@@ -0,0 +1,33 @@
+# tests/test_motor_execution.py
+
+import numpy as np
+import pytest
+
+from scuttling.body_map import BodyMap
+from scuttling.coupling import CouplingGraph
+from scuttling.load_reduction import HALT, NONE, SIMPLIFY, decide_load_reduction_batch
+from scuttling.motor_execution import execute_motor_pattern, execute_patterns_batch
+from scuttling.motor_patterns import MotorPattern
+
+
+def test_batch_matches_per_pattern():
+    body = BodyMap()
+    graph = CouplingGraph()
+    graph.connect("hand", "arm", 0.8)
+    patterns = [
+        MotorPattern("light", ["hand"], load_cost=0.1),
+        MotorPattern("heavy", ["hand"], load_cost=0.9),
+    ]
+    batch = execute_patterns_batch(patterns, body, graph, 0.1)
+    for i, p in enumerate(patterns):
+        one = execute_motor_pattern(pattern=p, body_map=body, coupling=graph, initial_load=0.1)
+        assert batch.resulting_load[i] == pytest.approx(one.resulting_load)
+        assert bool(batch.reduction_applied[i]) == one.reduction_applied
+
+
+def test_reduction_batch_codes():
+    load = np.array([0.1, 0.7, 0.95])
+    codes = decide_load_reduction_batch(load=load, stability=np.full(3, 0.9))
+    assert codes.tolist() == [NONE, SIMPLIFY, HALT]
+    with pytest.raises(ValueError):
+        decide_load_reduction_batch(load=np.zeros(2), stability=np.zeros(3))
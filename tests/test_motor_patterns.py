@@ -0,0 +1,31 @@
+# tests/test_motor_patterns.py
+
+import numpy as np
+import pytest
+
+from scuttling.motor_patterns import MotorPattern, MotorPatternSet
+
+
+def _patterns():
+    return [
+        MotorPattern("kick", ["hip", "knee"], load_cost=0.4),
+        MotorPattern("grasp", ["hand"], load_cost=0.2, stability=0.5),
+    ]
+
+
+def test_same_seed_gives_same_epochs():
+    a = MotorPatternSet(_patterns(), seed=8)
+    b = MotorPatternSet(_patterns(), seed=8)
+    counts = a.run_epochs(20, growth_rate=0.05, structural_load=0.2, impulse_rate=0.5)
+    total = sum(
+        b.growth_epoch_update(growth_rate=0.05, structural_load=0.2, impulse_rate=0.5)
+        for _ in range(20)
+    )
+    assert counts.tolist() == total.tolist()
+    assert np.array_equal(a.stability, b.stability)
+
+
+def test_patterns_is_read_only():
+    s = MotorPatternSet(_patterns())
+    with pytest.raises(AttributeError):
+        s.patterns.append(MotorPattern("crawl", ["hip"], load_cost=0.5))
@@ -0,0 +1,31 @@
+# tests/test_population.py
+
+import numpy as np
+import pytest
+
+from world.physics import WorldPhysics
+from world.world_state import make_default_world
+
+
+def test_contacts_are_adjacent_pairs():
+    world = make_default_world(width=8, height=8, spawn=(0, 0))
+    pop = world.spawn_population(bucket=4)
+    pop.add_many([(3, 3), (4, 3), (6, 6)])
+    assert pop.contacts().tolist() == [[0, 1]]
+    assert pop.neighbors(3, 3, 1).tolist() == [0, 1]
+
+
+def test_spawn_rejects_agent_cell():
+    world = make_default_world(width=8, height=8, spawn=(2, 2))
+    pop = world.spawn_population()
+    with pytest.raises(ValueError):
+        pop.add(2, 2)
+
+
+def test_step_population_blocks_collisions():
+    world = make_default_world(width=8, height=8, spawn=(0, 0))
+    pop = world.spawn_population()
+    pop.add_many([(3, 3), (5, 3)])
+    WorldPhysics(world).step_population(np.array([(1, 0), (-1, 0)]))
+    assert np.unique(pop.y * 8 + pop.x).size == 2
+    np.testing.assert_array_equal(pop.occupancy[pop.y, pop.x], [0, 1])
@@ -0,0 +1,32 @@
+# tests/test_propagate.py
+
+import pytest
+
+from scuttling.coupling.graph import CouplingGraph
+from scuttling.coupling.propagate import CouplingPropagator
+
+
+def test_sweeps_conserve_load():
+    g = CouplingGraph()
+    g.add_regions(["a", "b", "c"])
+    g.connect("a", "b")
+    g.connect("b", "c", 0.5)
+    g.update_signals("a", load=1.4)
+    prop = CouplingPropagator(g, attenuation=0.9)
+    for _ in range(5):
+        prop.propagate_all()
+    assert g.load.sum() == pytest.approx(1.4)
+
+
+def test_sweep_moves_excess_to_neighbours():
+    g = CouplingGraph()
+    g.add_regions(["hand", "arm", "spine"])
+    g.connect("hand", "arm")
+    g.connect("arm", "spine")
+    g.update_signals("hand", load=1.0)
+
+    result = CouplingPropagator(g, attenuation=0.5).propagate_from("hand")
+    assert (result.sources, result.reached, result.hops) == (1, 1, 1)
+    assert result.delivered == pytest.approx(0.075)
+    assert g.load.tolist() == pytest.approx([0.925, 0.075, 0.0])
+    assert g.stability.tolist() == pytest.approx([0.075, 0.925, 1.0])
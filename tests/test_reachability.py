@@ -0,0 +1,20 @@
+# tests/test_reachability.py
+
+from world.reachability import UNREACHABLE, Reachability
+from world.world_state import make_default_world
+
+
+def test_distance_goes_around_wall():
+    world = make_default_world(width=5, height=5)
+    world.add_wall_between((0, 0), (1, 0))
+    reach = Reachability(world)
+    assert reach.distance((0, 0), (1, 0)) == 3
+
+
+def test_wall_repair_updates_cached_field():
+    world = make_default_world(width=5, height=5)
+    reach = Reachability(world)
+    assert reach.is_reachable((0, 0), (2, 2))
+    for n in ((1, 2), (3, 2), (2, 1), (2, 3)):
+        world.add_wall_between((2, 2), n)
+    assert reach.distance((0, 0), (2, 2)) == UNREACHABLE
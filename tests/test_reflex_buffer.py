@@ -0,0 +1,27 @@
+# tests/test_reflex_buffer.py
+
+from scuttling.coupling.reflex_buffer import ReflexBuffer
+from scuttling.coupling.reflex_coupling import NO_COUPLED_REFLEX
+from scuttling.reflex_types import ReflexAction, ReflexResult
+
+
+def _result(name, region, intensity):
+    action = ReflexAction(name=name, target_region=region, intensity=intensity, reason="test")
+    return ReflexResult(triggered=True, action=action, load_delta=-0.4, stability_delta=0.3)
+
+
+def test_flush_couples_pushed_results():
+    buffer = ReflexBuffer()
+    buffer.push(_result("withdraw", "hand", 0.7))
+    buffer.push(_result("halt", "foot", 1.0))
+    out = buffer.flush()
+    assert out.dominant_action.name == "halt"
+    assert (out.net_load_delta, out.net_stability_delta) == (-0.6, 0.4)
+    assert out.unresolved_conflict
+
+
+def test_flush_resets_the_buffer():
+    buffer = ReflexBuffer()
+    buffer.push(_result("withdraw", "hand", 0.7))
+    buffer.flush()
+    assert buffer.flush() is NO_COUPLED_REFLEX
@@ -0,0 +1,31 @@
+# tests/test_reflexes.py
+
+import numpy as np
+
+from scuttling.reflexes import NO_REFLEX, ReflexEngine, ReflexTrigger
+
+
+def _fire(kind, magnitude):
+    return ReflexEngine().evaluate(
+        trigger=ReflexTrigger(kind=kind, region="hand", magnitude=magnitude),
+        current_load=0.0,
+        current_stability=1.0,
+    )
+
+
+def test_thermal_reflex_withdraws():
+    r = _fire("thermal", 0.7)
+    assert (r.action.name, r.load_delta, r.stability_delta) == ("withdraw", -0.2, 0.1)
+
+
+def test_below_threshold_and_unknown_kinds_do_nothing():
+    assert _fire("thermal", 0.64) is NO_REFLEX
+    assert _fire("itch", 1.0) is NO_REFLEX
+
+
+def test_evaluate_batch_picks_dominant():
+    batch = ReflexEngine().evaluate_batch(
+        np.array([["thermal", "overload", "itch"]]), np.array([[0.7, 0.9, 1.0]])
+    )
+    assert batch.triggered.tolist() == [[True, True, False]]
+    assert batch.dominant.tolist() == [1]
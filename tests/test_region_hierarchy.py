@@ -0,0 +1,31 @@
+# tests/test_region_hierarchy.py
+
+import pytest
+
+from embodiment.local.hierarchy import RegionHierarchy
+from embodiment.local.regions import default_local_body_map
+
+
+def test_recoupling_updates_ancestors_and_descendants():
+    h = RegionHierarchy()
+    h.set_parent("hand", "arm")
+    h.set_parent("arm", "spine")
+    h.set_parent("hand", "spine")
+    i = h.index["hand"]
+    assert h.ancestors(i).tolist() == [h.index["spine"]]
+    assert h.descendants(h.index["arm"]).size == 0
+
+
+def test_cycles_are_refused():
+    h = RegionHierarchy()
+    h.set_parent("hand", "arm")
+    h.set_parent("arm", "spine")
+    with pytest.raises(ValueError):
+        h.set_parent("spine", "hand")
+
+
+def test_region_graph_queries():
+    g = default_local_body_map()
+    assert list(g.lineage("finger_3")) == ["hand", "forearm", "shoulder", "spine"]
+    assert g.is_ancestor("shoulder", "finger_1")
+    assert not g.is_ancestor("finger_1", "shoulder")
@@ -0,0 +1,25 @@
+# tests/test_sensors.py
+
+import numpy as np
+import pytest
+
+from world.sensors import SensorSuite
+from world.world_state import make_default_world
+
+
+def test_patches_are_views_of_the_world_fields():
+    world = make_default_world(width=9, height=9, spawn=(4, 4))
+    light = SensorSuite(world, receptive_field=3).patches()["light"]
+    assert light.shape == (3, 3)
+    assert np.shares_memory(light, world.world_map.light)
+
+
+def test_patches_clip_at_the_boundary():
+    world = make_default_world(width=9, height=9, spawn=(0, 8))
+    suite = SensorSuite(world, receptive_field=5)
+    assert suite.patches()["noise"].shape == (3, 3)
+
+
+def test_receptive_field_must_be_odd():
+    with pytest.raises(ValueError):
+        SensorSuite(make_default_world(), receptive_field=2)
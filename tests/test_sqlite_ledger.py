@@ -0,0 +1,35 @@
+# tests/test_sqlite_ledger.py
+
+import sqlite3
+
+from embodiment.ledger.entry import LedgerEntry
+from embodiment.ledger.sqlite_ledger import SQLiteEmbodimentLedger
+
+
+def _entry(conditions=("overload", "contact")):
+    return LedgerEntry(
+        kind="pain",
+        regions=frozenset({"hand"}),
+        conditions=conditions,
+        support=3,
+        stability=0.7,
+        confidence=0.6,
+    )
+
+
+def test_entries_round_trip_through_the_file(tmp_path):
+    with SQLiteEmbodimentLedger(tmp_path / "ledger.db") as db:
+        db.add(_entry())
+    with SQLiteEmbodimentLedger(tmp_path / "ledger.db") as db:
+        assert tuple(db.entries()) == (_entry(),)
+        assert db.count() == 1
+        assert db.latest(("pain", frozenset({"hand"}), ("overload", "contact"))) == _entry()
+
+
+def test_add_is_committed_immediately(tmp_path):
+    db = SQLiteEmbodimentLedger(tmp_path / "ledger.db")
+    db.add(_entry())
+    other = sqlite3.connect(tmp_path / "ledger.db")
+    assert other.execute("SELECT entry_count, latest_count FROM summary").fetchone() == (1, 1)
+    other.close()
+    db.close()
@@ -0,0 +1,31 @@
+# tests/test_world_file.py
+
+import numpy as np
+import pytest
+
+from world.world_file import load_world, read_header, save_world
+from world.world_state import make_default_world
+
+
+def test_round_trip(tmp_path):
+    world = make_default_world(width=8, height=6, spawn=(2, 3))
+    world.add_wall_between((1, 1), (2, 1))
+    world.add_wall_between((0, 0), (5, 5))
+    save_world(world, tmp_path / "w.a7do")
+    loaded = load_world(tmp_path / "w.a7do")
+    assert loaded.has_wall_between((2, 1), (1, 1))
+    assert loaded.has_wall_between((0, 0), (5, 5))
+    np.testing.assert_array_equal(loaded.world_map.temperature, world.world_map.temperature)
+
+
+def test_read_only_load_rejects_writes(tmp_path):
+    save_world(make_default_world(), tmp_path / "w.a7do")
+    loaded = load_world(tmp_path / "w.a7do", mode="r")
+    with pytest.raises(ValueError):
+        loaded.world_map.temperature[0, 0] = 1.0
+
+
+def test_rejects_short_files(tmp_path):
+    (tmp_path / "empty.bin").write_bytes(b"")
+    with pytest.raises(ValueError):
+        read_header(tmp_path / "empty.bin")
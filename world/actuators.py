@@ -1,10 +1,11 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict, List, Tuple
+from typing import Dict, Iterable, List, Tuple
 
 from world.world_state import WorldEvent, WorldEventType, WorldState
-from world.physics import WorldPhysics
+from world.physics import MoveBatchResult, WorldPhysics
+from world.event_log import parse_id
 
 
 # ============================================================
@@ -41,6 +42,7 @@ class ActuatorSuite:
     def __init__(self, state: WorldState) -> None:
         self.state = state
         self.physics = WorldPhysics(state)
+        self._queue: List[ActionIntent] = []
 
     # --------------------------------------------------------
     # Public API
@@ -69,6 +71,78 @@ class ActuatorSuite:
         )
         return [e]
 
+    # --------------------------------------------------------
+    # Intent queue (batched)
+    # --------------------------------------------------------
+
+    def enqueue(self, intent: ActionIntent) -> None:
+        self._queue.append(intent)
+
+    def enqueue_many(self, intents: Iterable[ActionIntent]) -> None:
+        self._queue.extend(intents)
+
+    def pending(self) -> int:
+        return len(self._queue)
+
+    def flush(self) -> MoveBatchResult:
+        """
+        Apply every queued intent, in order.
+
+        Consecutive moves go through WorldPhysics.apply_moves in one
+        pass; anything else is applied singly. Once effort reaches
+        zero the rest of the queue is discarded. Contact is
+        recomputed once, at the end.
+        """
+        queue, self._queue = self._queue, []
+
+        applied = moved = blocked = illegal = 0
+        first_id = last_id = -1
+        exhausted = False
+
+        i = 0
+        while i < len(queue) and not exhausted:
+            if queue[i].name == "move":
+                j = i
+                while j < len(queue) and queue[j].name == "move":
+                    j += 1
+                deltas = [
+                    (int(q.payload.get("dx", 0)), int(q.payload.get("dy", 0)))
+                    for q in queue[i:j]
+                ]
+                r = self.physics.apply_moves(deltas, recompute_contact=False)
+                applied += r.applied
+                moved += r.moved
+                blocked += r.blocked
+                illegal += r.illegal
+                exhausted = r.exhausted
+                if r.first_event_id >= 0:
+                    if first_id < 0:
+                        first_id = r.first_event_id
+                    last_id = r.last_event_id
+                i = j
+            else:
+                e = self.apply(queue[i])[0]
+                n = parse_id(e.event_id)
+                if first_id < 0:
+                    first_id = n
+                last_id = n
+                applied += 1
+                illegal += 1
+                i += 1
+
+        self.physics.update_body()
+
+        return MoveBatchResult(
+            submitted=len(queue),
+            applied=applied,
+            moved=moved,
+            blocked=blocked,
+            illegal=illegal,
+            exhausted=exhausted,
+            first_event_id=first_id,
+            last_event_id=last_id,
+        )
+
     # --------------------------------------------------------
     # Move actuator
     # --------------------------------------------------------
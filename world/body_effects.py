@@ -3,7 +3,10 @@
 from __future__ import annotations
 from dataclasses import dataclass
 
+import numpy as np
+
 from world.world_state import WorldState, AgentBody
+from world.population import AgentPopulation
 
 
 # ============================================================
@@ -88,4 +91,48 @@ class BodyEffects:
         body.effort = max(
             0.0,
             min(1.0, body.effort + self.cfg.effort_recovery),
-        )
\ No newline at end of file
+        )
+
+    # --------------------------------------------------------
+    # ALL BODIES AT ONCE
+    # --------------------------------------------------------
+
+    def apply_many(
+        self,
+        world: WorldState,
+        population: AgentPopulation | None = None,
+    ) -> None:
+        """
+        Vectorized `apply` for every body of a population
+        (defaults to world.population).
+
+        Same arithmetic, same order, element-wise in float64:
+        each body ends exactly where `apply` would leave it.
+        """
+        pop = population if population is not None else world.population
+        if pop is None or pop.n == 0:
+            return
+
+        # ----------------------------------------------------
+        # ENVIRONMENT AT ALL LOCATIONS (one gather per field)
+        # ----------------------------------------------------
+        x, y = pop.x, pop.y
+        temperature = world.world_map.temperature[y, x].astype(np.float64)
+        noise = world.world_map.noise[y, x].astype(np.float64)
+
+        thermal = pop.thermal
+        pain = pop.pain
+        effort = pop.effort
+
+        # THERMAL EFFECT
+        thermal += (temperature - thermal) * self.cfg.thermal_gain
+
+        # PAIN FROM OVERLOAD (overloaded -> min(1, thermal), else decay)
+        overloaded = thermal > world.cfg.pain_threshold
+        pain[:] = np.where(overloaded, np.minimum(1.0, thermal), pain * 0.95)
+
+        # AUDITORY VIBRATION
+        effort -= noise * self.cfg.noise_gain
+
+        # METABOLIC RECOVERY
+        np.clip(effort + self.cfg.effort_recovery, 0.0, 1.0, out=effort)
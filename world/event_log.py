@@ -0,0 +1,592 @@
+# world/event_log.py
+
+from __future__ import annotations
+
+import string
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from world.world_state import WorldEvent, WorldEventType
+
+
+# ============================================================
+# WORLD EVENT LOG (Columnar, bounded)
+#
+# The world's history, stored as columns instead of objects.
+#
+# - int64 event id (monotonic), int8 type code
+# - int32 interned name code, int64 parent id (-1 = none)
+# - numeric payload packed into fixed float64 slots
+# - Ring buffer: oldest events are dropped once full
+#
+# Event objects and "w00000042" strings are built ONLY on request.
+# No semantics. No interpretation. Just retained truth.
+# ============================================================
+
+NO_PARENT = -1
+OVERFLOW_SCHEMA = -1      # payload kept as-is (not packable)
+
+TYPE_ORDER: Tuple[WorldEventType, ...] = tuple(WorldEventType)
+TYPE_CODES: Dict[WorldEventType, int] = {t: i for i, t in enumerate(TYPE_ORDER)}
+
+# Schema = ((key, kind, width), ...)
+#   kind: "f" float, "i" int, "b" bool, "s" interned str, "n" None,
+#         "ti" tuple of ints, "tf" tuple of floats
+Schema = Tuple[Tuple[str, str, int], ...]
+
+_SCALAR_KINDS: Dict[type, str] = {
+    type(None): "n",
+    bool: "b",
+    np.bool_: "b",
+    int: "i",
+    np.int32: "i",
+    np.int64: "i",
+    float: "f",
+    np.float32: "f",
+    np.float64: "f",
+    str: "s",
+}
+
+
+def format_id(n: int, prefix: str = "w") -> str:
+    return f"{prefix}{n:08d}"
+
+
+def parse_id(event_id: Optional[str]) -> int:
+    """
+    "w00000042" -> 42. None -> NO_PARENT.
+    """
+    if event_id is None:
+        return NO_PARENT
+    return int(event_id.lstrip(string.ascii_letters + "_"))
+
+
+class WorldEventLog:
+    """
+    Bounded, columnar event history.
+
+    Retention policy:
+    - At most `capacity` events are retained
+    - Appending beyond capacity overwrites the oldest event
+    - `dropped` counts how many events were evicted
+    """
+
+    def __init__(self, *, capacity: int = 16384, payload_slots: int = 8) -> None:
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+
+        self.capacity = int(capacity)
+        self.payload_slots = int(payload_slots)
+
+        self._ids = np.full(self.capacity, NO_PARENT, dtype=np.int64)
+        self._types = np.zeros(self.capacity, dtype=np.int8)
+        self._names = np.zeros(self.capacity, dtype=np.int32)
+        self._parents = np.full(self.capacity, NO_PARENT, dtype=np.int64)
+        self._schemas = np.zeros(self.capacity, dtype=np.int32)
+        self._payload = np.zeros((self.capacity, self.payload_slots), dtype=np.float64)
+
+        # Interning tables (append-only)
+        self._name_table: List[str] = []
+        self._name_codes: Dict[str, int] = {}
+        self._str_table: List[str] = []
+        self._str_codes: Dict[str, int] = {}
+        self._schema_table: List[Schema] = []
+        self._schema_codes: Dict[Schema, int] = {}
+
+        # Payloads that cannot be packed, keyed by event id
+        self._overflow: Dict[int, Dict[str, Any]] = {}
+
+        # Causal index: parent id -> child ids, child id -> parent id
+        self._children: Dict[int, List[int]] = {}
+        self._parent_of: Dict[int, int] = {}
+        self._evicted_upto = NO_PARENT
+
+        self._appended = 0
+        self._last_id = NO_PARENT
+
+    # --------------------------------------------------------
+    # Size / retention
+    # --------------------------------------------------------
+
+    def __len__(self) -> int:
+        return min(self._appended, self.capacity)
+
+    @property
+    def dropped(self) -> int:
+        return max(0, self._appended - self.capacity)
+
+    @property
+    def first_id(self) -> int:
+        if not len(self):
+            return NO_PARENT
+        return int(self._ids[self._segments()[0][0]])
+
+    @property
+    def last_id(self) -> int:
+        return self._last_id
+
+    def _segments(self) -> List[Tuple[int, int]]:
+        """
+        Slot ranges in chronological order (at most two).
+        """
+        if self._appended <= self.capacity:
+            return [(0, self._appended)]
+        head = self._appended % self.capacity
+        if head == 0:
+            return [(0, self.capacity)]
+        return [(head, self.capacity), (0, head)]
+
+    # --------------------------------------------------------
+    # Interning
+    # --------------------------------------------------------
+
+    def intern_name(self, name: str) -> int:
+        code = self._name_codes.get(name)
+        if code is None:
+            code = len(self._name_table)
+            self._name_table.append(name)
+            self._name_codes[name] = code
+        return code
+
+    def name_of(self, code: int) -> str:
+        return self._name_table[code]
+
+    def intern_str(self, s: str) -> int:
+        code = self._str_codes.get(s)
+        if code is None:
+            code = len(self._str_table)
+            self._str_table.append(s)
+            self._str_codes[s] = code
+        return code
+
+    def intern_schema(self, schema: Schema) -> int:
+        code = self._schema_codes.get(schema)
+        if code is None:
+            if sum(w for _, _, w in schema) > self.payload_slots:
+                return OVERFLOW_SCHEMA
+            code = len(self._schema_table)
+            self._schema_table.append(schema)
+            self._schema_codes[schema] = code
+        return code
+
+    # --------------------------------------------------------
+    # Payload packing
+    # --------------------------------------------------------
+
+    def _pack(self, payload: Dict[str, Any]) -> Tuple[int, Optional[List[float]]]:
+        schema: List[Tuple[str, str, int]] = []
+        values: List[float] = []
+
+        for key, v in payload.items():
+            kind = _SCALAR_KINDS.get(type(v))
+            if kind == "n":
+                schema.append((key, "n", 0))
+            elif kind == "s":
+                schema.append((key, "s", 1))
+                values.append(float(self.intern_str(v)))
+            elif kind is not None:
+                schema.append((key, kind, 1))
+                values.append(float(v))
+            elif type(v) is tuple and v:
+                elem = {_SCALAR_KINDS.get(type(c)) for c in v}
+                if elem == {"i"}:
+                    kind = "ti"
+                elif elem <= {"i", "f"}:
+                    kind = "tf"
+                else:
+                    return OVERFLOW_SCHEMA, None
+                schema.append((key, kind, len(v)))
+                values.extend(float(c) for c in v)
+            else:
+                return OVERFLOW_SCHEMA, None
+
+        code = self.intern_schema(tuple(schema))
+        if code == OVERFLOW_SCHEMA:
+            return OVERFLOW_SCHEMA, None
+        return code, values
+
+    def _unpack(self, schema_code: int, row: np.ndarray) -> Dict[str, Any]:
+        out: Dict[str, Any] = {}
+        i = 0
+        for key, kind, width in self._schema_table[schema_code]:
+            if kind == "n":
+                out[key] = None
+            elif kind == "b":
+                out[key] = bool(row[i])
+            elif kind == "i":
+                out[key] = int(row[i])
+            elif kind == "f":
+                out[key] = float(row[i])
+            elif kind == "s":
+                out[key] = self._str_table[int(row[i])]
+            elif kind == "ti":
+                out[key] = tuple(int(c) for c in row[i:i + width])
+            else:
+                out[key] = tuple(float(c) for c in row[i:i + width])
+            i += width
+        return out
+
+    # --------------------------------------------------------
+    # Append
+    # --------------------------------------------------------
+
+    def _claim(self, event_id: int) -> int:
+        if event_id <= self._last_id:
+            raise ValueError(
+                f"event ids must increase: {event_id} after {self._last_id}"
+            )
+        slot = self._appended % self.capacity
+        if self._appended >= self.capacity:
+            self._evict_slot(slot)
+        self._appended += 1
+        self._last_id = event_id
+        return slot
+
+    def append(
+        self,
+        event_id: int,
+        type: WorldEventType,
+        name: str,
+        payload: Dict[str, Any],
+        parent_id: int = NO_PARENT,
+    ) -> int:
+        """
+        Record one event. Returns the slot written.
+        """
+        schema_code, values = self._pack(payload)
+        slot = self._claim(event_id)
+
+        self._ids[slot] = event_id
+        self._types[slot] = TYPE_CODES[type]
+        self._names[slot] = self.intern_name(name)
+        self._parents[slot] = parent_id
+        self._schemas[slot] = schema_code
+
+        if values is None:
+            self._overflow[event_id] = dict(payload)
+        else:
+            row = self._payload[slot]
+            n = len(values)
+            row[:n] = values
+            row[n:] = 0.0
+
+        if parent_id > self._evicted_upto:
+            self._link(event_id, parent_id)
+
+        return slot
+
+    def append_columns(
+        self,
+        *,
+        ids: np.ndarray,
+        type_codes: np.ndarray,
+        name_codes: np.ndarray,
+        parent_ids: np.ndarray,
+        schema_codes: np.ndarray,
+        values: np.ndarray,
+    ) -> None:
+        """
+        Bulk append of pre-packed rows (chronological order).
+
+        schema_codes must come from intern_schema (no overflow rows).
+        """
+        n = int(ids.shape[0])
+        if n == 0:
+            return
+        if int(ids[0]) <= self._last_id or (n > 1 and np.any(np.diff(ids) <= 0)):
+            raise ValueError("event ids must increase")
+        if np.any(schema_codes < 0) or np.any(schema_codes >= len(self._schema_table)):
+            raise ValueError("schema codes must come from intern_schema (no overflow)")
+        if values.ndim == 2 and values.shape[1] > self.payload_slots:
+            raise ValueError("values wider than payload_slots")
+
+        # Only the newest `capacity` rows can survive
+        if n > self.capacity:
+            skip = n - self.capacity
+            self._evict_range(self._appended, skip)
+            self._evicted_upto = max(self._evicted_upto, int(ids[skip - 1]))
+            self._appended += skip
+            ids, type_codes, name_codes = ids[skip:], type_codes[skip:], name_codes[skip:]
+            parent_ids, schema_codes, values = parent_ids[skip:], schema_codes[skip:], values[skip:]
+            n = self.capacity
+
+        self._evict_range(self._appended, n)
+
+        start = self._appended % self.capacity
+        slots = (start + np.arange(n)) % self.capacity
+        width = values.shape[1] if values.ndim == 2 else 0
+
+        self._ids[slots] = ids
+        self._types[slots] = type_codes
+        self._names[slots] = name_codes
+        self._parents[slots] = parent_ids
+        self._schemas[slots] = schema_codes
+        self._payload[slots] = 0.0
+        if width:
+            self._payload[slots, :width] = values
+
+        self._appended += n
+        self._last_id = int(ids[-1])
+
+        linked = parent_ids > self._evicted_upto
+        if linked.any():
+            for child, parent in zip(ids[linked].tolist(), parent_ids[linked].tolist()):
+                self._link(child, parent)
+
+    def _evict_slot(self, slot: int) -> None:
+        old = int(self._ids[slot])
+        self._evicted_upto = old
+        if self._schemas[slot] == OVERFLOW_SCHEMA:
+            self._overflow.pop(old, None)
+        self._unlink(old)
+
+    def _evict_range(self, start: int, n: int) -> None:
+        """
+        Evict whatever occupies the slots of appends [start, start + n).
+        """
+        first = max(start, self.capacity)
+        if start + n <= first:
+            return
+        slots = np.arange(first, start + n) % self.capacity
+        self._evicted_upto = max(self._evicted_upto, int(self._ids[slots].max()))
+        if not (self._overflow or self._children or self._parent_of):
+            return
+        for old in self._ids[slots].tolist():
+            self._overflow.pop(old, None)
+            self._unlink(old)
+
+    # --------------------------------------------------------
+    # Causal index (parent -> children)
+    #
+    # Maintained on append, trimmed on eviction.
+    # A link is only indexed while its parent is retained.
+    # --------------------------------------------------------
+
+    def _link(self, child: int, parent: int) -> None:
+        kids = self._children.get(parent)
+        if kids is None:
+            self._children[parent] = [child]
+        else:
+            kids.append(child)
+        self._parent_of[child] = parent
+
+    def _unlink(self, old: int) -> None:
+        for child in self._children.pop(old, ()):
+            self._parent_of.pop(child, None)
+        self._parent_of.pop(old, None)
+
+    def children(self, event_id: int) -> Tuple[int, ...]:
+        """
+        Direct outcomes of an event. O(1).
+        """
+        return tuple(self._children.get(event_id, ()))
+
+    def parent(self, event_id: int) -> int:
+        return self._parent_of.get(event_id, NO_PARENT)
+
+    def root(self, event_id: int) -> int:
+        """
+        Oldest retained ancestor of an event (itself if unlinked).
+        """
+        while True:
+            parent = self._parent_of.get(event_id)
+            if parent is None:
+                return event_id
+            event_id = parent
+
+    def chain(self, event_id: int) -> List[int]:
+        """
+        Ancestry from root down to event_id.
+        """
+        out = [event_id]
+        parent = self._parent_of.get(event_id)
+        while parent is not None:
+            out.append(parent)
+            parent = self._parent_of.get(parent)
+        out.reverse()
+        return out
+
+    def descendants(self, event_id: int) -> List[int]:
+        """
+        All retained events caused (transitively) by event_id, breadth-first.
+        """
+        out: List[int] = []
+        frontier = list(self._children.get(event_id, ()))
+        while frontier:
+            out.extend(frontier)
+            nxt: List[int] = []
+            for e in frontier:
+                nxt.extend(self._children.get(e, ()))
+            frontier = nxt
+        return out
+
+    # --------------------------------------------------------
+    # Accounting queries (vectorized)
+    # --------------------------------------------------------
+
+    def linked_outcome_ratio(
+        self,
+        *,
+        lo: Optional[int] = None,
+        hi: Optional[int] = None,
+    ) -> float:
+        """
+        Fraction of OUTCOME events in [lo, hi) tied to a parent action.
+
+        Same quantity Accountant.summarize reports as coherence.
+        """
+        slots = self._slots_between(lo, hi)
+        outcomes = self._types[slots] == TYPE_CODES[WorldEventType.OUTCOME]
+        total = int(outcomes.sum())
+        if total == 0:
+            return 0.0
+        linked = int((self._parents[slots][outcomes] != NO_PARENT).sum())
+        return linked / total
+
+    def rolling_linked_outcome_ratio(self, window: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Linked-outcome ratio over the trailing `window` events,
+        evaluated at every retained event.
+
+        Returns (event_ids, ratios). Windows with no outcomes yield 0.0.
+        """
+        if window <= 0:
+            raise ValueError("window must be positive")
+        slots = self._slots_between(None, None)
+        outcomes = self._types[slots] == TYPE_CODES[WorldEventType.OUTCOME]
+        linked = outcomes & (self._parents[slots] != NO_PARENT)
+
+        out_c = np.concatenate(([0], np.cumsum(outcomes)))
+        link_c = np.concatenate(([0], np.cumsum(linked)))
+        end = np.arange(1, slots.shape[0] + 1)
+        start = np.maximum(0, end - window)
+
+        totals = out_c[end] - out_c[start]
+        hits = link_c[end] - link_c[start]
+        ratios = np.divide(
+            hits, totals,
+            out=np.zeros(totals.shape[0], dtype=np.float64),
+            where=totals > 0,
+        )
+        return self._ids[slots], ratios
+
+    # --------------------------------------------------------
+    # Range queries (vectorized, return id arrays)
+    # --------------------------------------------------------
+
+    def _slots_between(self, lo: Optional[int], hi: Optional[int]) -> np.ndarray:
+        """
+        Slots holding ids in [lo, hi), chronological.
+        """
+        parts: List[np.ndarray] = []
+        for a, b in self._segments():
+            seg = self._ids[a:b]
+            i = 0 if lo is None else int(np.searchsorted(seg, lo, "left"))
+            j = seg.shape[0] if hi is None else int(np.searchsorted(seg, hi, "left"))
+            if j > i:
+                parts.append(np.arange(a + i, a + j))
+        if not parts:
+            return np.empty(0, dtype=np.int64)
+        if len(parts) == 1:
+            return parts[0]
+        return np.concatenate(parts)
+
+    def select(
+        self,
+        *,
+        lo: Optional[int] = None,
+        hi: Optional[int] = None,
+        type: Optional[WorldEventType] = None,
+        name: Optional[str] = None,
+    ) -> np.ndarray:
+        """
+        Event ids in [lo, hi) optionally filtered by type and/or name.
+        """
+        slots = self._slots_between(lo, hi)
+        if type is not None:
+            slots = slots[self._types[slots] == TYPE_CODES[type]]
+        if name is not None:
+            code = self._name_codes.get(name)
+            if code is None:
+                return np.empty(0, dtype=np.int64)
+            slots = slots[self._names[slots] == code]
+        return self._ids[slots]
+
+    def columns(
+        self,
+        *,
+        lo: Optional[int] = None,
+        hi: Optional[int] = None,
+    ) -> Dict[str, np.ndarray]:
+        """
+        Column copies for ids in [lo, hi), chronological.
+        """
+        slots = self._slots_between(lo, hi)
+        return {
+            "id": self._ids[slots],
+            "type": self._types[slots],
+            "name": self._names[slots],
+            "parent": self._parents[slots],
+        }
+
+    def slot_of(self, event_id: int) -> int:
+        """
+        Slot holding event_id, or -1 if not retained.
+        """
+        for a, b in self._segments():
+            seg = self._ids[a:b]
+            i = int(np.searchsorted(seg, event_id, "left"))
+            if i < seg.shape[0] and seg[i] == event_id:
+                return a + i
+        return -1
+
+    # --------------------------------------------------------
+    # Materialization (on request only)
+    # --------------------------------------------------------
+
+    def event(self, event_id: int, prefix: str = "w") -> Optional[WorldEvent]:
+        slot = self.slot_of(event_id)
+        if slot < 0:
+            return None
+        return self._materialize(slot, prefix)
+
+    def events(self, ids: Iterable[int], prefix: str = "w") -> List[WorldEvent]:
+        out: List[WorldEvent] = []
+        for eid in ids:
+            e = self.event(int(eid), prefix)
+            if e is not None:
+                out.append(e)
+        return out
+
+    def _materialize(self, slot: int, prefix: str) -> WorldEvent:
+        eid = int(self._ids[slot])
+        schema = int(self._schemas[slot])
+        if schema == OVERFLOW_SCHEMA:
+            payload = dict(self._overflow.get(eid, {}))
+        else:
+            payload = self._unpack(schema, self._payload[slot])
+        parent = int(self._parents[slot])
+
+        return WorldEvent(
+            event_id=format_id(eid, prefix),
+            type=TYPE_ORDER[int(self._types[slot])],
+            name=self._name_table[int(self._names[slot])],
+            payload=payload,
+            parent_id=None if parent == NO_PARENT else format_id(parent, prefix),
+        )
+
+    # --------------------------------------------------------
+    # Snapshot (UI / debugging only)
+    # --------------------------------------------------------
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "retained": len(self),
+            "capacity": self.capacity,
+            "dropped": self.dropped,
+            "first_id": self.first_id,
+            "last_id": self.last_id,
+            "names": len(self._name_table),
+            "linked": len(self._parent_of),
+        }
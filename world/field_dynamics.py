@@ -0,0 +1,237 @@
+# world/field_dynamics.py
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from world.world_state import WorldState
+
+
+# ============================================================
+# FIELD DYNAMICS — ENVIRONMENT ONLY
+#
+# Heat and sound spread and fade across the world grid.
+#
+# - Operates on WorldMap NumPy fields in place
+# - Walls block propagation (no flux across a wall edge)
+# - World boundary is a hard wall (no flux out of the grid)
+# - Only dirty rectangles are updated; a quiet world costs nothing
+#
+# No agents. No sensors. No semantics.
+# ============================================================
+
+DYNAMIC_FIELDS: Tuple[str, ...] = ("temperature", "noise")
+
+# (y0, y1, x0, x1), half-open, grid coordinates
+Rect = Tuple[int, int, int, int]
+
+
+@dataclass
+class FieldDynamicsConfig:
+    """
+    Explicit 5-point stencil constants.
+
+    Diffusion rates must stay <= 0.25 for the explicit
+    scheme to remain stable.
+    """
+    temperature_diffusion: float = 0.20
+    temperature_decay: float = 0.01    # fraction of deviation lost per tick
+    noise_diffusion: float = 0.24
+    noise_decay: float = 0.15          # sound fades much faster than heat
+
+    epsilon: float = 1e-4              # deviation below this is "settled"
+
+    def rates(self, name: str) -> Tuple[float, float]:
+        if name == "temperature":
+            return self.temperature_diffusion, self.temperature_decay
+        if name == "noise":
+            return self.noise_diffusion, self.noise_decay
+        raise KeyError(f"field has no dynamics: {name}")
+
+
+class FieldDynamics:
+    """
+    Optional environment stage driven by WorldRunner.step.
+
+    The static map captured at construction is the baseline.
+    Dynamics evolve only the *deviation* from that baseline:
+    diffusion spreads it, decay relaxes it back to zero.
+    """
+
+    def __init__(
+        self,
+        world: WorldState,
+        cfg: FieldDynamicsConfig | None = None,
+    ) -> None:
+        self.world = world
+        self.cfg = cfg or FieldDynamicsConfig()
+
+        for name in DYNAMIC_FIELDS:
+            diffusion, decay = self.cfg.rates(name)
+            if not 0.0 <= diffusion <= 0.25:
+                raise ValueError(
+                    f"{name} diffusion {diffusion} outside stable range [0, 0.25]"
+                )
+            if not 0.0 <= decay <= 1.0:
+                raise ValueError(f"{name} decay {decay} outside [0, 1]")
+
+        self._baseline: Dict[str, np.ndarray] = {}
+        self._dirty: Dict[str, Optional[Rect]] = {}
+        self._sources: Dict[Tuple[str, int, int], float] = {}
+        self._buffers: Dict[str, np.ndarray] = {}
+
+        self.rebase()
+
+    # --------------------------------------------------------
+    # Baseline
+    # --------------------------------------------------------
+
+    def rebase(self, name: Optional[str] = None) -> None:
+        """
+        Adopt the current field values as the resting state.
+        """
+        names = DYNAMIC_FIELDS if name is None else (name,)
+        for n in names:
+            self._baseline[n] = self.world.world_map.field(n).copy()
+            self._dirty[n] = None
+
+    # --------------------------------------------------------
+    # Perturbations
+    # --------------------------------------------------------
+
+    def inject(self, name: str, x: int, y: int, amount: float) -> None:
+        """
+        One-shot impulse added to a single cell.
+        """
+        if name not in DYNAMIC_FIELDS:
+            raise KeyError(f"field has no dynamics: {name}")
+        if not self.world.in_bounds(x, y):
+            return
+        self.world.world_map.field(name)[y, x] += amount
+        self.mark_dirty(name, (y, y + 1, x, x + 1))
+
+    def add_source(self, name: str, x: int, y: int, level: float) -> None:
+        """
+        Persistent source: the cell is held at `level` every tick.
+        """
+        if name not in DYNAMIC_FIELDS:
+            raise KeyError(f"field has no dynamics: {name}")
+        if not self.world.in_bounds(x, y):
+            return
+        self._sources[(name, x, y)] = float(level)
+        self.mark_dirty(name, (y, y + 1, x, x + 1))
+
+    def remove_source(self, name: str, x: int, y: int) -> None:
+        self._sources.pop((name, x, y), None)
+
+    def mark_dirty(self, name: str, rect: Rect) -> None:
+        """
+        Declare that a region of a field was written externally.
+        """
+        self._dirty[name] = _union(self._dirty[name], rect)
+
+    # --------------------------------------------------------
+    # Tick
+    # --------------------------------------------------------
+
+    def step(self) -> None:
+        for (name, x, y), level in self._sources.items():
+            self.world.world_map.field(name)[y, x] = level
+            self._dirty[name] = _union(self._dirty[name], (y, y + 1, x, x + 1))
+
+        for name in DYNAMIC_FIELDS:
+            rect = self._dirty[name]
+            if rect is not None:
+                self._dirty[name] = self._step_region(name, rect)
+
+    def active_region(self, name: str) -> Optional[Rect]:
+        return self._dirty[name]
+
+    # --------------------------------------------------------
+    # Stencil over one dirty window
+    # --------------------------------------------------------
+
+    def _step_region(self, name: str, rect: Rect) -> Optional[Rect]:
+        h, w = self.world.cfg.height, self.world.cfg.width
+        diffusion, decay = self.cfg.rates(name)
+
+        # Grow by one cell: that is as far as anything can spread this tick.
+        y0, y1, x0, x1 = rect
+        y0, y1 = max(0, y0 - 1), min(h, y1 + 1)
+        x0, x1 = max(0, x0 - 1), min(w, x1 + 1)
+
+        ny, nx = y1 - y0, x1 - x0
+        u = self.world.world_map.field(name)[y0:y1, x0:x1]
+        base = self._baseline[name][y0:y1, x0:x1]
+
+        # Scratch views: no per-tick allocation on large windows
+        d = self._scratch("d", u.dtype)[:ny, :nx]
+        np.subtract(u, base, out=d)
+
+        if diffusion > 0.0:
+            fx = self._scratch("fx", u.dtype)[:ny, :nx - 1]
+            fy = self._scratch("fy", u.dtype)[:ny - 1, :nx]
+            np.subtract(d[:, 1:], d[:, :-1], out=fx)
+            np.subtract(d[1:, :], d[:-1, :], out=fy)
+            fx *= diffusion
+            fy *= diffusion
+
+            if self.world.wall_count:
+                fx[self.world.wall_x[y0:y1, x0:x1 - 1]] = 0.0
+                fy[self.world.wall_y[y0:y1 - 1, x0:x1]] = 0.0
+
+            d[:, :-1] += fx
+            d[:, 1:] -= fx
+            d[:-1, :] += fy
+            d[1:, :] -= fy
+
+        if decay > 0.0:
+            d *= 1.0 - decay
+
+        mag = self._scratch("fx", u.dtype)[:ny, :nx]
+        settled = self._scratch("settled", bool)[:ny, :nx]
+        np.abs(d, out=mag)
+        np.less_equal(mag, self.cfg.epsilon, out=settled)
+        np.copyto(d, 0.0, where=settled)
+        np.add(base, d, out=u)
+
+        active_rows = ~settled.all(axis=1)
+        active_cols = ~settled.all(axis=0)
+        rows = np.flatnonzero(active_rows)
+        if rows.size == 0:
+            return None
+        cols = np.flatnonzero(active_cols)
+
+        return (
+            y0 + int(rows[0]),
+            y0 + int(rows[-1]) + 1,
+            x0 + int(cols[0]),
+            x0 + int(cols[-1]) + 1,
+        )
+
+    def _scratch(self, key: str, dtype) -> np.ndarray:
+        shape = (self.world.cfg.height, self.world.cfg.width)
+        buf = self._buffers.get(key)
+        if buf is None or buf.dtype != dtype:
+            buf = np.empty(shape, dtype=dtype)
+            self._buffers[key] = buf
+        return buf
+
+    # --------------------------------------------------------
+    # Snapshot (UI / debugging only)
+    # --------------------------------------------------------
+
+    def snapshot(self) -> Dict[str, object]:
+        return {
+            "active": {n: self._dirty[n] for n in DYNAMIC_FIELDS},
+            "sources": len(self._sources),
+        }
+
+
+def _union(a: Optional[Rect], b: Rect) -> Rect:
+    if a is None:
+        return b
+    return (min(a[0], b[0]), max(a[1], b[1]), min(a[2], b[2]), max(a[3], b[3]))
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict, Tuple
+from typing import Dict, Optional, Tuple
+
+import numpy as np
 
 from world.layouts.town.profile import TownProfile
 
@@ -17,6 +19,17 @@ class EnvironmentCell:
     light: float = 0.0
 
 
+# ============================================================
+# FIELD LAYOUT
+#
+# Environment fields are dense NumPy arrays indexed [y, x]
+# (row = y, column = x). One array per physical quantity.
+# ============================================================
+
+FIELD_NAMES: Tuple[str, ...] = ("temperature", "noise", "light")
+FIELD_DTYPE = np.float32
+
+
 # ============================================================
 # WORLD MAP (2D PHYSICAL LAYOUT)
 # ============================================================
@@ -33,12 +46,31 @@ class WorldMap:
         width: int,
         height: int,
         town: TownProfile,
-        cells: Dict[Tuple[int, int], EnvironmentCell],
+        cells: Optional[Dict[Tuple[int, int], EnvironmentCell]] = None,
+        fields: Optional[Dict[str, np.ndarray]] = None,
     ) -> None:
         self.width = width
         self.height = height
         self.town = town
-        self._cells = cells
+
+        self.fields: Dict[str, np.ndarray] = {}
+        for name in FIELD_NAMES:
+            arr = None if fields is None else fields.get(name)
+            if arr is None:
+                arr = np.zeros((height, width), dtype=FIELD_DTYPE)
+            elif arr.shape != (height, width):
+                raise ValueError(
+                    f"field '{name}' has shape {arr.shape}, "
+                    f"expected {(height, width)}"
+                )
+            self.fields[name] = arr
+
+        if cells:
+            for (x, y), cell in cells.items():
+                if 0 <= x < width and 0 <= y < height:
+                    self.temperature[y, x] = cell.temperature
+                    self.noise[y, x] = cell.noise
+                    self.light[y, x] = cell.light
 
     # --------------------------------------------------------
     # REQUIRED CONSTRUCTOR ✅
@@ -52,26 +84,51 @@ class WorldMap:
         """
         town = TownProfile.default()
 
-        cells: Dict[Tuple[int, int], EnvironmentCell] = {}
-
-        for x in range(width):
-            for y in range(height):
-                cells[(x, y)] = EnvironmentCell(
-                    temperature=town.base_temperature,
-                    noise=0.0,
-                    light=0.0,
-                )
+        fields = {
+            "temperature": np.full(
+                (height, width), town.base_temperature, dtype=FIELD_DTYPE
+            ),
+            "noise": np.zeros((height, width), dtype=FIELD_DTYPE),
+            "light": np.zeros((height, width), dtype=FIELD_DTYPE),
+        }
 
         return cls(
             width=width,
             height=height,
             town=town,
-            cells=cells,
+            fields=fields,
         )
 
+    # --------------------------------------------------------
+    # FIELD ACCESS
+    # --------------------------------------------------------
+
+    @property
+    def temperature(self) -> np.ndarray:
+        return self.fields["temperature"]
+
+    @property
+    def noise(self) -> np.ndarray:
+        return self.fields["noise"]
+
+    @property
+    def light(self) -> np.ndarray:
+        return self.fields["light"]
+
+    def field(self, name: str) -> np.ndarray:
+        if name not in self.fields:
+            raise KeyError(f"unknown environment field: {name}")
+        return self.fields[name]
+
     # --------------------------------------------------------
     # ENVIRONMENT ACCESS
     # --------------------------------------------------------
 
     def environment_at(self, x: int, y: int) -> EnvironmentCell:
-        return self._cells.get((x, y), EnvironmentCell())
\ No newline at end of file
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return EnvironmentCell()
+        return EnvironmentCell(
+            temperature=float(self.temperature[y, x]),
+            noise=float(self.noise[y, x]),
+            light=float(self.light[y, x]),
+        )
@@ -1,9 +1,13 @@
 from __future__ import annotations
 
-from typing import List, Tuple
+from dataclasses import dataclass
+from typing import List, Sequence, Tuple, Union
+
+import numpy as np
 
 from world.world_state import WorldEventType, WorldEvent, WorldState
 from world.space import GridSpace, Vec2
+from world.event_log import NO_PARENT, TYPE_CODES
 
 
 # ============================================================
@@ -15,6 +19,35 @@ from world.space import GridSpace, Vec2
 # ============================================================
 
 
+@dataclass(frozen=True)
+class MoveBatchResult:
+    """
+    Structural summary of a batched move sequence.
+
+    Events themselves live in state.events, ids in
+    [first_event_id, last_event_id] (-1 when nothing was emitted).
+    """
+    submitted: int
+    applied: int
+    moved: int
+    blocked: int
+    illegal: int
+    exhausted: bool
+    first_event_id: int
+    last_event_id: int
+
+
+@dataclass(frozen=True)
+class PopulationStepResult:
+    """
+    Structural summary of one population step.
+    Population steps are silent: no per-body events are emitted.
+    """
+    moved: int
+    blocked: int
+    illegal: int
+
+
 class WorldPhysics:
     """
     Deterministic physics engine.
@@ -88,6 +121,303 @@ class WorldPhysics:
             )
             events.append(outcome)
 
+        self.update_body()
+
+        return events
+
+    # --------------------------------------------------------
+    # Batched action application
+    # --------------------------------------------------------
+
+    def apply_moves(
+        self,
+        deltas: Union[Sequence[Vec2], np.ndarray],
+        *,
+        recompute_contact: bool = True,
+    ) -> MoveBatchResult:
+        """
+        Apply a whole move sequence in one pass.
+
+        Per move, the same ACTION / OUTCOME pair as apply_move is
+        recorded (non-unit vectors yield SYSTEM illegal_move_vector),
+        but events are written to state.events in one bulk append
+        and no WorldEvent objects are built.
+
+        Stops as soon as effort reaches zero.
+        Contact / thermal / pain are refreshed once at the end
+        (or never, if recompute_contact=False; see update_body).
+        """
+        state = self.state
+        cfg = state.cfg
+        agent = state.agent
+        log = state.events
+
+        d = np.asarray(deltas, dtype=np.int64).reshape(-1, 2)
+        legal = (np.abs(d).sum(axis=1) == 1).tolist()
+
+        w, h = cfg.width, cfg.height
+        wall_x, wall_y = state.wall_x, state.wall_y
+        check_walls = state.wall_count > 0
+        pop = state.population
+        occupancy = pop.occupancy if pop is not None and pop.n else None
+
+        t_act = TYPE_CODES[WorldEventType.ACTION]
+        t_out = TYPE_CODES[WorldEventType.OUTCOME]
+        t_sys = TYPE_CODES[WorldEventType.SYSTEM]
+        n_move = log.intern_name("move")
+        n_moved = log.intern_name("moved")
+        n_blocked = log.intern_name("blocked")
+        n_illegal = log.intern_name("illegal_move_vector")
+        s_act = log.intern_schema((("dx", "i", 1), ("dy", "i", 1), ("from", "ti", 2)))
+        s_moved = log.intern_schema((("to", "ti", 2), ("cost", "f", 1)))
+        s_blocked = log.intern_schema(
+            (("reason", "s", 1), ("attempted_delta", "ti", 2), ("cost", "f", 1))
+        )
+        s_illegal = log.intern_schema((("dx", "i", 1), ("dy", "i", 1)))
+        r_boundary = float(log.intern_str("blocked_by_boundary"))
+        r_wall = float(log.intern_str("blocked_by_wall"))
+        r_body = float(log.intern_str("blocked_by_body"))
+        move_cost = cfg.move_cost
+        block_cost = cfg.block_cost
+
+        types: List[int] = []
+        names: List[int] = []
+        parents: List[int] = []
+        schemas: List[int] = []
+        values: List[Tuple[float, float, float, float]] = []
+
+        x, y = agent.x, agent.y
+        effort = agent.effort
+        eid = state._event_counter
+        applied = moved = blocked = illegal = 0
+        exhausted = effort <= 0.0
+
+        for (dx, dy), ok in zip(d.tolist(), legal):
+            if exhausted:
+                break
+            applied += 1
+
+            if not ok:
+                eid += 1
+                types.append(t_sys)
+                names.append(n_illegal)
+                parents.append(NO_PARENT)
+                schemas.append(s_illegal)
+                values.append((dx, dy, 0.0, 0.0))
+                illegal += 1
+                continue
+
+            # --- ACTION ---
+            eid += 1
+            act_id = eid
+            types.append(t_act)
+            names.append(n_move)
+            parents.append(NO_PARENT)
+            schemas.append(s_act)
+            values.append((dx, dy, x, y))
+
+            # --- PHYSICS CHECK (bounds, then wall edge) ---
+            nx, ny = x + dx, y + dy
+            if not (0 <= nx < w and 0 <= ny < h):
+                reason = r_boundary
+            elif check_walls and (
+                wall_x[y, min(x, nx)] if dy == 0 else wall_y[min(y, ny), x]
+            ):
+                reason = r_wall
+            elif occupancy is not None and occupancy[ny, nx] >= 0:
+                reason = r_body
+            else:
+                reason = None
+
+            # --- OUTCOME ---
+            eid += 1
+            types.append(t_out)
+            parents.append(act_id)
+            if reason is None:
+                x, y = nx, ny
+                effort = max(0.0, effort - move_cost)
+                names.append(n_moved)
+                schemas.append(s_moved)
+                values.append((x, y, move_cost, 0.0))
+                moved += 1
+            else:
+                effort = max(0.0, effort - block_cost)
+                names.append(n_blocked)
+                schemas.append(s_blocked)
+                values.append((reason, dx, dy, block_cost))
+                blocked += 1
+
+            exhausted = effort <= 0.0
+
+        first_id = state._event_counter + 1 if types else NO_PARENT
+        last_id = eid if types else NO_PARENT
+
+        if types:
+            log.append_columns(
+                ids=np.arange(first_id, eid + 1, dtype=np.int64),
+                type_codes=np.array(types, dtype=np.int8),
+                name_codes=np.array(names, dtype=np.int32),
+                parent_ids=np.array(parents, dtype=np.int64),
+                schema_codes=np.array(schemas, dtype=np.int32),
+                values=np.array(values, dtype=np.float64),
+            )
+            state._event_counter = eid
+
+        agent.x, agent.y = x, y
+        agent.effort = effort
+
+        if recompute_contact:
+            self.update_body()
+
+        return MoveBatchResult(
+            submitted=int(d.shape[0]),
+            applied=applied,
+            moved=moved,
+            blocked=blocked,
+            illegal=illegal,
+            exhausted=exhausted,
+            first_event_id=first_id,
+            last_event_id=last_id,
+        )
+
+    # --------------------------------------------------------
+    # Population step (all bodies, one vectorized pass)
+    # --------------------------------------------------------
+
+    def step_population(self, deltas: np.ndarray) -> PopulationStepResult:
+        """
+        Move every population body by its (dx, dy) simultaneously.
+
+        Rules (same costs as apply_move):
+        - (0, 0) means stay; no cost
+        - non-unit vectors are rejected; no cost
+        - destination must be in bounds, not behind a wall, and
+          free of bodies (and of the primary agent) at step start
+        - when several bodies target one cell, the lowest index wins
+        - losers and blocked bodies pay block_cost
+        """
+        state = self.state
+        cfg = state.cfg
+        pop = state.population
+        if pop is None or pop.n == 0:
+            return PopulationStepResult(moved=0, blocked=0, illegal=0)
+
+        n = pop.n
+        w, h = cfg.width, cfg.height
+        d = np.asarray(deltas, dtype=np.int64).reshape(n, 2)
+        dx, dy = d[:, 0], d[:, 1]
+        x = pop.x.astype(np.int64)
+        y = pop.y.astype(np.int64)
+
+        active = (dx != 0) | (dy != 0)
+        legal = (np.abs(dx) + np.abs(dy)) == 1
+        illegal = active & ~legal
+
+        nx, ny = x + dx, y + dy
+        ok = legal & (nx >= 0) & (nx < w) & (ny >= 0) & (ny < h)
+
+        # Wall edges (indices clipped; masked by `ok` afterwards)
+        if state.wall_count:
+            horiz = ok & (dy == 0)
+            vert = ok & (dx == 0)
+            ex = np.minimum(x, nx)
+            ey = np.minimum(y, ny)
+            if state.wall_x.size:
+                hit = np.zeros(n, dtype=bool)
+                hit[horiz] = state.wall_x[y[horiz], ex[horiz]]
+                ok &= ~hit
+            if state.wall_y.size:
+                hit = np.zeros(n, dtype=bool)
+                hit[vert] = state.wall_y[ey[vert], x[vert]]
+                ok &= ~hit
+
+        # Occupied at step start (bodies + primary agent)
+        cx = np.clip(nx, 0, w - 1)
+        cy = np.clip(ny, 0, h - 1)
+        ok &= pop.occupancy[cy, cx] == -1
+        agent = state.agent
+        ok &= ~((nx == agent.x) & (ny == agent.y))
+
+        # Same-target conflicts: lowest index wins
+        idx = np.flatnonzero(ok)
+        if idx.size:
+            _, first = np.unique(ny[idx] * w + nx[idx], return_index=True)
+            keep = np.zeros(idx.size, dtype=bool)
+            keep[first] = True
+            ok[idx[~keep]] = False
+
+        blocked = legal & ~ok
+
+        # Apply
+        mv = np.flatnonzero(ok)
+        pop.occupancy[y[mv], x[mv]] = -1
+        pop.occupancy[ny[mv], nx[mv]] = mv
+        pop.x[mv] = nx[mv]
+        pop.y[mv] = ny[mv]
+
+        effort = pop.effort
+        effort[ok] -= cfg.move_cost
+        effort[blocked] -= cfg.block_cost
+        np.maximum(effort, 0.0, out=effort)
+
+        self.update_population_bodies()
+        pop.rebuild_hash()
+
+        return PopulationStepResult(
+            moved=int(mv.size),
+            blocked=int(blocked.sum()),
+            illegal=int(illegal.sum()),
+        )
+
+    def update_population_bodies(self) -> None:
+        """
+        Vectorized update_body for every population body.
+        """
+        state = self.state
+        cfg = state.cfg
+        pop = state.population
+        if pop is None or pop.n == 0:
+            return
+
+        w, h = cfg.width, cfg.height
+        x = pop.x.astype(np.int64)
+        y = pop.y.astype(np.int64)
+
+        # Any blocked 4-neighbour move means contact
+        blocked = (x == 0) | (x == w - 1) | (y == 0) | (y == h - 1)
+        if state.wall_count:
+            if state.wall_x.size:
+                blocked |= (x < w - 1) & state.wall_x[y, np.minimum(x, w - 2)]
+                blocked |= (x > 0) & state.wall_x[y, np.maximum(x - 1, 0)]
+            if state.wall_y.size:
+                blocked |= (y < h - 1) & state.wall_y[np.minimum(y, h - 2), x]
+                blocked |= (y > 0) & state.wall_y[np.maximum(y - 1, 0), x]
+
+        occ = pop.occupancy
+        ax, ay = state.agent.x, state.agent.y
+        for ox, oy in ((1, 0), (-1, 0), (0, 1), (0, -1)):
+            qx, qy = x + ox, y + oy
+            inside = (qx >= 0) & (qx < w) & (qy >= 0) & (qy < h)
+            hit = np.zeros(x.shape[0], dtype=bool)
+            hit[inside] = occ[qy[inside], qx[inside]] >= 0
+            blocked |= hit | ((qx == ax) & (qy == ay))
+
+        pop.contact[:] = blocked
+        temp = state.world_map.temperature[y, x]
+        pop.thermal[:] = np.where(blocked, cfg.contact_temp_gain * temp, 0.0)
+        pop.pain[:] = np.where(pop.effort <= 0.0, 1.0, 0.0)
+
+    # --------------------------------------------------------
+    # Body state derived from position / effort
+    # --------------------------------------------------------
+
+    def update_body(self) -> None:
+        """
+        Recompute contact, thermal and pain for the agent's
+        current position and effort.
+        """
+        agent = self.state.agent
+
         # ----------------------------------------------------
         # Contact update (continuous wall detection)
         # ----------------------------------------------------
@@ -112,5 +442,3 @@ class WorldPhysics:
             agent.pain = 1.0
         else:
             agent.pain = 0.0
-
-        return events
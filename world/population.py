@@ -0,0 +1,326 @@
+# world/population.py
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+
+# ============================================================
+# AGENT POPULATION (Pure physics, struct-of-arrays)
+#
+# Many bodies in one town.
+#
+# - One array per body property (x, y, effort, contact, thermal, pain)
+# - Dense occupancy grid: bodies are dynamic obstacles
+# - Uniform-grid spatial hash for neighbour / contact queries
+#
+# No minds. No identity. No semantics. Just bodies in space.
+# ============================================================
+
+EMPTY = -1
+
+
+@dataclass(frozen=True)
+class BodyView:
+    """
+    Read-only copy of one population body (UI / debugging).
+    """
+    index: int
+    x: int
+    y: int
+    effort: float
+    contact: bool
+    thermal: float
+    pain: float
+
+
+class SpatialHash:
+    """
+    Uniform-grid spatial hash over body positions.
+
+    Bodies are bucketed by (x // bucket, y // bucket) and stored
+    sorted by bucket id, so every bucket is one contiguous slice.
+    Rebuilt in one vectorized pass after bodies move.
+    """
+
+    def __init__(self, width: int, height: int, *, bucket: int = 8) -> None:
+        if bucket <= 0:
+            raise ValueError("bucket must be positive")
+        self.bucket = int(bucket)
+        self.nbx = (width + bucket - 1) // bucket
+        self.nby = (height + bucket - 1) // bucket
+
+        self.order = np.empty(0, dtype=np.int64)      # body indices, bucket-sorted
+        self.starts = np.zeros(self.nbx * self.nby + 1, dtype=np.int64)
+
+    def _bucket_of(self, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        return (y // self.bucket) * self.nbx + (x // self.bucket)
+
+    def rebuild(self, x: np.ndarray, y: np.ndarray) -> None:
+        b = self._bucket_of(x.astype(np.int64), y.astype(np.int64))
+        self.order = np.argsort(b, kind="stable")
+        counts = np.bincount(b, minlength=self.nbx * self.nby)
+        self.starts[0] = 0
+        np.cumsum(counts, out=self.starts[1:])
+
+    def query_box(self, x0: int, y0: int, x1: int, y1: int) -> np.ndarray:
+        """
+        Body indices in buckets overlapping [x0, x1] x [y0, y1] (inclusive).
+        Candidates only; callers filter by exact distance.
+        """
+        bx0 = max(0, x0 // self.bucket)
+        by0 = max(0, y0 // self.bucket)
+        bx1 = min(self.nbx - 1, x1 // self.bucket)
+        by1 = min(self.nby - 1, y1 // self.bucket)
+        if bx0 > bx1 or by0 > by1:
+            return np.empty(0, dtype=np.int64)
+
+        parts = []
+        for by in range(by0, by1 + 1):
+            row = by * self.nbx
+            # buckets in one row are contiguous in sorted order
+            a, b = self.starts[row + bx0], self.starts[row + bx1 + 1]
+            if b > a:
+                parts.append(self.order[a:b])
+        if not parts:
+            return np.empty(0, dtype=np.int64)
+        return np.concatenate(parts)
+
+    def candidate_pairs(self, x: np.ndarray, y: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        All (i, j), i < j, whose buckets are equal or adjacent.
+        """
+        n = x.shape[0]
+        if n == 0:
+            empty = np.empty(0, dtype=np.int64)
+            return empty, empty
+
+        bx = x.astype(np.int64) // self.bucket
+        by = y.astype(np.int64) // self.bucket
+        idx = np.arange(n)
+
+        left, right = [], []
+        for ox in (-1, 0, 1):
+            for oy in (-1, 0, 1):
+                nbx, nby = bx + ox, by + oy
+                ok = (nbx >= 0) & (nbx < self.nbx) & (nby >= 0) & (nby < self.nby)
+                nb = nby[ok] * self.nbx + nbx[ok]
+                a, b = self.starts[nb], self.starts[nb + 1]
+                counts = b - a
+                total = int(counts.sum())
+                if total == 0:
+                    continue
+                # Expand each [a, b) range without a Python loop
+                owner = np.repeat(idx[ok], counts)
+                base = np.repeat(a - np.cumsum(counts) + counts, counts)
+                other = self.order[base + np.arange(total)]
+                keep = owner < other
+                left.append(owner[keep])
+                right.append(other[keep])
+
+        if not left:
+            empty = np.empty(0, dtype=np.int64)
+            return empty, empty
+        return np.concatenate(left), np.concatenate(right)
+
+
+class AgentPopulation:
+    """
+    Struct-of-arrays store for many agent bodies.
+
+    Arrays are exposed as views of length `n`; indices are stable
+    (bodies are never removed).
+
+    `reserved`, if given, returns a cell no body may spawn on
+    (the primary agent's position).
+    """
+
+    def __init__(
+        self,
+        width: int,
+        height: int,
+        *,
+        capacity: int = 64,
+        bucket: int = 8,
+        reserved: Optional[Callable[[], Tuple[int, int]]] = None,
+    ) -> None:
+        self.width = int(width)
+        self.height = int(height)
+        self.n = 0
+        self.reserved = reserved
+
+        cap = max(1, int(capacity))
+        self._x = np.zeros(cap, dtype=np.int32)
+        self._y = np.zeros(cap, dtype=np.int32)
+        self._effort = np.zeros(cap, dtype=np.float64)
+        self._contact = np.zeros(cap, dtype=bool)
+        self._thermal = np.zeros(cap, dtype=np.float64)
+        self._pain = np.zeros(cap, dtype=np.float64)
+
+        # occupancy[y, x] = body index or EMPTY
+        self.occupancy = np.full((self.height, self.width), EMPTY, dtype=np.int32)
+        self.hash = SpatialHash(self.width, self.height, bucket=bucket)
+
+    # --------------------------------------------------------
+    # Array views
+    # --------------------------------------------------------
+
+    @property
+    def x(self) -> np.ndarray:
+        return self._x[:self.n]
+
+    @property
+    def y(self) -> np.ndarray:
+        return self._y[:self.n]
+
+    @property
+    def effort(self) -> np.ndarray:
+        return self._effort[:self.n]
+
+    @property
+    def contact(self) -> np.ndarray:
+        return self._contact[:self.n]
+
+    @property
+    def thermal(self) -> np.ndarray:
+        return self._thermal[:self.n]
+
+    @property
+    def pain(self) -> np.ndarray:
+        return self._pain[:self.n]
+
+    def __len__(self) -> int:
+        return self.n
+
+    # --------------------------------------------------------
+    # Spawning
+    # --------------------------------------------------------
+
+    def _grow(self, need: int) -> None:
+        cap = self._x.shape[0]
+        if need <= cap:
+            return
+        while cap < need:
+            cap *= 2
+        for name in ("_x", "_y", "_effort", "_contact", "_thermal", "_pain"):
+            old = getattr(self, name)
+            new = np.zeros(cap, dtype=old.dtype)
+            new[:self.n] = old[:self.n]
+            setattr(self, name, new)
+
+    def add(self, x: int, y: int, *, effort: float = 1.0) -> int:
+        return int(self.add_many([(x, y)], effort=effort)[0])
+
+    def add_many(
+        self,
+        positions: Union[Sequence[Tuple[int, int]], np.ndarray],
+        *,
+        effort: float = 1.0,
+    ) -> np.ndarray:
+        """
+        Spawn bodies at free in-bounds cells. Returns their indices.
+        """
+        p = np.asarray(positions, dtype=np.int64).reshape(-1, 2)
+        px, py = p[:, 0], p[:, 1]
+        k = p.shape[0]
+
+        if np.any((px < 0) | (px >= self.width) | (py < 0) | (py >= self.height)):
+            raise ValueError("spawn position out of bounds")
+        if np.any(self.occupancy[py, px] != EMPTY):
+            raise ValueError("spawn position already occupied")
+        if self.reserved is not None:
+            rx, ry = self.reserved()
+            if np.any((px == rx) & (py == ry)):
+                raise ValueError("spawn position occupied by the agent")
+        flat = py * self.width + px
+        if np.unique(flat).shape[0] != k:
+            raise ValueError("duplicate spawn positions")
+
+        start = self.n
+        self._grow(start + k)
+        idx = np.arange(start, start + k)
+
+        self._x[idx] = px
+        self._y[idx] = py
+        self._effort[idx] = effort
+        self._contact[idx] = False
+        self._thermal[idx] = 0.0
+        self._pain[idx] = 0.0
+        self.occupancy[py, px] = idx
+        self.n = start + k
+
+        self.rebuild_hash()
+        return idx
+
+    # --------------------------------------------------------
+    # Queries
+    # --------------------------------------------------------
+
+    def occupied(self, x: int, y: int) -> bool:
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return False
+        return bool(self.occupancy[y, x] != EMPTY)
+
+    def body_at(self, x: int, y: int) -> Optional[int]:
+        if not self.occupied(x, y):
+            return None
+        return int(self.occupancy[y, x])
+
+    def body(self, i: int) -> BodyView:
+        return BodyView(
+            index=i,
+            x=int(self._x[i]),
+            y=int(self._y[i]),
+            effort=float(self._effort[i]),
+            contact=bool(self._contact[i]),
+            thermal=float(self._thermal[i]),
+            pain=float(self._pain[i]),
+        )
+
+    def rebuild_hash(self) -> None:
+        self.hash.rebuild(self.x, self.y)
+
+    def neighbors(self, x: int, y: int, radius: int) -> np.ndarray:
+        """
+        Bodies within Manhattan distance `radius` of (x, y).
+        """
+        cand = self.hash.query_box(x - radius, y - radius, x + radius, y + radius)
+        if cand.size == 0:
+            return cand
+        d = np.abs(self._x[cand] - x) + np.abs(self._y[cand] - y)
+        return np.sort(cand[d <= radius])
+
+    def pairs_within(self, radius: int) -> np.ndarray:
+        """
+        (M, 2) body index pairs, i < j, within Manhattan `radius`.
+        radius must not exceed the hash bucket size.
+        """
+        if radius > self.hash.bucket:
+            raise ValueError("radius larger than spatial hash bucket")
+        i, j = self.hash.candidate_pairs(self.x, self.y)
+        d = np.abs(self._x[i] - self._x[j]) + np.abs(self._y[i] - self._y[j])
+        keep = d <= radius
+        return np.stack((i[keep], j[keep]), axis=1)
+
+    def contacts(self) -> np.ndarray:
+        """
+        Body–body contact pairs (4-adjacent bodies).
+        """
+        return self.pairs_within(1)
+
+    # --------------------------------------------------------
+    # Snapshot (UI / debugging only)
+    # --------------------------------------------------------
+
+    def snapshot(self) -> Dict[str, float]:
+        if self.n == 0:
+            return {"bodies": 0}
+        return {
+            "bodies": self.n,
+            "mean_effort": float(self.effort.mean()),
+            "in_contact": int(self.contact.sum()),
+            "in_pain": int((self.pain > 0.0).sum()),
+        }
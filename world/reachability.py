@@ -0,0 +1,268 @@
+# world/reachability.py
+
+from __future__ import annotations
+
+import heapq
+from collections import OrderedDict
+from typing import List, Sequence, Tuple, Union
+
+import numpy as np
+
+from world.world_state import WorldState
+
+
+# ============================================================
+# REACHABILITY (Phase 0 spatial service)
+#
+# Shortest-path distance fields over the wall graph.
+#
+# - Unit-cost 4-neighbour moves (BFS)
+# - World boundary and wall edges block movement
+# - Fields cached per source, repaired when a wall is added
+#
+# Pure geometry. No agents. No physics. No memory.
+# ============================================================
+
+Pos = Tuple[int, int]
+
+UNREACHABLE = -1
+
+
+class Reachability:
+    """
+    Cached distance fields for the grid world.
+
+    distance_field(source)[y, x] is the number of unit moves from
+    source to (x, y), or UNREACHABLE.
+    """
+
+    def __init__(self, state: WorldState, *, max_cached: int = 64) -> None:
+        self.state = state
+        self.max_cached = int(max_cached)
+
+        w, h = state.cfg.width, state.cfg.height
+        self._w = w
+        self._n = w * h
+
+        # Flat "may step in this direction" masks, one per direction
+        self._open_r = np.zeros(self._n, dtype=bool)
+        self._open_l = np.zeros(self._n, dtype=bool)
+        self._open_d = np.zeros(self._n, dtype=bool)
+        self._open_u = np.zeros(self._n, dtype=bool)
+        self._build_open_masks()
+
+        self._fields: "OrderedDict[int, np.ndarray]" = OrderedDict()
+
+        state.on_wall_added(self._on_wall_added)
+
+    # --------------------------------------------------------
+    # Public API
+    # --------------------------------------------------------
+
+    def distance_field(self, source: Pos) -> np.ndarray:
+        """
+        (height, width) int32 distances from source. Read-only.
+        """
+        view = self._field(source).reshape(self.state.cfg.height, self._w)
+        view.flags.writeable = False
+        return view
+
+    def distance(self, source: Pos, target: Pos) -> int:
+        if not self.state.in_bounds(*target):
+            return UNREACHABLE
+        return int(self._field(source)[self._flat(target)])
+
+    def distances(
+        self,
+        source: Pos,
+        targets: Union[Sequence[Pos], np.ndarray],
+    ) -> np.ndarray:
+        """
+        Batch lookup: distances to many (x, y) targets at once.
+        Out-of-bounds targets are UNREACHABLE.
+        """
+        t = np.asarray(targets, dtype=np.int64).reshape(-1, 2)
+        x, y = t[:, 0], t[:, 1]
+        inside = (x >= 0) & (x < self._w) & (y >= 0) & (y < self.state.cfg.height)
+
+        out = np.full(t.shape[0], UNREACHABLE, dtype=np.int32)
+        out[inside] = self._field(source)[y[inside] * self._w + x[inside]]
+        return out
+
+    def is_reachable(self, source: Pos, target: Pos) -> bool:
+        return self.distance(source, target) != UNREACHABLE
+
+    def reachable_mask(self, source: Pos) -> np.ndarray:
+        return self.distance_field(source) != UNREACHABLE
+
+    def invalidate(self, source: Pos | None = None) -> None:
+        if source is None:
+            self._fields.clear()
+        else:
+            self._fields.pop(self._flat(source), None)
+
+    # --------------------------------------------------------
+    # Cache
+    # --------------------------------------------------------
+
+    def _flat(self, p: Pos) -> int:
+        return p[1] * self._w + p[0]
+
+    def _field(self, source: Pos) -> np.ndarray:
+        if not self.state.in_bounds(*source):
+            raise ValueError(f"source out of bounds: {source}")
+
+        key = self._flat(source)
+        dist = self._fields.get(key)
+        if dist is not None:
+            self._fields.move_to_end(key)
+            return dist
+
+        dist = self._bfs(key)
+        self._fields[key] = dist
+        if len(self._fields) > self.max_cached:
+            self._fields.popitem(last=False)
+        return dist
+
+    # --------------------------------------------------------
+    # Geometry
+    # --------------------------------------------------------
+
+    def _build_open_masks(self) -> None:
+        h, w = self.state.cfg.height, self._w
+
+        r = np.zeros((h, w), dtype=bool)
+        d = np.zeros((h, w), dtype=bool)
+        r[:, :-1] = ~self.state.wall_x
+        d[:-1, :] = ~self.state.wall_y
+
+        self._open_r[:] = r.ravel()
+        self._open_d[:] = d.ravel()
+        # Stepping left from i is stepping right from i - 1
+        self._open_l[1:] = self._open_r[:-1]
+        self._open_l[::w] = False
+        # Stepping up from i is stepping down from i - w
+        self._open_u[w:] = self._open_d[:-w]
+
+    def _neighbors(self, i: int) -> List[int]:
+        w = self._w
+        out: List[int] = []
+        if self._open_r[i]:
+            out.append(i + 1)
+        if self._open_l[i]:
+            out.append(i - 1)
+        if self._open_d[i]:
+            out.append(i + w)
+        if self._open_u[i]:
+            out.append(i - w)
+        return out
+
+    def _bfs(self, source: int) -> np.ndarray:
+        """
+        Level-synchronous BFS over flat indices; one vector step per ring.
+        """
+        w = self._w
+        dist = np.full(self._n, UNREACHABLE, dtype=np.int32)
+        dist[source] = 0
+
+        # Dedupe scratch: last writer wins, survivors are unique
+        owner = np.empty(self._n, dtype=np.int64)
+
+        frontier = np.array([source], dtype=np.int64)
+        level = 0
+        while frontier.size:
+            level += 1
+            cand = np.concatenate((
+                frontier[self._open_r[frontier]] + 1,
+                frontier[self._open_l[frontier]] - 1,
+                frontier[self._open_d[frontier]] + w,
+                frontier[self._open_u[frontier]] - w,
+            ))
+            cand = cand[dist[cand] == UNREACHABLE]
+            slot = np.arange(cand.shape[0])
+            owner[cand] = slot
+            cand = cand[owner[cand] == slot]
+            dist[cand] = level
+            frontier = cand
+        return dist
+
+    # --------------------------------------------------------
+    # Incremental repair
+    # --------------------------------------------------------
+
+    def _on_wall_added(self, a: Pos, b: Pos) -> None:
+        if not (self.state.in_bounds(*a) and self.state.in_bounds(*b)):
+            return
+        ia, ib = self._flat(a), self._flat(b)
+        step = (b[0] - a[0], b[1] - a[1])
+
+        if step == (1, 0):
+            self._open_r[ia] = self._open_l[ib] = False
+        elif step == (-1, 0):
+            self._open_l[ia] = self._open_r[ib] = False
+        elif step == (0, 1):
+            self._open_d[ia] = self._open_u[ib] = False
+        elif step == (0, -1):
+            self._open_u[ia] = self._open_d[ib] = False
+        else:
+            return  # not a grid edge; cannot affect movement
+
+        for dist in self._fields.values():
+            self._repair(dist, ia, ib)
+
+    def _repair(self, dist: np.ndarray, ia: int, ib: int) -> None:
+        """
+        Adding a wall only lengthens paths. Only cells whose every
+        shortest path used the cut edge can change; find them, then
+        re-settle just those from their intact neighbours.
+        """
+        da, db = int(dist[ia]), int(dist[ib])
+        if da == UNREACHABLE or da == db:
+            return  # edge was on no shortest path
+        child = ib if db > da else ia
+
+        def supported(v: int, lost: set) -> bool:
+            dv = int(dist[v])
+            for u in self._neighbors(v):
+                if u not in lost and int(dist[u]) == dv - 1:
+                    return True
+            return False
+
+        lost: set = set()
+        if supported(child, lost):
+            return
+
+        # Collect the orphaned subtree in distance order
+        lost.add(child)
+        order = [child]
+        k = 0
+        while k < len(order):
+            v = order[k]
+            k += 1
+            dv = int(dist[v])
+            for c in self._neighbors(v):
+                if c not in lost and int(dist[c]) == dv + 1 and not supported(c, lost):
+                    lost.add(c)
+                    order.append(c)
+
+        # Seed from intact neighbours, then settle the orphans
+        heap: List[Tuple[int, int]] = []
+        for v in order:
+            best = UNREACHABLE
+            for u in self._neighbors(v):
+                if u not in lost and dist[u] != UNREACHABLE:
+                    du = int(dist[u]) + 1
+                    if best == UNREACHABLE or du < best:
+                        best = du
+            dist[v] = UNREACHABLE
+            if best != UNREACHABLE:
+                heapq.heappush(heap, (best, v))
+
+        while heap:
+            dv, v = heapq.heappop(heap)
+            if dist[v] != UNREACHABLE and dist[v] <= dv:
+                continue
+            dist[v] = dv
+            for c in self._neighbors(v):
+                if c in lost and (dist[c] == UNREACHABLE or dist[c] > dv + 1):
+                    heapq.heappush(heap, (dv + 1, c))
@@ -1,10 +1,59 @@
-from typing import List
+from typing import Dict, List
+
+import numpy as np
+
 from world.world_state import WorldEventType, WorldState, WorldEvent
 
 
+# Environment field -> raw sensory modality
+RECEPTIVE_MODALITIES: Dict[str, str] = {
+    "light": "vision",
+    "noise": "sound",
+    "temperature": "temperature",
+}
+
+
 class SensorSuite:
-    def __init__(self, state: WorldState):
+    def __init__(self, state: WorldState, receptive_field: int = 1):
+        """
+        receptive_field: side length k of the k x k patch sampled
+        around the agent (odd; 1 = the cell under the agent).
+        """
+        if receptive_field < 1 or receptive_field % 2 == 0:
+            raise ValueError("receptive_field must be a positive odd integer")
         self.state = state
+        self.receptive_field = receptive_field
+
+    # --------------------------------------------------------
+    # Receptive field (zero-copy)
+    # --------------------------------------------------------
+
+    def patches(self) -> Dict[str, np.ndarray]:
+        """
+        k x k views of each environment field centred on the agent.
+
+        Plain slices: strided views into the WorldMap arrays, never
+        copies. Clipped at the world boundary (edge patches are smaller).
+        """
+        agent = self.state.agent
+        r = self.receptive_field // 2
+        y0, y1 = max(0, agent.y - r), agent.y + r + 1
+        x0, x1 = max(0, agent.x - r), agent.x + r + 1
+
+        fields = self.state.world_map.fields
+        return {
+            name: fields[name][y0:y1, x0:x1]
+            for name in RECEPTIVE_MODALITIES
+        }
+
+    def receptive_flux(self) -> Dict[str, float]:
+        """
+        Mean level per modality over the receptive field.
+        """
+        out: Dict[str, float] = {}
+        for name, view in self.patches().items():
+            out[RECEPTIVE_MODALITIES[name]] = float(view.mean()) if view.size else 0.0
+        return out
 
     def sense(self) -> List[WorldEvent]:
         events: List[WorldEvent] = []
@@ -69,11 +69,14 @@ class GridSpace:
         A move is blocked if:
         - destination is out of bounds (world boundary is a hard wall)
         - OR an explicit wall exists between a and b
+        - OR another body stands on b
         """
         if not self.in_bounds(b):
             return True
         if self.state.has_wall_between(a, b):
             return True
+        if self.state.occupied(b[0], b[1]):
+            return True
         return False
 
     # --------------------------------------------------------
@@ -141,6 +144,8 @@ class GridSpace:
         if self.is_blocked_move(p, nxt):
             if not self.in_bounds(nxt):
                 return (False, p, "blocked_by_boundary")
-            return (False, p, "blocked_by_wall")
+            if self.state.has_wall_between(p, nxt):
+                return (False, p, "blocked_by_wall")
+            return (False, p, "blocked_by_body")
 
         return (True, nxt, None)
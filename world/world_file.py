@@ -0,0 +1,215 @@
+# world/world_file.py
+
+from __future__ import annotations
+
+import json
+import struct
+from dataclasses import asdict, fields
+from pathlib import Path
+from typing import Any, Dict, List, Tuple, Union
+
+import numpy as np
+
+from world.layouts.map.world_map import FIELD_NAMES, WorldMap
+from world.layouts.town.profile import TownProfile
+from world.world_state import AgentBody, WorldConfig, WorldState, make_default_world
+
+
+# ============================================================
+# WORLD FILE (Versioned, memory-mapped)
+#
+# Layout:
+#   8 bytes   magic  b"A7DOWRLD"
+#   u32       format version
+#   u32       header length (bytes)
+#   ...       UTF-8 JSON header (config, town, spawn, off-grid walls,
+#             array table)
+#   ...       arrays, each 64-byte aligned, C order
+#
+# Arrays: wall_x, wall_y (bool), temperature / noise / light (float32)
+# Walls the arrays cannot hold (non-adjacent or out-of-bounds edges)
+# are listed in the header and restored into `walls`.
+#
+# Loading maps the arrays straight from the file (np.memmap):
+# opening is O(1), pages fault in lazily, and every process that
+# opens the same file shares them through the OS page cache.
+# The file itself is never written by a loaded world.
+# ============================================================
+
+MAGIC = b"A7DOWRLD"
+FORMAT_VERSION = 1
+ALIGN = 64
+
+_PREAMBLE = struct.Struct("<8sII")
+
+PathLike = Union[str, Path]
+
+
+def _align(n: int) -> int:
+    return (n + ALIGN - 1) // ALIGN * ALIGN
+
+
+def _arrays_of(state: WorldState) -> Dict[str, np.ndarray]:
+    arrays = {
+        "wall_x": state.wall_x,
+        "wall_y": state.wall_y,
+    }
+    for name in FIELD_NAMES:
+        arrays[name] = state.world_map.field(name)
+    return arrays
+
+
+def _off_grid_walls(state: WorldState) -> List[List[List[int]]]:
+    """
+    Edges of `state.walls` that are not mirrored in wall_x / wall_y.
+    """
+    out = []
+    for a, b in sorted(state.walls):
+        (ax, ay), (bx, by) = min(a, b), max(a, b)
+        if state.in_bounds(ax, ay) and state.in_bounds(bx, by):
+            if ay == by and bx == ax + 1 and state.wall_x[ay, ax]:
+                continue
+            if ax == bx and by == ay + 1 and state.wall_y[ay, ax]:
+                continue
+        out.append([list(a), list(b)])
+    return out
+
+
+# ------------------------------------------------------------
+# SAVE (converter from in-code worlds)
+# ------------------------------------------------------------
+
+def save_world(state: WorldState, path: PathLike) -> None:
+    """
+    Write a world (geometry + environment) to `path`.
+
+    Agents, events and populations are not part of the world file.
+    """
+    arrays = {k: np.ascontiguousarray(v) for k, v in _arrays_of(state).items()}
+
+    table: Dict[str, Dict[str, Any]] = {}
+    header: Dict[str, Any] = {
+        "config": asdict(state.cfg),
+        "town": asdict(state.world_map.town),
+        "spawn": [state.agent.x, state.agent.y],
+        "wall_count": state.wall_count,
+        "walls": _off_grid_walls(state),
+        "arrays": table,
+    }
+
+    # Offsets depend on header length and vice versa: lay out,
+    # serialize, and retry with more room until the header fits.
+    start = _align(_PREAMBLE.size + len(json.dumps(header)))
+    while True:
+        offset = start
+        for name, arr in arrays.items():
+            table[name] = {
+                "offset": offset,
+                "dtype": arr.dtype.str,
+                "shape": list(arr.shape),
+            }
+            offset = _align(offset + arr.nbytes)
+        blob = json.dumps(header).encode("utf-8")
+        if _PREAMBLE.size + len(blob) <= start:
+            break
+        start = _align(_PREAMBLE.size + len(blob))
+
+    with open(path, "wb") as f:
+        f.write(_PREAMBLE.pack(MAGIC, FORMAT_VERSION, len(blob)))
+        f.write(blob)
+        for name, arr in arrays.items():
+            f.seek(table[name]["offset"])
+            arr.tofile(f)
+        f.truncate(offset)
+
+
+def convert_default_world(path: PathLike, **kwargs: Any) -> None:
+    """
+    Save make_default_world(**kwargs) as a world file.
+    """
+    save_world(make_default_world(**kwargs), path)
+
+
+# ------------------------------------------------------------
+# LOAD
+# ------------------------------------------------------------
+
+def read_header(path: PathLike) -> Dict[str, Any]:
+    with open(path, "rb") as f:
+        preamble = f.read(_PREAMBLE.size)
+        if len(preamble) < _PREAMBLE.size:
+            raise ValueError(f"not a world file: {path}")
+        magic, version, length = _PREAMBLE.unpack(preamble)
+        if magic != MAGIC:
+            raise ValueError(f"not a world file: {path}")
+        if version != FORMAT_VERSION:
+            raise ValueError(
+                f"unsupported world file version {version} "
+                f"(expected {FORMAT_VERSION})"
+            )
+        return json.loads(f.read(length).decode("utf-8"))
+
+
+def load_world(path: PathLike, *, mode: str = "c") -> WorldState:
+    """
+    Open a world file without reading its arrays.
+
+    mode:
+      "r" — strictly read-only arrays (writes raise)
+      "c" — copy-on-write: the world may change (walls, field
+            dynamics) but touched pages become private; the file
+            and other processes are unaffected
+    """
+    if mode not in ("r", "c"):
+        raise ValueError("mode must be 'r' or 'c'")
+
+    header = read_header(path)
+
+    known = {f.name for f in fields(WorldConfig)}
+    cfg = WorldConfig(**{k: v for k, v in header["config"].items() if k in known})
+    town = TownProfile(**header["town"])
+
+    maps: Dict[str, np.ndarray] = {}
+    for name, spec in header["arrays"].items():
+        shape: Tuple[int, ...] = tuple(spec["shape"])
+        if 0 in shape:
+            maps[name] = np.zeros(shape, dtype=np.dtype(spec["dtype"]))
+            continue
+        maps[name] = np.memmap(
+            path,
+            dtype=np.dtype(spec["dtype"]),
+            mode=mode,
+            offset=spec["offset"],
+            shape=shape,
+        )
+
+    world_map = WorldMap(
+        width=cfg.width,
+        height=cfg.height,
+        town=town,
+        fields={name: maps[name] for name in FIELD_NAMES},
+    )
+
+    sx, sy = header["spawn"]
+    state = WorldState(
+        cfg=cfg,
+        agent=AgentBody(x=sx, y=sy),
+        world_map=world_map,
+    )
+    state.wall_x = maps["wall_x"]
+    state.wall_y = maps["wall_y"]
+    state.wall_count = int(header["wall_count"])
+    state.walls = {(tuple(a), tuple(b)) for a, b in header.get("walls", [])}
+    return state
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Write the default world to a world file.")
+    parser.add_argument("path")
+    parser.add_argument("--width", type=int, default=11)
+    parser.add_argument("--height", type=int, default=11)
+    args = parser.parse_args()
+
+    convert_default_world(args.path, width=args.width, height=args.height)
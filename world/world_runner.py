@@ -1,6 +1,10 @@
 from typing import List, Optional, Tuple
 
+import numpy as np
+
 from world.world_state import WorldState, WorldEventType
+from world.field_dynamics import FieldDynamics
+from world.physics import WorldPhysics
 
 
 class WorldRunner:
@@ -9,12 +13,34 @@ class WorldRunner:
     Deterministic. One step per external tick.
     """
 
-    def __init__(self, world: WorldState):
+    def __init__(
+        self,
+        world: WorldState,
+        dynamics: Optional[FieldDynamics] = None,
+    ):
         self.world = world
-
-    def step(self, action: Optional[Tuple[int, int]] = None) -> List:
+        self.dynamics = dynamics
+        self.physics = WorldPhysics(world)
+
+    def step(
+        self,
+        action: Optional[Tuple[int, int]] = None,
+        body_moves: Optional[np.ndarray] = None,
+    ) -> List:
+        """
+        Advance one tick. `body_moves` is an (n, 2) int array of
+        per-body (dx, dy) for the world's population, in index order.
+        """
         events = []
 
+        # Environment evolves first (optional stage)
+        if self.dynamics is not None:
+            self.dynamics.step()
+
+        # Population bodies advance together (optional)
+        if body_moves is not None:
+            self.physics.step_population(body_moves)
+
         agent = self.world.agent
         cfg = self.world.cfg
 
@@ -58,6 +84,20 @@ class WorldRunner:
             )
             return events
 
+        # Other bodies (dynamic obstacles)
+        if self.world.occupied(nx, ny):
+            agent.effort -= cfg.block_cost
+            agent.contact = True
+            agent.contact_normals.append((dx, dy))
+            events.append(
+                self.world.emit(
+                    WorldEventType.OUTCOME,
+                    "blocked_by_body",
+                    {"dx": dx, "dy": dy},
+                )
+            )
+            return events
+
         # Move
         agent.x = nx
         agent.y = ny
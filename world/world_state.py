@@ -2,10 +2,16 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
+
+import numpy as np
 
 from world.layouts.map.world_map import WorldMap
 
+if TYPE_CHECKING:
+    from world.event_log import WorldEventLog
+    from world.population import AgentPopulation
+
 
 # ============================================================
 # WORLD EVENTS (Phase 0)
@@ -58,6 +64,11 @@ class WorldConfig:
     block_cost: float = 0.20
 
 
+def _default_event_log() -> "WorldEventLog":
+    from world.event_log import WorldEventLog
+    return WorldEventLog()
+
+
 # ============================================================
 # WORLD STATE (Authoritative)
 # ============================================================
@@ -71,6 +82,33 @@ class WorldState:
     walls: Set[Tuple[Tuple[int, int], Tuple[int, int]]] = field(default_factory=set)
     _event_counter: int = 0
 
+    # Retained, columnar history of every emitted event
+    events: "WorldEventLog" = field(default_factory=_default_event_log, repr=False)
+
+    # Optional additional bodies (struct-of-arrays), see world/population.py
+    population: Optional["AgentPopulation"] = field(default=None, repr=False)
+
+    # Dense mirror of `walls` for vectorized consumers.
+    # wall_x[y, x] blocks (x, y) <-> (x + 1, y)
+    # wall_y[y, x] blocks (x, y) <-> (x, y + 1)
+    wall_x: np.ndarray = field(init=False, repr=False)
+    wall_y: np.ndarray = field(init=False, repr=False)
+    wall_count: int = field(init=False, default=0)
+
+    # Notified with (a, b) after a new wall edge is added
+    _wall_listeners: List[Callable[[Tuple[int, int], Tuple[int, int]], None]] = field(
+        default_factory=list, repr=False
+    )
+
+    def __post_init__(self) -> None:
+        w, h = self.cfg.width, self.cfg.height
+        self.wall_x = np.zeros((h, max(0, w - 1)), dtype=bool)
+        self.wall_y = np.zeros((max(0, h - 1), w), dtype=bool)
+        self.wall_count = 0
+        for a, b in self.walls:
+            if self._mark_wall_edge(a, b):
+                self.wall_count += 1
+
     # --------------------------------------------------------
     # Event system (deterministic)
     # --------------------------------------------------------
@@ -79,6 +117,21 @@ class WorldState:
         self._event_counter += 1
         return f"{prefix}{self._event_counter:08d}"
 
+    def record(
+        self,
+        type: WorldEventType,
+        name: str,
+        payload: Dict[str, Any],
+        parent: int = -1,
+    ) -> int:
+        """
+        Log an event without building a WorldEvent.
+        Returns the integer event id (-1 parent = none).
+        """
+        self._event_counter += 1
+        self.events.append(self._event_counter, type, name, payload, parent)
+        return self._event_counter
+
     def emit(
         self,
         type: WorldEventType,
@@ -86,8 +139,11 @@ class WorldState:
         payload: Dict[str, Any],
         parent_id: Optional[str] = None,
     ) -> WorldEvent:
+        from world.event_log import format_id, parse_id
+
+        n = self.record(type, name, payload, parse_id(parent_id))
         return WorldEvent(
-            event_id=self.next_event_id(),
+            event_id=format_id(n),
             type=type,
             name=name,
             payload=payload,
@@ -101,6 +157,25 @@ class WorldState:
     def in_bounds(self, x: int, y: int) -> bool:
         return 0 <= x < self.cfg.width and 0 <= y < self.cfg.height
 
+    def occupied(self, x: int, y: int) -> bool:
+        """
+        True if a population body stands on (x, y).
+        """
+        return self.population is not None and self.population.occupied(x, y)
+
+    def spawn_population(self, *, capacity: int = 64, bucket: int = 8) -> "AgentPopulation":
+        from world.population import AgentPopulation
+
+        if self.population is None:
+            self.population = AgentPopulation(
+                self.cfg.width,
+                self.cfg.height,
+                capacity=capacity,
+                bucket=bucket,
+                reserved=lambda: (self.agent.x, self.agent.y),
+            )
+        return self.population
+
     @staticmethod
     def _canon_edge(
         a: Tuple[int, int], b: Tuple[int, int]
@@ -110,12 +185,67 @@ class WorldState:
     def has_wall_between(
         self, a: Tuple[int, int], b: Tuple[int, int]
     ) -> bool:
-        return self._canon_edge(a, b) in self.walls
+        # The arrays are the fast path; `walls` stays authoritative for
+        # edges added to the set directly.
+        edge = self._canon_edge(a, b)
+        (ax, ay), (bx, by) = edge
+        if self.in_bounds(ax, ay) and self.in_bounds(bx, by):
+            if ay == by and bx == ax + 1 and self.wall_x[ay, ax]:
+                return True
+            if ax == bx and by == ay + 1 and self.wall_y[ay, ax]:
+                return True
+        return edge in self.walls
 
     def add_wall_between(
         self, a: Tuple[int, int], b: Tuple[int, int]
     ) -> None:
+        if self.has_wall_between(a, b):
+            return
         self.walls.add(self._canon_edge(a, b))
+        if self._mark_wall_edge(a, b):
+            self.wall_count += 1
+        for listener in self._wall_listeners:
+            listener(a, b)
+
+    def wall_edges(self) -> Iterator[Tuple[Tuple[int, int], Tuple[int, int]]]:
+        """
+        Every wall edge, including those only present in the arrays
+        (e.g. worlds loaded from a world file).
+        """
+        seen = set()
+        for y, x in zip(*np.nonzero(self.wall_x)):
+            edge = ((int(x), int(y)), (int(x) + 1, int(y)))
+            seen.add(edge)
+            yield edge
+        for y, x in zip(*np.nonzero(self.wall_y)):
+            edge = ((int(x), int(y)), (int(x), int(y) + 1))
+            seen.add(edge)
+            yield edge
+        for edge in self.walls:
+            if edge not in seen:
+                yield edge
+
+    def on_wall_added(
+        self, listener: Callable[[Tuple[int, int], Tuple[int, int]], None]
+    ) -> None:
+        self._wall_listeners.append(listener)
+
+    def _mark_wall_edge(
+        self, a: Tuple[int, int], b: Tuple[int, int]
+    ) -> bool:
+        """
+        Mirror a wall into the edge arrays. False if it is not a grid edge.
+        """
+        (ax, ay), (bx, by) = self._canon_edge(a, b)
+        if not (self.in_bounds(ax, ay) and self.in_bounds(bx, by)):
+            return False
+        if ay == by and bx == ax + 1:
+            self.wall_x[ay, ax] = True
+            return True
+        if ax == bx and by == ay + 1:
+            self.wall_y[ay, ax] = True
+            return True
+        return False
 
     # --------------------------------------------------------
     # Environment
@@ -140,6 +270,9 @@ class WorldState:
                 "pain": self.agent.pain,
             },
             "event_counter": self._event_counter,
+            "population": (
+                self.population.snapshot() if self.population is not None else None
+            ),
         }
 
 